@@ -21,6 +21,7 @@ from .bruheffect import (
     GameOfLifeEffect,
     GameOfLifeSettings,
     JuliaEffect,
+    JuliaSettings,
     Line,
     MatrixEffect,
     MatrixSettings,
@@ -159,6 +160,7 @@ __all__ = [
     "GameOfLifeEffect",
     "GameOfLifeSettings",
     "JuliaEffect",
+    "JuliaSettings",
     "Line",
     "MatrixEffect",
     "MatrixSettings",
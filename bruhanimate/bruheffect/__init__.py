@@ -25,6 +25,7 @@ from .settings import (
     FireSettings,
     FireworkSettings,
     GameOfLifeSettings,
+    JuliaSettings,
     MatrixSettings,
     NoiseSettings,
     OffsetSettings,
@@ -67,6 +68,7 @@ __all__ = [
     "GameOfLifeEffect",
     "GameOfLifeSettings",
     "JuliaEffect",
+    "JuliaSettings",
     "Line",
     "MatrixEffect",
     "MatrixSettings",
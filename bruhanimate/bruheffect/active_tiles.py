@@ -0,0 +1,151 @@
+"""
+Copyright 2023 Ethan Christensen
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import numpy as np
+
+DEFAULT_TILE_SIZE = 8
+
+
+class ActiveTiles:
+    """
+    Bitmap of the tiles of a grid that may change in the next step.
+
+    A cell whose own state and neighbors didn't change can't change either,
+    so after a step only the tiles that changed, plus the tiles around them,
+    need to be processed again.
+    """
+
+    def __init__(self, height: int, width: int, tile_size: int = DEFAULT_TILE_SIZE):
+        """
+        Initializes the bitmap with every tile active.
+
+        Args:
+            height (int): Height of the grid in cells.
+            width (int): Width of the grid in cells.
+            tile_size (int, optional): Width and height of a tile in cells. Defaults to 8.
+        """
+        self.height = height
+        self.width = width
+        self.tile_size = tile_size
+        self.shape = (-(-height // tile_size), -(-width // tile_size))
+        self.active = np.ones(self.shape, dtype=bool)
+
+    @property
+    def idle(self) -> bool:
+        """
+        Whether no tile is active, i.e. the grid has settled.
+        """
+        return not self.active.any()
+
+    def mark_all(self):
+        """
+        Activates every tile, e.g. after the whole grid was replaced.
+        """
+        self.active.fill(True)
+
+    def tile_of(self, y: int, x: int) -> tuple[int, int]:
+        """
+        Returns the (row, column) of the tile holding a cell.
+        """
+        return y // self.tile_size, x // self.tile_size
+
+    def bounds(self, tile_row: int, first: int, last: int) -> tuple[int, int, int, int]:
+        """
+        Returns the cell bounds (y0, y1, x0, x1) of a run of tiles in a row.
+
+        Args:
+            tile_row (int): The row of tiles.
+            first (int): The first tile column in the run.
+            last (int): The last tile column in the run (inclusive).
+        """
+        size = self.tile_size
+        return (
+            tile_row * size,
+            min(self.height, (tile_row + 1) * size),
+            first * size,
+            min(self.width, (last + 1) * size),
+        )
+
+    def runs(self, tile_row: int) -> list[tuple[int, int]]:
+        """
+        Returns the runs of consecutive active tiles in a row of tiles.
+
+        Args:
+            tile_row (int): The row of tiles.
+
+        Returns:
+            list[tuple[int, int]]: (first, last) tile columns of each run.
+        """
+        row = self.active[tile_row]
+        edges = np.flatnonzero(np.diff(np.concatenate(([False], row, [False]))))
+        return list(zip(edges[::2].tolist(), (edges[1::2] - 1).tolist()))
+
+    def regions(self) -> list[tuple[int, int, int, int]]:
+        """
+        Returns the cell bounds (y0, y1, x0, x1) of every run of active tiles.
+        """
+        return [
+            self.bounds(tile_row, first, last)
+            for tile_row in np.flatnonzero(self.active.any(axis=1)).tolist()
+            for first, last in self.runs(tile_row)
+        ]
+
+    def mark_changed(self, changed: np.ndarray, y0: int, x0: int, diff: np.ndarray):
+        """
+        Flags the tiles covering any changed cell of a region.
+
+        Args:
+            changed (np.ndarray): A boolean array of tiles, shaped like active.
+            y0 (int): Top row of the region, on a tile boundary.
+            x0 (int): Left column of the region, on a tile boundary.
+            diff (np.ndarray): A boolean array of the region's changed cells.
+        """
+        size = self.tile_size
+        per_tile = np.logical_or.reduceat(
+            np.logical_or.reduceat(diff, np.arange(0, diff.shape[0], size), axis=0),
+            np.arange(0, diff.shape[1], size),
+            axis=1,
+        )
+        ty, tx = y0 // size, x0 // size
+        changed[ty : ty + per_tile.shape[0], tx : tx + per_tile.shape[1]] |= per_tile
+
+    def update(self, changed: np.ndarray):
+        """
+        Activates the tiles that changed in the last step and their neighbors,
+        deactivating everything else.
+
+        Args:
+            changed (np.ndarray): A boolean array of tiles, shaped like active.
+        """
+        active = changed.copy()
+        active[1:] |= changed[:-1]
+        active[:-1] |= changed[1:]
+        spread = active.copy()
+        active[:, 1:] |= spread[:, :-1]
+        active[:, :-1] |= spread[:, 1:]
+        self.active = active
+
+    def activate_around(self, y: int, x: int):
+        """
+        Activates the tile holding a cell and its neighbors right away, for
+        changes that can spread within the current step.
+
+        Args:
+            y (int): The cell's row.
+            x (int): The cell's column.
+        """
+        ty, tx = self.tile_of(y, x)
+        self.active[max(0, ty - 1) : ty + 2, max(0, tx - 1) : tx + 2] = True
@@ -25,6 +25,7 @@ from bruhcolor import bruhcolored as bc
 
 from ..bruhutil.bruhffer import Buffer
 from .base_effect import BaseEffect
+from .progressive import ProgressiveField
 from .settings import AudioSettings
 
 _SAMPLE_RATE = 44100
@@ -193,6 +194,13 @@ class AudioEffect(BaseEffect):
         # precompute pixel grids (recomputed lazily if screen size changes)
         self._intf_X: np.ndarray | None = None
         self._intf_Y: np.ndarray | None = None
+        self._progressive = ProgressiveField()
+
+        # radial state — per-cell geometry and glyphs, rebuilt on resize
+        self._radial_key = None
+        self._radial_r: np.ndarray | None = None
+        self._radial_band: np.ndarray | None = None
+        self._radial_glyphs: np.ndarray | None = None
 
         # lightning state
         self._lightning_bolts: list[tuple[list, int]] = []  # (path, frames_remaining)
@@ -582,23 +590,37 @@ class AudioEffect(BaseEffect):
         max_r = min(cx, cy * 2)
         n = len(bars)
 
-        for row in range(self._height):
-            for col in range(self._width):
-                dx = col - cx
-                dy = (row - cy) * 2  # aspect ratio compensation
-                r = (dx * dx + dy * dy) ** 0.5
-                r_norm = min(r / max_r, 1.0)
-                band = int(r_norm * (n - 1))
-                mag = bars[band]
-                if mag > r_norm:
+        # The geometry only depends on the screen size, so it is built once
+        key = (self._height, self._width, n, self.color, self.bar_char)
+        if key != self._radial_key:
+            rows = np.arange(self._height)[:, None]
+            cols = np.arange(self._width)
+            dx = cols - cx
+            dy = (rows - cy) * 2  # aspect ratio compensation
+            r_norm = np.minimum(np.sqrt(dx * dx + dy * dy) / max_r, 1.0)
+            self._radial_r = r_norm
+            self._radial_band = (r_norm * (n - 1)).astype(np.intp)
+            glyphs = np.empty(r_norm.shape, dtype=object)
+            for row in range(self._height):
+                for col in range(self._width):
                     # Color by distance from center (inner = brighter)
-                    color = self._height_color(1.0 - r_norm) if self.color else None
-                    ch = (
-                        bc(self.bar_char, color=color)
+                    color = (
+                        self._height_color(1.0 - r_norm[row, col])
+                        if self.color
+                        else None
+                    )
+                    glyphs[row, col] = (
+                        bc(self.bar_char, color=color).colored
                         if color is not None
                         else self.bar_char
                     )
-                    self.buffer.put_char(col, row, ch)
+            self._radial_glyphs = glyphs
+            self._radial_key = key
+
+        lit = bars[self._radial_band] > self._radial_r
+        self.buffer.put_block(
+            0, 0, np.where(lit, self._radial_glyphs, self.background).tolist()
+        )
 
     def _render_rain(self, audio: np.ndarray):
         """Audio-driven rain with occasional lightning strikes."""
@@ -895,12 +917,6 @@ class AudioEffect(BaseEffect):
 
         self._intf_phase += 0.04 + energy * 0.12
 
-        # Lazily build the pixel coordinate grids
-        if self._intf_X is None or self._intf_X.shape != (self._height, self._width):
-            cols = np.arange(self._width)
-            rows = np.arange(self._height)
-            self._intf_X, self._intf_Y = np.meshgrid(cols, rows)
-
         cx, cy = self._width // 2, self._height // 2
 
         # Source positions oscillate gently around symmetric points
@@ -909,18 +925,30 @@ class AudioEffect(BaseEffect):
         s1x, s1y = cx - ox, cy + oy
         s2x, s2y = cx + ox, cy - oy
 
-        # Aspect-ratio-corrected distances (chars ~2× taller than wide)
-        Yc = self._intf_Y * 2
-        d1 = np.sqrt((self._intf_X - s1x) ** 2 + (Yc - s1y * 2) ** 2)
-        d2 = np.sqrt((self._intf_X - s2x) ** 2 + (Yc - s2y * 2) ** 2)
-
         # Bass band drives frequency, treble drives secondary source freq
         freq1 = 0.28 + float(bars[0]) * 0.35
         freq2 = 0.28 + float(bars[-1]) * 0.35
-        combined = (
-            np.sin(d1 * freq1 - self._intf_phase)
-            + np.sin(d2 * freq2 - self._intf_phase)
-        ) / 2.0
+        phase = self._intf_phase
+
+        def sample(rows, cols):
+            # Aspect-ratio-corrected distances (chars ~2× taller than wide)
+            Yc = rows * 2
+            d1 = np.sqrt((cols - s1x) ** 2 + (Yc - s1y * 2) ** 2)
+            d2 = np.sqrt((cols - s2x) ** 2 + (Yc - s2y * 2) ** 2)
+            return (np.sin(d1 * freq1 - phase) + np.sin(d2 * freq2 - phase)) / 2.0
+
+        shape = (self._height, self._width)
+        if self.frame_budget is None:
+            # Lazily build the pixel coordinate grids
+            if self._intf_X is None or self._intf_X.shape != shape:
+                cols = np.arange(self._width)
+                rows = np.arange(self._height)
+                self._intf_X, self._intf_Y = np.meshgrid(cols, rows)
+            combined = sample(self._intf_Y, self._intf_X)
+        else:
+            # The pattern moves every frame, so refinement starts over
+            self._progressive.reset()
+            combined = self._progressive.render(shape, sample, self.frame_budget)
 
         threshold = 0.45
         lit_y, lit_x = np.where(combined > threshold)
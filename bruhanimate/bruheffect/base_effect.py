@@ -35,9 +35,77 @@ class BaseEffect:
         self.buffer = buffer
         self.background = background
         self.background_length = len(background)
+        self.frame_budget = None
+
+    def set_frame_budget(self, budget: float | None):
+        """
+        Sets how long the effect may spend rendering each frame.
+
+        Effects that support progressive rendering draw a coarse frame first and
+        use the rest of the budget to refine it. Other effects ignore it.
+
+        Args:
+            budget (float | None): Time in seconds, or None to always render
+                frames in full.
+        """
+        self.frame_budget = budget
+
+    def frame_key(self, frame_number):
+        """
+        Returns a key identifying what render_frame(frame_number) would draw.
+
+        Renderers cache composited frames under this key: a frame whose key was
+        seen before is reused instead of rendered, and one whose key matches the
+        previous frame is not redrawn at all. Effects that are periodic or
+        constant override this to return their phase; render_frame must then
+        draw the whole buffer from the effect's state alone.
+
+        Args:
+            frame_number (int): The frame about to be rendered.
+
+        Returns:
+            Hashable | None: The frame's key, or None if it can't be cached.
+        """
+        return None
+
+    def skip_frame(self, frame_number):
+        """
+        Advances the effect's state exactly as render_frame would, without
+        drawing. Called in place of render_frame when a cached frame is reused.
+
+        Args:
+            frame_number (int): The frame being skipped.
+        """
+
+    def frames_until_change(self, frame_number):
+        """
+        Returns how many frames after frame_number the effect next draws
+        something different. Renderers sleep through frames that won't change,
+        so render_frame must neither draw nor change any state on them.
+
+        Args:
+            frame_number (int): The frame that was just rendered.
+
+        Returns:
+            int | float: 1 if the next frame may change (the default), or INF if
+                the effect stays the same until its settings are changed.
+        """
+        return 1
 
     @abstractmethod
     def render_frame(self, frame_number):
         """
         To be defined by each effect.
+
+        Effects may report what they changed so renderers only composite and
+        diff those parts of the screen. Returning nothing means the whole
+        buffer may have changed.
+
+        Args:
+            frame_number (int): The current frame number.
+
+        Returns:
+            None | bool | Iterable: None or True if anything may have changed,
+                False if nothing did, or the changed row indices and
+                (x, y, width, height) rects.
         """
@@ -34,6 +34,9 @@ def _heat(r: float) -> int:
         return 220 + int((r - 0.75) * 4 * 3)
 
 
+HEAT_LEVELS = 256
+
+
 class BoidsEffect(BaseEffect):
     """
     Reynolds flocking simulation.
@@ -45,6 +48,10 @@ class BoidsEffect(BaseEffect):
 
     Boids wrap around screen edges. Speed is colour-mapped hot (fast) to
     cool (slow) when *color* is enabled.
+
+    Neighbours are found through a grid of cells as wide as the perception
+    radius, so each boid is only compared with the boids in its own and the
+    eight surrounding cells instead of the whole flock.
     """
 
     def __init__(self, buffer: Buffer, background: str, settings: BoidsSettings = None):
@@ -57,6 +64,8 @@ class BoidsEffect(BaseEffect):
         self.perception = s.perception
         self._w = buffer.width()
         self._h = buffer.height()
+        self._glyphs_key = None
+        self._glyphs = None
 
         rng = np.random.default_rng()
         n = s.num_boids
@@ -73,25 +82,119 @@ class BoidsEffect(BaseEffect):
             ]
         )
 
+    def _glyph_lut(self) -> np.ndarray:
+        """
+        Returns the boid glyph for each of HEAT_LEVELS speeds, rebuilding the
+        table only when the character or color mode change.
+
+        Returns:
+            np.ndarray: An object array of glyph strings.
+        """
+        key = (self.char, self.color)
+        if key != self._glyphs_key:
+            if self.color:
+                glyphs = [
+                    bc(self.char, color=_heat(level / (HEAT_LEVELS - 1))).colored
+                    for level in range(HEAT_LEVELS)
+                ]
+            else:
+                glyphs = [self.char] * HEAT_LEVELS
+            self._glyphs = np.array(glyphs, dtype=object)
+            self._glyphs_key = key
+        return self._glyphs
+
+    def _sort_by_cell(self):
+        """
+        Buckets the boids into a grid of cells at least perception wide and
+        reorders them by cell, so each cell's boids are one contiguous run.
+        Any neighbour of a boid then sits in its own cell or one of the eight
+        around it.
+
+        Returns:
+            tuple: The cell column and row of each boid, the grid width and
+            height, and the first boid and boid count of each cell.
+        """
+        size = max(self.perception, 1.0)
+        grid_w = max(1, int(np.ceil(self._w / size)))
+        grid_h = max(1, int(np.ceil(self._h / size)))
+        cx = np.clip((self._pos[:, 0] // size).astype(np.intp), 0, grid_w - 1)
+        cy = np.clip((self._pos[:, 1] // size).astype(np.intp), 0, grid_h - 1)
+        cell = cy * grid_w + cx
+        order = np.argsort(cell, kind="stable")
+        self._pos = self._pos[order]
+        self._vel = self._vel[order]
+        counts = np.bincount(cell, minlength=grid_w * grid_h)
+        starts = np.cumsum(counts) - counts
+        return cx[order], cy[order], grid_w, grid_h, starts, counts
+
+    def _neighbor_pairs(self):
+        """
+        Reorders the boids by grid cell and yields every pair of distinct
+        boids within perception of each other, one batch per neighbouring
+        cell offset. Each pair is yielded once, in both orders.
+
+        Only the boid's own cell and the four cells after it are searched;
+        the other four are covered by the pairs found from their side.
+
+        Yields:
+            tuple[np.ndarray, np.ndarray, np.ndarray]: The boid indices i and
+            j of each pair and the offset pos[i] - pos[j] between them.
+        """
+        cx, cy, grid_w, grid_h, starts, counts = self._sort_by_cell()
+        pos = self._pos
+        boids = np.arange(len(pos))
+        radius2 = self.perception * self.perception
+        for dx, dy in ((0, 0), (1, 0), (-1, 1), (0, 1), (1, 1)):
+            ncx = cx + dx
+            ncy = cy + dy
+            valid = (ncx >= 0) & (ncx < grid_w) & (ncy < grid_h)
+            ncell = np.where(valid, ncy * grid_w + ncx, 0)
+            run = np.where(valid, counts[ncell], 0)
+
+            # Expand each boid's run into one candidate pair per boid in it
+            i = np.repeat(boids, run)
+            j = np.repeat(starts[ncell] - (np.cumsum(run) - run), run)
+            j += np.arange(len(j))
+            diff = pos[i] - pos[j]
+            near = np.einsum("ij,ij->i", diff, diff) < radius2
+            if dx == 0 and dy == 0:
+                near &= i < j
+            i, j, diff = i[near], j[near], diff[near]
+            yield (
+                np.concatenate((i, j)),
+                np.concatenate((j, i)),
+                np.concatenate((diff, -diff)),
+            )
+
     def render_frame(self, frame_number: int):
-        self.buffer.clear_buffer(val=self.background)
+        n = len(self._pos)
+        n_nbr = np.zeros(n)
+        sep = np.zeros((n, 2))
+        vel_sum = np.zeros((n, 2))
+        pos_sum = np.zeros((n, 2))
+        close2 = (self.perception * 0.28) ** 2
+        for i, j, diff in self._neighbor_pairs():
+            close = np.einsum("ij,ij->i", diff, diff) < close2
+            n_nbr += np.bincount(i, minlength=n)
+            for axis in (0, 1):
+                sep[:, axis] += np.bincount(
+                    i[close], weights=diff[close, axis], minlength=n
+                )
+                vel_sum[:, axis] += np.bincount(
+                    i, weights=self._vel[j, axis], minlength=n
+                )
+                pos_sum[:, axis] += np.bincount(
+                    i, weights=self._pos[j, axis], minlength=n
+                )
 
         pos = self._pos
         vel = self._vel
+        n_nbr = n_nbr[:, np.newaxis]
+        has_nbr = n_nbr > 0
+        n_nbr = n_nbr.clip(1, None)
 
-        diff = pos[:, np.newaxis, :] - pos[np.newaxis, :, :]
-        dist = np.sqrt((diff**2).sum(axis=2))
-        np.fill_diagonal(dist, np.inf)
-
-        nbr = dist < self.perception
-        close = dist < self.perception * 0.28
-        has_nbr = nbr.any(axis=1, keepdims=True)
-        n_nbr = nbr.sum(axis=1, keepdims=True).clip(1, None)
-
-        sep = np.where(close[:, :, np.newaxis], diff, 0.0).sum(axis=1) * 0.12
-        vel_sum = np.where(nbr[:, :, np.newaxis], vel[np.newaxis], 0.0).sum(axis=1)
+        sep *= 0.12
         align = np.where(has_nbr, (vel_sum / n_nbr - vel) * 0.05, 0.0)
-        pos_sum = np.where(nbr[:, :, np.newaxis], pos[np.newaxis], 0.0).sum(axis=1)
         cohesion = np.where(has_nbr, (pos_sum / n_nbr - pos) * 0.003, 0.0)
 
         new_vel = vel + sep + align + cohesion
@@ -113,8 +216,8 @@ class BoidsEffect(BaseEffect):
             0, 1
         )
         valid = (xs >= 0) & (xs < self._w) & (ys >= 0) & (ys < self._h)
+        levels = (spd_norm[valid] * (HEAT_LEVELS - 1)).astype(np.intp)
 
-        for i in np.where(valid)[0]:
-            color = _heat(float(spd_norm[i])) if self.color else None
-            ch = bc(self.char, color=color) if color is not None else self.char
-            self.buffer.put_char(int(xs[i]), int(ys[i]), ch)
+        cells = np.full((self._h, self._w), self.background, dtype=object)
+        cells[ys[valid], xs[valid]] = self._glyph_lut()[levels]
+        self.buffer.put_block(0, 0, cells.tolist())
@@ -14,7 +14,7 @@ See the License for the specific language governing permissions and
 limitations under the License.
 """
 
-from ..bruhutil import Buffer
+from ..bruhutil import INF, Buffer
 from .base_effect import BaseEffect
 from .settings import DrawLinesSettings
 
@@ -92,93 +92,103 @@ class DrawLinesEffect(BaseEffect):
         """
         self.lines.append(Line(start_point, end_point))
 
+    def frames_until_change(self, frame_number: int):
+        """
+        Lines are only drawn on frame 0, so nothing changes afterwards.
+
+        Args:
+            frame_number (int): The frame that was just rendered.
+        """
+        return INF
+
     def render_frame(self, frame_number: int):
         """
         Renders all lines on frame 0.
 
         Args:
             frame_number (int): The current frame number.
+
+        Returns:
+            bool | None: False on every frame but 0, which redraws everything.
         """
-        if frame_number == 0 and len(self.lines) > 0:
-            for y in range(self.buffer.height()):
-                self.buffer.put_at(0, y, self.background * self.buffer.width())
-            for line in self.lines:
-                if (
-                    (line.start_point[0] < 0 and line.end_point[0]) < 0
-                    or (
-                        line.start_point[0] >= self.buffer.width() * 2
-                        and line.end_point[0] > self.buffer.width() * 2
-                    )
-                    or (line.start_point[1] < 0 and line.end_point[1] < 0)
-                    or (
-                        line.start_point[1] >= self.buffer.height() * 2
-                        and line.end_point[1] >= self.buffer.height() * 2
-                    )
-                ):
-                    return
-
-                line_chars = " ''^.|/7.\\|Ywbd#"
-                dx = abs(line.end_point[0] - line.start_point[0])
-                dy = abs(line.end_point[1] - line.start_point[1])
-
-                cx = -1 if line.start_point[0] > line.end_point[0] else 1
-                cy = -1 if line.start_point[1] > line.end_point[1] else 1
-
-                def get_start(x, y):
-                    c = self.buffer.get_char(x, y)
-                    if c is not None:
-                        return line_chars.find(c)
-                    return 0
-
-                def x_draw(ix, iy):
-                    err = dx
-                    px = ix - 2
-                    py = iy - 2
-                    next_char = 0
-                    while ix != line.end_point[0]:
-                        if ix < px or ix - px >= 2 or iy < py or iy - py >= 2:
-                            px = ix & ~1
-                            py = iy & ~1
-                            next_char = get_start(px // 2, py // 2)
-                        next_char |= 2 ** abs(ix % 2) * 4 ** (iy % 2)
-                        err -= 2 * dy
-                        if err < 0:
-                            iy += cy
-                            err += 2 * dx
-                        ix += cx
-                        if self.char is None:
-                            self.buffer.put_char(
-                                px // 2, py // 2, line_chars[next_char]
-                            )
-                        else:
-                            self.buffer.put_char(px // 2, py // 2, self.char)
-
-                def y_draw(ix, iy):
-                    err = dy
-                    px = ix - 2
-                    py = iy - 2
-                    next_char = 0
-                    while iy != line.end_point[1]:
-                        if ix < px or ix - px >= 2 or iy < py or iy - py >= 2:
-                            px = ix & ~1
-                            py = iy & ~1
-                            next_char = get_start(px // 2, py // 2)
-                        next_char |= 2 ** abs(ix % 2) * 4 ** (iy % 2)
-                        err -= 2 * dx
-                        if err < 0:
-                            ix += cx
-                            err += 2 * dy
+        if frame_number != 0 or not self.lines:
+            return False
+
+        for y in range(self.buffer.height()):
+            self.buffer.put_at(0, y, self.background * self.buffer.width())
+        for line in self.lines:
+            if (
+                (line.start_point[0] < 0 and line.end_point[0]) < 0
+                or (
+                    line.start_point[0] >= self.buffer.width() * 2
+                    and line.end_point[0] > self.buffer.width() * 2
+                )
+                or (line.start_point[1] < 0 and line.end_point[1] < 0)
+                or (
+                    line.start_point[1] >= self.buffer.height() * 2
+                    and line.end_point[1] >= self.buffer.height() * 2
+                )
+            ):
+                return
+
+            line_chars = " ''^.|/7.\\|Ywbd#"
+            dx = abs(line.end_point[0] - line.start_point[0])
+            dy = abs(line.end_point[1] - line.start_point[1])
+
+            cx = -1 if line.start_point[0] > line.end_point[0] else 1
+            cy = -1 if line.start_point[1] > line.end_point[1] else 1
+
+            def get_start(x, y):
+                c = self.buffer.get_char(x, y)
+                if c is not None:
+                    return line_chars.find(c)
+                return 0
+
+            def x_draw(ix, iy):
+                err = dx
+                px = ix - 2
+                py = iy - 2
+                next_char = 0
+                while ix != line.end_point[0]:
+                    if ix < px or ix - px >= 2 or iy < py or iy - py >= 2:
+                        px = ix & ~1
+                        py = iy & ~1
+                        next_char = get_start(px // 2, py // 2)
+                    next_char |= 2 ** abs(ix % 2) * 4 ** (iy % 2)
+                    err -= 2 * dy
+                    if err < 0:
                         iy += cy
-                        if self.char is None:
-                            self.buffer.put_char(
-                                px // 2, py // 2, line_chars[next_char]
-                            )
-                        else:
-                            self.buffer.put_char(px // 2, py // 2, self.char)
-
-                if dy == 0 and self.thin and self.char is None:
-                    pass
-                elif dx > dy:
-                    x_draw(line.start_point[0], line.start_point[1] + 1)
-                else:
-                    y_draw(line.start_point[0] + 1, line.start_point[1])
+                        err += 2 * dx
+                    ix += cx
+                    if self.char is None:
+                        self.buffer.put_char(px // 2, py // 2, line_chars[next_char])
+                    else:
+                        self.buffer.put_char(px // 2, py // 2, self.char)
+
+            def y_draw(ix, iy):
+                err = dy
+                px = ix - 2
+                py = iy - 2
+                next_char = 0
+                while iy != line.end_point[1]:
+                    if ix < px or ix - px >= 2 or iy < py or iy - py >= 2:
+                        px = ix & ~1
+                        py = iy & ~1
+                        next_char = get_start(px // 2, py // 2)
+                    next_char |= 2 ** abs(ix % 2) * 4 ** (iy % 2)
+                    err -= 2 * dx
+                    if err < 0:
+                        ix += cx
+                        err += 2 * dy
+                    iy += cy
+                    if self.char is None:
+                        self.buffer.put_char(px // 2, py // 2, line_chars[next_char])
+                    else:
+                        self.buffer.put_char(px // 2, py // 2, self.char)
+
+            if dy == 0 and self.thin and self.char is None:
+                pass
+            elif dx > dy:
+                x_draw(line.start_point[0], line.start_point[1] + 1)
+            else:
+                y_draw(line.start_point[0] + 1, line.start_point[1])
@@ -16,7 +16,6 @@ limitations under the License.
 
 import math
 import random
-from typing import Dict, List
 
 import numpy as np
 from bruhcolor import bruhcolored as bc
@@ -25,6 +24,8 @@ from ..bruhutil.bruhffer import Buffer
 from .base_effect import BaseEffect
 from .settings import FireSettings
 
+MAX_HEAT_SPOTS = 32
+
 
 class FireEffect(BaseEffect):
     """
@@ -63,14 +64,42 @@ class FireEffect(BaseEffect):
         self.use_char_color = s.use_char_color
         self.background_color = s.background_color
         self.turbulence = max(0.0, min(1.0, s.turbulence))
-        self.heat_spots: List[Dict] = []
         self.heat_spot_intensity = max(0.0, min(1.0, s.heat_spot_intensity))
 
-        self._random_variations = np.random.uniform(0.8, 1.2, (buffer.width(),))
+        # Heat spots as parallel arrays; a slot is free once its lifetime is 0
+        self.spot_x = np.zeros(MAX_HEAT_SPOTS)
+        self.spot_y = np.zeros(MAX_HEAT_SPOTS)
+        self.spot_x_offset = np.zeros(MAX_HEAT_SPOTS)
+        self.spot_y_offset = np.zeros(MAX_HEAT_SPOTS)
+        self.spot_intensity = np.zeros(MAX_HEAT_SPOTS)
+        self.spot_lifetime = np.zeros(MAX_HEAT_SPOTS, dtype=np.int64)
+
+        # Scratch buffers, so steady-state frames allocate no grid-sized arrays
+        self._rng = np.random.default_rng()
+        # Broadcasting a column makes NumPy buffer the product, so spell it out
+        self._cooling = np.repeat(
+            self.height_cooling_map[:-1], buffer.width(), axis=1
+        ).astype(np.float32)
+        self._base = np.zeros_like(self.previous_data)
+        self._scratch = np.zeros_like(self.previous_data)
+        self._spot_noise = np.zeros(MAX_HEAT_SPOTS)
+        self._spot_alive = np.zeros(MAX_HEAT_SPOTS, dtype=bool)
+        self._spot_xi = np.zeros(MAX_HEAT_SPOTS, dtype=np.intp)
+        self._spot_yi = np.zeros(MAX_HEAT_SPOTS, dtype=np.intp)
+        self._row = np.zeros(buffer.width())
+        self._row_noise = np.zeros(buffer.width())
+        self._row_lit = np.zeros(buffer.width(), dtype=bool)
+        self._x_phase = np.arange(buffer.width()) / 5
+
+        self._random_variations = np.zeros(buffer.width())
         self._update_random_variations_counter = 0
+        self._update_random_variations()
 
         self.set_fire_wind(s.wind_direction, s.wind_strength)
 
+        self._glyphs_key = None
+        self._glyphs = None
+
     def set_fire_ascii_chars(self, ascii_chars: str):
         """
         Sets the ASCII characters used for the fire effect.
@@ -190,6 +219,70 @@ class FireEffect(BaseEffect):
             ).colored
         return self.ascii_chars[char_index]
 
+    def _glyph_lut(self) -> np.ndarray:
+        """
+        Returns the glyphs for every (character, color) index pair in the
+        current mode, flattened, followed by a blank glyph. Entry
+        char_index * len(color_map) + color_index holds what get_colored_char
+        would return for those indices. The table is rebuilt only when the
+        characters, colors or mode change.
+
+        Returns:
+            np.ndarray: An object array of glyph strings.
+        """
+        key = (
+            self.ascii_chars,
+            tuple(self.color_map),
+            self.use_char_color,
+            self.background_color,
+        )
+        if key != self._glyphs_key:
+            glyphs = []
+            for char in self.ascii_chars:
+                for color in self.color_map:
+                    if char == " ":
+                        glyphs.append(" ")
+                    elif self.background_color:
+                        glyphs.append(bc(text=" ", on_color=color).colored)
+                    elif self.use_char_color:
+                        glyphs.append(bc(text=char, color=color).colored)
+                    else:
+                        glyphs.append(char)
+            glyphs.append(" ")
+            self._glyphs = np.array(glyphs, dtype=object)
+            self._glyphs_key = key
+        return self._glyphs
+
+    def _glyph_indices(
+        self, intensities: np.ndarray, max_intensity: float = 255.0
+    ) -> np.ndarray:
+        """
+        Maps intensities to indices into _glyph_lut(), applying the same
+        ±10% jitter and rare white-hot flash as get_colored_char.
+
+        Args:
+            intensities (np.ndarray): Cell intensities.
+            max_intensity (float, optional): Maximum intensity value. Defaults to 255.0.
+
+        Returns:
+            np.ndarray: An int array of glyph indices, shaped like intensities.
+        """
+        n_chars, n_colors = len(self.ascii_chars), len(self.color_map)
+        varied = intensities * np.random.uniform(0.9, 1.1, intensities.shape)
+        np.clip(varied, 0, max_intensity, out=varied)
+
+        ratio = varied / max_intensity
+        char_index = np.minimum((ratio * (n_chars - 1)).astype(np.intp), n_chars - 1)
+        color_index = np.minimum((ratio * (n_colors - 2)).astype(np.intp), n_colors - 2)
+        flash = (np.random.random(intensities.shape) < 0.04) & (
+            intensities > max_intensity * 0.9
+        )
+        color_index[flash] = n_colors - 1
+
+        indices = char_index * n_colors + color_index
+        indices[varied < 1] = n_chars * n_colors
+        return indices
+
     def update_data(self, frame_number: int):
         """
         Updates the fire simulation data for one frame.
@@ -203,62 +296,101 @@ class FireEffect(BaseEffect):
         )
         wind_offset_x = int(wind_x * 2)
 
-        left = np.roll(self.previous_data, -1, axis=1)
-        right = np.roll(self.previous_data, 1, axis=1)
-        up = np.roll(self.previous_data, -1, axis=0)
-
-        base_values = (up * 1.8 + left * 1.2 + right * 1.2) / 4.2
-
-        if wind_offset_x != 0:
-            base_values = np.roll(base_values, wind_offset_x, axis=1)
+        # Each cell blends the cells below, left and right of it (wrapping).
+        # Horizontal neighbors are shifted through the flattened grids, which
+        # NumPy can process without buffering, then the wrapped column is fixed.
+        prev, base, scratch = self.previous_data, self._base, self._scratch
+        flat_prev, flat_scratch = prev.reshape(-1), scratch.reshape(-1)
+        np.multiply(prev[1:], 1.8, out=base[:-1])
+        np.multiply(prev[0], 1.8, out=base[-1])
+        np.multiply(flat_prev[1:], 1.2, out=flat_scratch[:-1])
+        np.multiply(prev[:, 0], 1.2, out=scratch[:, -1])
+        base += scratch
+        np.multiply(flat_prev[:-1], 1.2, out=flat_scratch[1:])
+        np.multiply(prev[:, -1], 1.2, out=scratch[:, 0])
+        base += scratch
+        base /= 4.2
+
+        shift = wind_offset_x % base.shape[1]
+        if shift:
+            scratch[:, shift:] = base[:, :-shift]
+            scratch[:, :shift] = base[:, -shift:]
+            base, scratch = scratch, base
 
         if self.turbulence > 0:
-            turbulence_factor = np.random.uniform(
-                1 - self.turbulence, 1 + self.turbulence, base_values.shape
-            )
-            base_values *= turbulence_factor
+            self._rng.random(out=scratch, dtype=np.float32)
+            scratch *= 2 * self.turbulence
+            scratch += 1 - self.turbulence
+            base *= scratch
 
-        self.current_data[:-1, :] = base_values[1:, :] * self.height_cooling_map[:-1, :]
+        np.multiply(base[1:], self._cooling, out=self.current_data[:-1])
 
         if random.random() < self.heat_spot_intensity:
-            self.heat_spots.append(
-                {
-                    "x": random.randint(0, self.buffer.width() - 1),
-                    "y": random.randint(
-                        self.buffer.height() - 3, self.buffer.height() - 1
-                    ),
-                    "intensity": random.uniform(0.5, 1.0),
-                    "lifetime": random.randint(10, 20),
-                    "y_offset": 0.0,
-                    "x_offset": 0.0,
-                }
-            )
-
-        new_heat_spots = []
-        for spot in self.heat_spots:
-            if spot["lifetime"] > 0:
-                spot["y_offset"] += random.uniform(0, 0.5)
-                spot["y"] = max(0, spot["y"] - int(spot["y_offset"]))
-                spot["x_offset"] += random.uniform(-0.3, 0.3)
-                spot["x"] += spot["x_offset"]
-
-                x, y = int(spot["x"]), int(spot["y"])
-
-                if 0 <= x < self.buffer.width() and 0 <= y < self.buffer.height():
-                    self.current_data[y, x] = max(
-                        self.current_data[y, x], 255 * spot["intensity"]
-                    )
-
-                spot["lifetime"] -= 1
-                if spot["y"] > 0:
-                    new_heat_spots.append(spot)
-        self.heat_spots = new_heat_spots
-
-        self.previous_data, self.current_data = (
-            self.current_data.copy(),
-            self.previous_data,
+            self.spawn_heat_spot()
+        self.update_heat_spots()
+
+        self.previous_data, self.current_data = self.current_data, self.previous_data
+
+    def spawn_heat_spot(self):
+        """
+        Starts a heat spot near the bottom of the fire in a free slot, if any.
+        """
+        free = np.flatnonzero(self.spot_lifetime <= 0)
+        if not free.size:
+            return
+        i = free[0]
+        self.spot_x[i] = random.randint(0, self.buffer.width() - 1)
+        self.spot_y[i] = random.randint(
+            self.buffer.height() - 3, self.buffer.height() - 1
+        )
+        self.spot_intensity[i] = random.uniform(0.5, 1.0)
+        self.spot_lifetime[i] = random.randint(10, 20)
+        self.spot_x_offset[i] = 0.0
+        self.spot_y_offset[i] = 0.0
+
+    def update_heat_spots(self):
+        """
+        Drifts every live heat spot upwards and heats the cell under it. Spots
+        die when their lifetime runs out or they reach the top.
+        """
+        alive, noise = self._spot_alive, self._spot_noise
+        np.greater(self.spot_lifetime, 0, out=alive)
+        if not alive.any():
+            return
+
+        self._rng.random(out=noise)
+        noise *= 0.5
+        np.add(self.spot_y_offset, noise, out=self.spot_y_offset, where=alive)
+        np.floor(self.spot_y_offset, out=noise)
+        np.subtract(self.spot_y, noise, out=self.spot_y, where=alive)
+        np.maximum(self.spot_y, 0, out=self.spot_y)
+
+        self._rng.random(out=noise)
+        noise *= 0.6
+        noise -= 0.3
+        np.add(self.spot_x_offset, noise, out=self.spot_x_offset, where=alive)
+        np.add(self.spot_x, self.spot_x_offset, out=self.spot_x, where=alive)
+
+        xi, yi = self._spot_xi, self._spot_yi
+        np.copyto(xi, self.spot_x, casting="unsafe")
+        np.copyto(yi, self.spot_y, casting="unsafe")
+        h, w = self.current_data.shape
+        hit = alive & (xi >= 0) & (xi < w) & (yi >= 0) & (yi < h)
+        np.maximum.at(
+            self.current_data, (yi[hit], xi[hit]), 255 * self.spot_intensity[hit]
         )
 
+        np.subtract(self.spot_lifetime, 1, out=self.spot_lifetime, where=alive)
+        self.spot_lifetime[self.spot_y <= 0] = 0
+
+    def _update_random_variations(self):
+        """
+        Redraws the per-column variation of the seeded heat, between 0.8 and 1.2.
+        """
+        self._rng.random(out=self._random_variations)
+        self._random_variations *= 0.4
+        self._random_variations += 0.8
+
     def add_new_fire_row(self, frame_number: int):
         """
         Seeds a new row of heat at the bottom of the fire.
@@ -267,19 +399,20 @@ class FireEffect(BaseEffect):
             frame_number (int): The current frame number.
         """
         if self._update_random_variations_counter % 10 == 0:
-            self._random_variations = np.random.uniform(
-                0.8, 1.2, (self.buffer.width(),)
-            )
+            self._update_random_variations()
         self._update_random_variations_counter += 1
 
-        x_values = np.arange(self.buffer.width())
-        base_intensities = self.fire_intensity * (
-            1 + 0.3 * np.sin(x_values / 5 + frame_number * 0.1)
-        )
-        base_intensities *= self._random_variations
+        row = self._row
+        np.add(self._x_phase, frame_number * 0.1, out=row)
+        np.sin(row, out=row)
+        row *= 0.3
+        row += 1
+        row *= self.fire_intensity
+        row *= self._random_variations
 
-        random_values = np.random.random(self.buffer.width())
-        self.current_data[-1, :] = np.where(random_values < base_intensities, 255, 0)
+        self._rng.random(out=self._row_noise)
+        np.less(self._row_noise, row, out=self._row_lit)
+        np.multiply(self._row_lit, 255, out=self.current_data[-1])
 
     def render_frame(self, frame_number: int):
         """
@@ -291,10 +424,8 @@ class FireEffect(BaseEffect):
         self.update_data(frame_number)
 
         intensities = np.clip(self.current_data, 0, 255)
-
-        for y in range(self.buffer.height()):
-            for x in range(self.buffer.width()):
-                self.buffer.put_char(x, y, self.get_colored_char(intensities[y, x]))
+        glyphs = np.take(self._glyph_lut(), self._glyph_indices(intensities))
+        self.buffer.put_block(0, 0, glyphs.tolist())
 
         self.add_new_fire_row(frame_number)
 
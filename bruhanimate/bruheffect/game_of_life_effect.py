@@ -15,17 +15,267 @@ limitations under the License.
 """
 
 import random
+import re
 
+import numpy as np
 from bruhcolor import bruhcolored
 
 from ..bruhutil import LIFE_COLORS, LIFE_SCALES, Buffer
+from ..bruhutil.utils import INF
+from .active_tiles import ActiveTiles
 from .base_effect import BaseEffect
 from .settings import GameOfLifeSettings
 
+# Words processed per band in PackedLifeWorld.step(), sized to stay in cache
+STEP_BAND_WORDS = 1 << 13
+_RLE_TOKEN = re.compile(r"(\d*)([a-zA-Z$!])")
+
+
+def parse_rle(text: str) -> np.ndarray:
+    """
+    Parses a pattern in the standard run length encoded (RLE) Life format.
+
+    Comment lines (``#``) are skipped and the ``x = .., y = ..`` header sizes
+    the pattern. The header's rule is ignored. ``b`` marks dead cells, ``$``
+    ends a row and ``!`` ends the pattern; every other letter is a live cell.
+
+    Args:
+        text (str): The RLE pattern.
+
+    Returns:
+        np.ndarray: A (height, width) boolean array of live cells.
+
+    Raises:
+        ValueError: If the header is missing or malformed, or the pattern
+            doesn't fit in it.
+    """
+    lines = [line.strip() for line in text.strip().splitlines()]
+    lines = [line for line in lines if line and not line.startswith("#")]
+    header = {}
+    for field in lines[0].split(",") if lines else []:
+        key, _, value = field.partition("=")
+        header[key.strip()] = value.strip()
+    if "x" not in header or "y" not in header:
+        raise ValueError("RLE pattern is missing its 'x = .., y = ..' header")
+    width, height = int(header["x"]), int(header["y"])
+
+    cells = np.zeros((height, width), dtype=bool)
+    x = y = 0
+    for count, tag in _RLE_TOKEN.findall("".join(lines[1:])):
+        count = int(count) if count else 1
+        if tag == "!":
+            break
+        if tag == "$":
+            y += count
+            x = 0
+        elif tag == "b":
+            x += count
+        else:
+            if y >= height or x + count > width:
+                raise ValueError("RLE pattern is larger than its header")
+            cells[y, x : x + count] = True
+            x += count
+    return cells
+
+
+class PackedLifeWorld:
+    """
+    A toroidal Life world stored one bit per cell.
+
+    Each row is packed into uint64 words, least significant bit first, and a
+    generation is computed for 64 cells at a time with bitwise adders.
+    """
+
+    def __init__(self, width: int, height: int):
+        """
+        Initializes an empty world.
+
+        Args:
+            width (int): Width in cells. Must be a multiple of 64.
+            height (int): Height in cells.
+
+        Raises:
+            ValueError: If the width is not a positive multiple of 64.
+        """
+        if width <= 0 or width % 64 or height <= 0:
+            raise ValueError(
+                f"world width must be a positive multiple of 64, got {width}x{height}"
+            )
+        self.width = width
+        self.height = height
+        self.words = np.zeros((height, width // 64), dtype="<u8")
+
+    @property
+    def population(self) -> int:
+        """
+        The number of live cells.
+        """
+        return int(np.bitwise_count(self.words).sum())
+
+    def clear(self):
+        """
+        Kills every cell.
+        """
+        self.words.fill(0)
+
+    def randomize(self, density: float, rng: np.random.Generator):
+        """
+        Replaces the world with randomly placed live cells.
+
+        Args:
+            density (float): The chance of each cell being alive.
+            rng (np.random.Generator): The random number generator to use.
+        """
+        # Fill in bands of rows to bound the size of the temporary array
+        band = max(1, 2**20 // self.width)
+        for y in range(0, self.height, band):
+            rows = rng.random((min(band, self.height - y), self.width)) < density
+            self.words[y : y + len(rows)] = self._pack(rows)
+
+    def place(self, cells: np.ndarray, x: int, y: int):
+        """
+        Sets the given live cells with their top-left corner at (x, y),
+        wrapping around the world's edges.
+
+        Args:
+            cells (np.ndarray): A (height, width) boolean array of live cells.
+            x (int): The column of the pattern's left edge.
+            y (int): The row of the pattern's top edge.
+        """
+        ys = np.arange(y, y + cells.shape[0]) % self.height
+        xs = np.arange(x, x + cells.shape[1]) % self.width
+        rows = self._unpack(self.words[ys])
+        rows[:, xs] |= cells
+        self.words[ys] = self._pack(rows)
+
+    def view(self, x: int, y: int, width: int, height: int) -> np.ndarray:
+        """
+        Returns the live cells in a window, wrapping around the world's edges.
+
+        Args:
+            x (int): The column of the window's left edge.
+            y (int): The row of the window's top edge.
+            width (int): The window's width.
+            height (int): The window's height.
+
+        Returns:
+            np.ndarray: A (height, width) boolean array of live cells.
+        """
+        ys = np.arange(y, y + height) % self.height
+        xs = np.arange(x, x + width) % self.width
+        return self._unpack(self.words[ys])[:, xs]
+
+    def step(self, birth, survive):
+        """
+        Advances the world by one generation.
+
+        Args:
+            birth (Iterable[int]): Neighbor counts that bring a dead cell to life.
+            survive (Iterable[int]): Neighbor counts that keep a live cell alive.
+        """
+        birth = [n for n in set(birth) if 0 <= n <= 8]
+        survive = [n for n in set(survive) if 0 <= n <= 8]
+        new = np.empty_like(self.words)
+        # Work through bands of rows small enough to stay in cache
+        band = max(1, STEP_BAND_WORDS // self.words.shape[1])
+        for y in range(0, self.height, band):
+            rows = np.arange(y - 1, min(y + band, self.height) + 1) % self.height
+            new[y : y + len(rows) - 2] = self._step_rows(
+                self.words[rows], birth, survive
+            )
+        self.words = new
+
+    @staticmethod
+    def _step_rows(cells: np.ndarray, birth, survive) -> np.ndarray:
+        """
+        Computes the next generation of every row but the first and last, which
+        only serve as neighbors.
+        """
+        # Neighbors to the west and east, carrying bits across word boundaries
+        west = np.roll(cells >> 63, 1, axis=1)
+        west |= cells << 1
+        east = np.roll(cells << 63, -1, axis=1)
+        east |= cells >> 1
+
+        # 2-bit sums of the three cells in each row around a column
+        side = west ^ cells
+        row_low = side ^ east
+        row_high = side & east
+        row_high |= west & cells
+        above_low, above_high = row_low[:-2], row_high[:-2]
+        below_low, below_high = row_low[2:], row_high[2:]
+
+        # 2-bit sum of the two cells beside each cell
+        west, east, cells = west[1:-1], east[1:-1], cells[1:-1]
+        side_low = west ^ east
+        side_high = west & east
+
+        # Add the three 2-bit sums into a 4-bit count (bits c0 to c3)
+        c0 = above_low ^ side_low
+        carry = above_low & side_low
+        carry |= below_low & c0
+        c0 ^= below_low
+        twos = above_high ^ side_high
+        fours = above_high & side_high
+        fours |= below_high & twos
+        twos ^= below_high
+        c1 = twos ^ carry
+        carry &= twos
+        c2 = fours ^ carry
+        c3 = fours & carry
+
+        # A count of 4 to 7 sets c2 alone and 8 sets c3 alone
+        below_four = ~(c2 | c3)
+        literals = {}
+
+        def count_is(n):
+            if n == 8:
+                return c3
+            term = below_four if n < 4 else c2
+            for i, bit in ((0, c0), (1, c1)):
+                if not n >> i & 1:
+                    if i not in literals:
+                        literals[i] = ~bit
+                    bit = literals[i]
+                term = term & bit
+            return term
+
+        def any_count(counts):
+            mask = np.zeros_like(cells)
+            for n in counts:
+                mask |= count_is(n)
+            return mask
+
+        survivors = any_count(survive)
+        survivors &= cells
+        born = any_count(birth)
+        born &= ~cells
+        survivors |= born
+        return survivors
+
+    @staticmethod
+    def _pack(rows: np.ndarray) -> np.ndarray:
+        return np.packbits(rows, axis=1, bitorder="little").view("<u8")
+
+    @staticmethod
+    def _unpack(words: np.ndarray) -> np.ndarray:
+        return np.unpackbits(
+            np.ascontiguousarray(words).view(np.uint8), axis=1, bitorder="little"
+        ).astype(bool)
+
 
 class GameOfLifeEffect(BaseEffect):
     """
     Effect to simulate Conway's Game of Life.
+
+    The board is a uint8 array of cell states, from DEAD (0) to ALIVE. With
+    decay enabled, dead cells fade through the states in between.
+
+    With ``world_size`` set, the simulation runs on a toroidal
+    :class:`PackedLifeWorld` of that size instead, and the board shows a
+    viewport onto it that moves by ``viewport_velocity`` cells per frame.
+    ``pattern`` seeds the board or world with an RLE pattern instead of random
+    cells.
     """
 
     def __init__(
@@ -49,23 +299,21 @@ class GameOfLifeEffect(BaseEffect):
         self.scale = s.scale
         self.color = s.color
         self.color_type = s.color_type
-        self._set_attributes()
+        self.pattern = s.pattern
+        self.viewport_velocity = s.viewport_velocity
+        self.world = PackedLifeWorld(*s.world_size) if s.world_size else None
+        self.viewport = (0.0, 0.0)
 
-        self.directions = [
-            [1, 0],
-            [0, 1],
-            [-1, 0],
-            [0, -1],
-            [1, 1],
-            [1, -1],
-            [-1, 1],
-            [-1, -1],
-        ]
+        h, w = self.buffer.height(), self.buffer.width()
         self.rules = {"life": [2, 3], "death": [3, 3]}
-        self.board = [
-            [" " for _ in range(self.buffer.width())]
-            for __ in range(self.buffer.height())
-        ]
+        self.board = np.zeros((h, w), dtype=np.uint8)
+        # Live cells with a dead border, so neighbor sums need no bounds checks
+        self._alive = np.zeros((h + 2, w + 2), dtype=np.uint8)
+        self._neighbors = np.zeros((h, w), dtype=np.uint8)
+        self._tiles = ActiveTiles(h, w)
+        self._redraw = True
+        self._rng = np.random.default_rng()
+        self._set_attributes()
 
     def _set_attributes(self):
         self.grey_scale = (
@@ -79,6 +327,23 @@ class GameOfLifeEffect(BaseEffect):
         self.ALIVE = len(self.grey_scale) - 1
         self.DEAD = 0
         self.mappings = {i: self.grey_scale[i] for i in range(len(self.grey_scale))}
+        self._glyphs = np.array(
+            [
+                bruhcolored(self.grey_scale[i], color=self.colors[i]).colored
+                for i in range(len(self.grey_scale))
+            ],
+            dtype=object,
+        )
+        np.minimum(self.board, self.ALIVE, out=self.board)
+        self._invalidate()
+
+    def _invalidate(self):
+        """
+        Reevaluates and redraws the whole board on the next frame, after it or
+        its rules changed outside of a step.
+        """
+        self._tiles.mark_all()
+        self._redraw = True
 
     def set_decay(
         self, decay: bool, color_type: str = "GREYSCALE", scale: str = "random"
@@ -107,124 +372,189 @@ class GameOfLifeEffect(BaseEffect):
         """
         self.rules["life"] = life_rule
         self.rules["death"] = death_rule
+        self._invalidate()
+
+    def load_rle(self, text: str, x: int = None, y: int = None):
+        """
+        Adds the live cells of an RLE pattern to the world, or to the board when
+        there is no world. Cells past the board's edges are dropped.
+
+        Args:
+            text (str): The RLE pattern.
+            x (int, optional): Column of the pattern's left edge. Defaults to centered.
+            y (int, optional): Row of the pattern's top edge. Defaults to centered.
+        """
+        cells = parse_rle(text)
+        height, width = (
+            (self.world.height, self.world.width) if self.world else self.board.shape
+        )
+        x = (width - cells.shape[1]) // 2 if x is None else x
+        y = (height - cells.shape[0]) // 2 if y is None else y
+        if self.world is not None:
+            self.world.place(cells, x, y)
+            return
+
+        x0, y0 = max(0, x), max(0, y)
+        x1, y1 = min(width, x + cells.shape[1]), min(height, y + cells.shape[0])
+        if x0 < x1 and y0 < y1:
+            region = cells[y0 - y : y1 - y, x0 - x : x1 - x]
+            self.board[y0:y1, x0:x1][region] = self.ALIVE
+            self._invalidate()
+
+    def _seed(self):
+        """
+        Fills the board or world with the pattern, or with random live cells.
+        """
+        if self.world is not None:
+            if self.pattern is None:
+                self.world.randomize(0.1, self._rng)
+            else:
+                self.world.clear()
+                self.load_rle(self.pattern)
+            h, w = self.board.shape
+            self.viewport = (
+                (self.world.width - w) / 2 % self.world.width,
+                (self.world.height - h) / 2 % self.world.height,
+            )
+        elif self.pattern is None:
+            seeded = self._rng.random(self.board.shape) < 0.1
+            self.board[...] = np.where(seeded, self.ALIVE, self.DEAD)
+        else:
+            self.board.fill(self.DEAD)
+            self.load_rle(self.pattern)
+
+    def _show_viewport(self):
+        """
+        Copies the world's live cells under the viewport onto the board, letting
+        the rest decay, then moves the viewport along.
+        """
+        h, w = self.board.shape
+        vx, vy = self.viewport
+        visible = self.world.view(int(vx), int(vy), w, h)
+        np.subtract(self.board, 1, out=self.board, where=self.board > self.DEAD)
+        self.board[visible] = self.ALIVE
+
+        dx, dy = self.viewport_velocity
+        self.viewport = ((vx + dx) % self.world.width, (vy + dy) % self.world.height)
+
+    def step(self):
+        """
+        Advances the board, or the world when there is one, by one generation.
+
+        Only the board's active tiles are evaluated: a cell whose neighborhood
+        didn't change in the last generation can't change in this one.
+
+        Returns:
+            list[tuple[int, int, int, int]] | None: The (y0, y1, x0, x1) bounds
+                of the board regions that changed, or None when stepping the world.
+        """
+        if self.world is not None:
+            life_min, life_max = self.rules["life"]
+            birth_min, birth_max = self.rules["death"]
+            self.world.step(
+                range(birth_min, birth_max + 1), range(life_min, life_max + 1)
+            )
+            return None
+
+        board, tiles = self.board, self._tiles
+        h, w = board.shape
+        if tiles.active.all():
+            np.equal(board, self.ALIVE, out=self._alive[1:-1, 1:-1], casting="unsafe")
+            regions = [(0, h, 0, w)]
+        else:
+            regions = tiles.regions()
+
+        # Work out every region before writing any back, since neighboring
+        # regions read each other's borders
+        updates = []
+        changed = np.zeros(tiles.shape, dtype=bool)
+        for y0, y1, x0, x1 in regions:
+            states = self._next_states(y0, y1, x0, x1)
+            diff = states != board[y0:y1, x0:x1]
+            if diff.any():
+                tiles.mark_changed(changed, y0, x0, diff)
+                updates.append((y0, y1, x0, x1, states))
+
+        for y0, y1, x0, x1, states in updates:
+            board[y0:y1, x0:x1] = states
+            np.equal(
+                states,
+                self.ALIVE,
+                out=self._alive[y0 + 1 : y1 + 1, x0 + 1 : x1 + 1],
+                casting="unsafe",
+            )
+        tiles.update(changed)
+        return [region[:4] for region in updates]
+
+    def _next_states(self, y0: int, y1: int, x0: int, x1: int) -> np.ndarray:
+        """
+        Returns the next generation of the board between rows y0:y1 and
+        columns x0:x1.
+        """
+        alive = self._alive[y0 : y1 + 2, x0 : x1 + 2]
+        neighbors = self._neighbors[: y1 - y0, : x1 - x0]
+
+        # Sum the eight shifted copies of the live cells
+        np.add(alive[:-2, :-2], alive[:-2, 1:-1], out=neighbors)
+        neighbors += alive[:-2, 2:]
+        neighbors += alive[1:-1, :-2]
+        neighbors += alive[1:-1, 2:]
+        neighbors += alive[2:, :-2]
+        neighbors += alive[2:, 1:-1]
+        neighbors += alive[2:, 2:]
+
+        is_alive = alive[1:-1, 1:-1].astype(bool)
+        life_min, life_max = self.rules["life"]
+        birth_min, birth_max = self.rules["death"]
+        survives = is_alive & (neighbors >= life_min) & (neighbors <= life_max)
+        born = ~is_alive & (neighbors >= birth_min) & (neighbors <= birth_max)
+
+        # Everything else decays by one state towards dead
+        states = self.board[y0:y1, x0:x1].copy()
+        np.subtract(states, 1, out=states, where=states > self.DEAD)
+        states[survives | born] = self.ALIVE
+        return states
+
+    def frames_until_change(self, frame_number: int):
+        """
+        A board with no active tiles has settled into still lifes, so it stays
+        the same until something is loaded onto it.
+
+        Args:
+            frame_number (int): The frame that was just rendered.
+        """
+        if self.world is None and self._tiles.idle:
+            return INF
+        return 1
 
     def render_frame(self, frame_number: int):
         """
-        Renders a single frame of the Game of Life.
+        Renders a single frame of the Game of Life, redrawing only the regions
+        of the board that changed.
 
         Args:
             frame_number (int): The current frame number.
+
+        Returns:
+            list[tuple[int, int, int, int]] | None: The (x, y, width, height)
+                rects that changed, or None if the whole board was redrawn.
         """
         if frame_number == 0:
-            for y in range(self.buffer.height()):
-                for x in range(self.buffer.width()):
-                    if random.random() < 0.1:
-                        self.buffer.put_char(
-                            x,
-                            y,
-                            bruhcolored(
-                                self.grey_scale[self.ALIVE],
-                                color=self.colors[self.ALIVE],
-                            ).colored,
-                        )
-                        self.board[y][x] = (
-                            bruhcolored(
-                                self.grey_scale[self.ALIVE],
-                                color=self.colors[self.ALIVE],
-                            ),
-                            self.ALIVE,
-                        )
-                    else:
-                        self.buffer.put_char(
-                            x,
-                            y,
-                            bruhcolored(
-                                self.grey_scale[self.DEAD], color=self.colors[self.DEAD]
-                            ).colored,
-                        )
-                        self.board[y][x] = (
-                            bruhcolored(
-                                self.grey_scale[self.DEAD], color=self.colors[self.DEAD]
-                            ),
-                            0,
-                        )
+            self._seed()
+            self._invalidate()
+            changed = None
         else:
-            all_neighbors = [
-                [0 for _ in range(self.buffer.width())]
-                for __ in range(self.buffer.height())
-            ]
-            for y in range(len(all_neighbors)):
-                for x in range(len(all_neighbors[y])):
-                    neighbors = 0
-                    for direction in self.directions:
-                        if (
-                            0 <= y + direction[0] < self.buffer.height()
-                            and 0 <= x + direction[1] < self.buffer.width()
-                            and self.board[y + direction[0]][x + direction[1]][1]
-                            == self.ALIVE
-                        ):
-                            neighbors += 1
-                    all_neighbors[y][x] = neighbors
-
-            for y in range(self.buffer.height()):
-                for x in range(self.buffer.width()):
-                    if self.board[y][x][1] == self.ALIVE:
-                        if (
-                            self.rules["life"][0]
-                            <= all_neighbors[y][x]
-                            <= self.rules["life"][1]
-                        ):
-                            pass
-                        else:
-                            self.buffer.put_char(
-                                x,
-                                y,
-                                bruhcolored(
-                                    self.grey_scale[self.ALIVE - 1],
-                                    color=self.colors[self.ALIVE - 1],
-                                ).colored,
-                            )
-                            self.board[y][x] = (
-                                bruhcolored(
-                                    self.grey_scale[self.ALIVE - 1],
-                                    color=self.colors[self.ALIVE - 1],
-                                ),
-                                self.ALIVE - 1,
-                            )
-                    else:
-                        if (
-                            self.rules["death"][0]
-                            <= all_neighbors[y][x]
-                            <= self.rules["death"][1]
-                        ):
-                            self.buffer.put_char(
-                                x,
-                                y,
-                                bruhcolored(
-                                    self.grey_scale[self.ALIVE],
-                                    color=self.colors[self.ALIVE],
-                                ).colored,
-                            )
-                            self.board[y][x] = (
-                                bruhcolored(
-                                    self.grey_scale[self.ALIVE],
-                                    color=self.colors[self.ALIVE],
-                                ),
-                                self.ALIVE,
-                            )
-                        else:
-                            pos = max(0, self.board[y][x][1] - 1)
-                            self.buffer.put_char(
-                                x,
-                                y,
-                                bruhcolored(
-                                    self.grey_scale[pos],
-                                    color=self.colors[pos],
-                                ).colored,
-                            )
-                            self.board[y][x] = (
-                                bruhcolored(
-                                    self.grey_scale[pos], color=self.colors[pos]
-                                ),
-                                pos,
-                            )
+            changed = self.step()
+        if self.world is not None:
+            self._show_viewport()
+        if changed is None or self._redraw:
+            self._redraw = False
+            self.buffer.put_block(0, 0, np.take(self._glyphs, self.board).tolist())
+            return None
+
+        changes = []
+        for y0, y1, x0, x1 in changed:
+            states = self.board[y0:y1, x0:x1]
+            self.buffer.put_block(x0, y0, np.take(self._glyphs, states).tolist())
+            changes.append((x0, y0, x1 - x0, y1 - y0))
+        return changes
@@ -0,0 +1,72 @@
+"""
+Copyright 2023 Ethan Christensen
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import numpy as np
+
+from ..bruhutil import Buffer
+
+
+class ImageMask:
+    """
+    Cached mask of the opaque cells of an image buffer, for effects that
+    collide with the image. The mask, and the surface height of each column,
+    are only recomputed when the image's cells change.
+    """
+
+    def __init__(self):
+        """
+        Initializes an empty mask.
+        """
+        self.mask = None
+        self.surface = None
+        self._rows = None
+
+    def update(self, image_buffer: Buffer) -> np.ndarray:
+        """
+        Returns which cells of the image buffer are opaque, i.e. neither a
+        space nor None.
+
+        Args:
+            image_buffer (Buffer): The buffer holding the image.
+
+        Returns:
+            np.ndarray: A (height, width) boolean array.
+        """
+        rows = image_buffer.buffer
+        if self.mask is None or self._rows != rows:
+            self._rows = [row[:] for row in rows]
+            cells = np.empty(
+                (image_buffer.height(), image_buffer.width()), dtype=object
+            )
+            cells[...] = rows
+            self.mask = np.not_equal(cells, " ") & np.not_equal(cells, None)
+            self.surface = surface_heights(self.mask)
+        return self.mask
+
+
+def surface_heights(mask: np.ndarray) -> np.ndarray:
+    """
+    Returns the row of the topmost True cell in each column of a mask, or the
+    mask's height for empty columns. Anything falling down a column stops on
+    the row above.
+
+    Args:
+        mask (np.ndarray): A (height, width) boolean array.
+
+    Returns:
+        np.ndarray: An int array with one entry per column.
+    """
+    return np.where(mask.any(axis=0), mask.argmax(axis=0), mask.shape[0])
@@ -14,34 +14,232 @@ See the License for the specific language governing permissions and
 limitations under the License.
 """
 
+import math
+from collections import OrderedDict
+
 import numpy as np
+from bruhcolor import bruhcolored
 
 from ..bruhutil.bruhffer import Buffer
+from ..bruhutil.utils import INF
 from .base_effect import BaseEffect
+from .progressive import ProgressiveField
+from .settings import JuliaSettings
+
+FRACTALS = ("julia", "mandelbrot")
+
+
+def escape_time(z, c, max_iter: int, smooth: bool = False) -> np.ndarray:
+    """
+    Vectorized escape-time iteration of z -> z * z + c.
+
+    Only points that have not escaped yet are iterated: escaped points are
+    recorded and dropped from the working set after every step.
+
+    Args:
+        z (np.ndarray): 1D complex array of starting points.
+        c (complex | np.ndarray): The constant, either a scalar or one per point.
+        max_iter (int): Maximum number of iterations.
+        smooth (bool): Whether to return continuous (fractional) iteration counts.
+
+    Returns:
+        np.ndarray: Iteration depth of each point normalized to range [0, 1].
+    """
+    real_dtype = np.float32 if z.dtype == np.complex64 else np.float64
+    per_point_c = np.ndim(c) > 0
+    if not per_point_c:
+        c = z.dtype.type(c)
+
+    result = np.full(z.size, max_iter, dtype=real_dtype)
+    active = np.abs(z) < 2
+    result[~active] = 0
+    index = np.flatnonzero(active)
+    z = z[index]
+    if per_point_c:
+        c = c[index]
+
+    for iteration in range(1, max_iter + 1):
+        if not index.size:
+            break
+        np.multiply(z, z, out=z)
+        z += c
+        mag = np.abs(z)
+        escaped = mag >= 2
+        if escaped.any():
+            if smooth:
+                # Continuous count: iteration + 1 - log2(log|z| / log 2)
+                nu = np.log2(np.log(mag[escaped]) / math.log(2))
+                result[index[escaped]] = iteration + 1 - nu
+            else:
+                result[index[escaped]] = iteration
+            keep = ~escaped
+            index = index[keep]
+            z = z[keep]
+            if per_point_c:
+                c = c[keep]
+
+    result /= max_iter
+    np.clip(result, 0, 1, out=result)
+    return result
+
+
+class FractalTileCache:
+    """
+    LRU cache of computed fractal tiles with a memory limit.
+
+    Tiles are addressed like a quadtree by ``(c, level, tx, ty)``: every level
+    halves the pixel spacing of the one above it, so the four children of a
+    tile are ``(c, level + 1, 2 * tx + {0, 1}, 2 * ty + {0, 1})``.
+    """
+
+    def __init__(self, max_bytes: int):
+        """
+        Initializes an empty tile cache.
+
+        Args:
+            max_bytes (int): Total size of cached tiles before the least recently used are evicted.
+        """
+        self.max_bytes = max_bytes
+        self.nbytes = 0
+        self.hits = 0
+        self.misses = 0
+        self._tiles = OrderedDict()
+
+    def get(self, key):
+        """
+        Returns the tile stored under key (marking it recently used), or None.
+        """
+        tile = self._tiles.get(key)
+        if tile is None:
+            self.misses += 1
+            return None
+        self._tiles.move_to_end(key)
+        self.hits += 1
+        return tile
+
+    def put(self, key, tile: np.ndarray):
+        """
+        Stores a tile, evicting the least recently used ones over the memory limit.
+        """
+        if key in self._tiles:
+            self.nbytes -= self._tiles.pop(key).nbytes
+        self._tiles[key] = tile
+        self.nbytes += tile.nbytes
+        while self.nbytes > self.max_bytes and len(self._tiles) > 1:
+            _, evicted = self._tiles.popitem(last=False)
+            self.nbytes -= evicted.nbytes
+
+    def clear(self):
+        """
+        Drops every cached tile.
+        """
+        self._tiles.clear()
+        self.nbytes = 0
+
+    def __contains__(self, key) -> bool:
+        return key in self._tiles
+
+    def __len__(self) -> int:
+        return len(self._tiles)
 
 
 class JuliaEffect(BaseEffect):
     """
     Class for generating a julia effect.
+
+    With ``zoom`` enabled the effect animates a zoom towards ``zoom_target``
+    (reversing at ``max_zoom``) over a Julia or Mandelbrot set. Computed tiles
+    are kept in a :class:`FractalTileCache`, so only newly exposed tiles are
+    computed each frame and reversing a zoom reuses earlier work.
     """
 
-    def __init__(self, buffer: Buffer, background: str):
+    def __init__(self, buffer: Buffer, background: str, settings: JuliaSettings = None):
         """
         Initializes the julia effect with a buffer and a background string.
 
         Args:
             buffer (Buffer): Effect buffer to push updates to.
             background (str): character or string to use as the background.
+            settings (JuliaSettings, optional): Configuration for the julia effect. Defaults to None.
+
+        Raises:
+            ValueError: If the fractal is not "julia" or "mandelbrot".
         """
         super(JuliaEffect, self).__init__(buffer, background)
-        self.ascii_chars = "@%#*+=-:. "
-        self.x_min, self.x_max = -1.5, 1.5
-        self.y_min, self.y_max = -1, 1
-        self.max_iter = 20
+        s = settings or JuliaSettings()
+        if s.fractal not in FRACTALS:
+            raise ValueError(f"fractal must be one of {FRACTALS}, got {s.fractal!r}")
+        self.ascii_chars = s.palette
+        self.colors = s.colors
+        self.x_min, self.x_max, self.y_min, self.y_max = s.bounds
+        self.max_iter = s.max_iter
+        self.c = s.c
+        self.smooth = s.smooth
+        self.single_precision = s.single_precision
+        self.fractal = s.fractal
         self.tick = 0
         self.tick_delta = 1
         self.max_tick = 100
         self.min_tick = -200
+        self._grid = None
+        self._grid_key = None
+        self._palette = None
+
+        self.zoom = s.zoom
+        self.zoom_target = complex(*s.zoom_target)
+        self.zoom_speed = s.zoom_speed
+        self.max_zoom = s.max_zoom
+        self.pan_speed = s.pan_speed
+        self.tile_size = s.tile_size
+        self.tile_cache = FractalTileCache(int(s.tile_cache_mb * 2**20))
+        self.center = complex(
+            (self.x_min + self.x_max) / 2, (self.y_min + self.y_max) / 2
+        )
+        self.magnification = 1.0
+        self._zoom_direction = 1
+        self._tile_params = None
+        self._progressive = ProgressiveField()
+        self._progressive_key = None
+
+    def _build_palette(self):
+        """
+        Builds the lookup table from normalized escape values to (colored) glyphs.
+        """
+        if self.colors:
+            if len(self.colors) != len(self.ascii_chars):
+                raise ValueError(
+                    f"expected {len(self.ascii_chars)} colors, got {len(self.colors)}"
+                )
+            glyphs = [
+                bruhcolored(ch, color=color).colored
+                for ch, color in zip(self.ascii_chars, self.colors)
+            ]
+        else:
+            glyphs = list(self.ascii_chars)
+        self._palette = np.array(glyphs, dtype=object)
+
+    def _complex_grid(self) -> np.ndarray:
+        """
+        Returns the flattened grid of starting points for the current screen
+        size, bounds and precision, rebuilding it only when one of them changes.
+        """
+        dtype = np.complex64 if self.single_precision else np.complex128
+        key = (
+            self.buffer.width(),
+            self.buffer.height(),
+            self.x_min,
+            self.x_max,
+            self.y_min,
+            self.y_max,
+            dtype,
+        )
+        if key != self._grid_key:
+            x_range = np.linspace(self.x_min, self.x_max, self.buffer.width())
+            y_range = np.linspace(self.y_min, self.y_max, self.buffer.height())
+            grid = x_range[None, :] + 1j * y_range[:, None]
+            self._grid = grid.astype(dtype).ravel()
+            self._grid_key = key
+        return self._grid
 
     def update_tick(self):
         """
@@ -68,18 +266,200 @@ class JuliaEffect(BaseEffect):
             np.ndarray: A 2D numpy array with values normalized to range [0, 1],
                         representing the iterative depth of each point in the set.
         """
-        x_range = np.linspace(self.x_min, self.x_max, self.buffer.width())
-        y_range = np.linspace(self.y_min, self.y_max, self.buffer.height())
-        result = np.empty((self.buffer.height(), self.buffer.width()), dtype="float32")
-        for i in range(self.buffer.width()):
-            for j in range(self.buffer.height()):
-                z = complex(x_range[i], y_range[j])
-                iteration = 0
-                while abs(z) < 2 and iteration < self.max_iter:
-                    z = z * z + c
-                    iteration += 1
-                result[j, i] = iteration / self.max_iter
-        return result
+        result = escape_time(self._complex_grid(), c, self.max_iter, self.smooth)
+        return result.reshape(self.buffer.height(), self.buffer.width())
+
+    def mandelbrot(self):
+        """
+        Computes the Mandelbrot set over the current bounds.
+
+        Returns:
+            np.ndarray: A 2D numpy array with values normalized to range [0, 1],
+                        representing the iterative depth of each point in the set.
+        """
+        grid = self._complex_grid()
+        result = escape_time(np.zeros_like(grid), grid, self.max_iter, self.smooth)
+        return result.reshape(self.buffer.height(), self.buffer.width())
+
+    def render_progressive(self, c=None) -> np.ndarray:
+        """
+        Computes the julia set for c, or the mandelbrot set when c is None,
+        coarse-to-fine within the frame budget. Refinement carries over between
+        frames for as long as the set being drawn stays the same.
+
+        Args:
+            c (complex, optional): The julia constant. Defaults to None.
+
+        Returns:
+            np.ndarray: A 2D numpy array with values normalized to range [0, 1].
+        """
+        grid = self._complex_grid()
+        key = (self._grid_key, c, self.max_iter, self.smooth)
+        if key != self._progressive_key:
+            self._progressive.reset()
+            self._progressive_key = key
+
+        width = self.buffer.width()
+
+        def sample(ys, xs):
+            points = grid[ys * width + xs]
+            if c is None:
+                return escape_time(
+                    np.zeros_like(points), points, self.max_iter, self.smooth
+                )
+            return escape_time(points, c, self.max_iter, self.smooth)
+
+        return self._progressive.render(
+            (self.buffer.height(), width),
+            sample,
+            self.frame_budget,
+            dtype=np.float32 if self.single_precision else np.float64,
+        )
+
+    def _compute_tiles(self, keys) -> list[np.ndarray]:
+        """
+        Computes the given tiles in a single batched escape-time pass.
+
+        Args:
+            keys (list[tuple]): Tile keys of the form (c, level, tx, ty).
+
+        Returns:
+            list[np.ndarray]: One tile_size x tile_size array per key.
+        """
+        size = self.tile_size
+        dtype = np.complex64 if self.single_precision else np.complex128
+        offsets = np.arange(size)
+        points = np.empty((len(keys), size, size), dtype=dtype)
+        for n, (_, level, tx, ty) in enumerate(keys):
+            dx, dy = self._base_dx / 2.0**level, self._base_dy / 2.0**level
+            xs = (tx * size + offsets) * dx
+            ys = (ty * size + offsets) * dy
+            points[n] = xs[None, :] + 1j * ys[:, None]
+
+        points = points.ravel()
+        if self.fractal == "mandelbrot":
+            values = escape_time(
+                np.zeros_like(points), points, self.max_iter, self.smooth
+            )
+        else:
+            values = escape_time(points, self.c, self.max_iter, self.smooth)
+        return list(values.astype(np.float32).reshape(len(keys), size, size))
+
+    def render_zoom(self) -> np.ndarray:
+        """
+        Computes the current zoom viewport from cached tiles.
+
+        The tile level is the shallowest whose pixel spacing is at least as fine
+        as the screen's, and each screen pixel samples its nearest tile pixel.
+
+        Returns:
+            np.ndarray: A 2D numpy array with values normalized to range [0, 1].
+        """
+        width, height = self.buffer.width(), self.buffer.height()
+        params = (width, height, self.max_iter, self.smooth, self.single_precision)
+        if params != self._tile_params:
+            self._base_dx = (self.x_max - self.x_min) / max(1, width - 1)
+            self._base_dy = (self.y_max - self.y_min) / max(1, height - 1)
+            self.tile_cache.clear()
+            self._tile_params = params
+
+        size = self.tile_size
+        level = max(0, math.ceil(math.log2(self.magnification) - 1e-9))
+        scale = 2.0**level
+        cols = self.center.real + (np.arange(width) - (width - 1) / 2) * (
+            self._base_dx / self.magnification
+        )
+        rows = self.center.imag + (np.arange(height) - (height - 1) / 2) * (
+            self._base_dy / self.magnification
+        )
+        ii = np.rint(cols / (self._base_dx / scale)).astype(np.int64)
+        jj = np.rint(rows / (self._base_dy / scale)).astype(np.int64)
+        tx0, tx1 = int(ii[0]) // size, int(ii[-1]) // size
+        ty0, ty1 = int(jj[0]) // size, int(jj[-1]) // size
+
+        c_key = None if self.fractal == "mandelbrot" else self.c
+        mosaic = np.empty(((ty1 - ty0 + 1) * size, (tx1 - tx0 + 1) * size), np.float32)
+        missing = []
+        for ty in range(ty0, ty1 + 1):
+            for tx in range(tx0, tx1 + 1):
+                key = (c_key, level, tx, ty)
+                tile = self.tile_cache.get(key)
+                if tile is None:
+                    missing.append(key)
+                    continue
+                y0, x0 = (ty - ty0) * size, (tx - tx0) * size
+                mosaic[y0 : y0 + size, x0 : x0 + size] = tile
+
+        if missing:
+            for key, tile in zip(missing, self._compute_tiles(missing)):
+                self.tile_cache.put(key, tile)
+                y0, x0 = (key[3] - ty0) * size, (key[2] - tx0) * size
+                mosaic[y0 : y0 + size, x0 : x0 + size] = tile
+
+        return mosaic[np.ix_(jj - ty0 * size, ii - tx0 * size)]
+
+    def update_zoom(self):
+        """
+        Advances the zoom animation: pans the center towards the target and
+        zooms in (or back out once max_zoom is reached).
+        """
+        self.center = self.zoom_target + (self.center - self.zoom_target) * (
+            1 - self.pan_speed
+        )
+        self.magnification *= self.zoom_speed**self._zoom_direction
+        if self.magnification >= self.max_zoom:
+            self.magnification = self.max_zoom
+            self._zoom_direction = -1
+        elif self.magnification <= 1:
+            self.magnification = 1.0
+            self._zoom_direction = 1
+
+    def frame_key(self, frame_number: int):
+        """
+        Returns the tick the julia set is drawn at, which oscillates between
+        min_tick and max_tick. The mandelbrot set never changes. Zooming and
+        progressive frames aren't cached.
+
+        Args:
+            frame_number (int): The current frame number.
+        """
+        if self.zoom or self.frame_budget is not None:
+            return None
+        params = (
+            self.x_min,
+            self.x_max,
+            self.y_min,
+            self.y_max,
+            self.max_iter,
+            self.smooth,
+            self.single_precision,
+        )
+        if self.fractal == "mandelbrot":
+            return ("mandelbrot", params)
+        return ("julia", self.c, self.tick, params)
+
+    def frames_until_change(self, frame_number: int):
+        """
+        The mandelbrot set stays the same once it is fully drawn.
+
+        Args:
+            frame_number (int): The frame that was just rendered.
+        """
+        if self.zoom or self.fractal != "mandelbrot":
+            return 1
+        if self.frame_budget is not None and not self._progressive.complete:
+            return 1
+        return INF
+
+    def skip_frame(self, frame_number: int):
+        """
+        Advances the tick without computing the set.
+
+        Args:
+            frame_number (int): The current frame number.
+        """
+        if not self.zoom and self.fractal != "mandelbrot":
+            self.update_tick()
 
     def render_frame(self, frame_number: int):
         """
@@ -88,12 +468,22 @@ class JuliaEffect(BaseEffect):
         Args:
             frame_number (int): The current frame number.
         """
-        buffer = self.julia(complex(0.355 + 0.01 * self.tick, 0.355))
-        for y in range(self.buffer.height()):
-            for x in range(self.buffer.width()):
-                self.buffer.put_char(
-                    x,
-                    y,
-                    self.ascii_chars[int(buffer[y][x] * (len(self.ascii_chars) - 1))],
-                )
-        self.update_tick()
+        if self._palette is None:
+            self._build_palette()
+        if self.zoom:
+            values = self.render_zoom()
+            self.update_zoom()
+        elif self.fractal == "mandelbrot":
+            if self.frame_budget is None:
+                values = self.mandelbrot()
+            else:
+                values = self.render_progressive()
+        else:
+            c = self.c + 0.01 * self.tick
+            if self.frame_budget is None:
+                values = self.julia(c)
+            else:
+                values = self.render_progressive(c)
+            self.update_tick()
+        indices = (values * (len(self._palette) - 1)).astype(np.intp)
+        self.buffer.put_block(0, 0, np.take(self._palette, indices).tolist())
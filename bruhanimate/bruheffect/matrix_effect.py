@@ -14,9 +14,9 @@ See the License for the specific language governing permissions and
 limitations under the License.
 """
 
-import random
 import string
 
+import numpy as np
 from bruhcolor import bruhcolored
 
 from ..bruhutil import Buffer
@@ -27,6 +27,10 @@ from .settings import MatrixSettings
 class MatrixEffect(BaseEffect):
     """
     Effect to mimic the classic cascading random-character terminal background.
+
+    Each row keeps its own character and color state: rows randomly swap out
+    some of their characters, and randomly shift their color gradient one
+    cell along, which is when the row is redrawn.
     """
 
     def __init__(
@@ -79,27 +83,27 @@ class MatrixEffect(BaseEffect):
             254,
             255,
         ]
-        self.__gradient = [
-            color
-            for color in self.__base_gradient
-            for _ in range(self.__gradient_length)
-        ]
-        self.__character_halts = [
-            random.randint(
-                self.__character_halt_range[0], self.__character_halt_range[1]
-            )
-            for _ in range(self.buffer.height())
-        ]
-        self.__color_halts = [
-            random.randint(self.__color_halt_range[0], self.__color_halt_range[1])
-            for _ in range(self.buffer.height())
-        ]
-        self.__character_frame_numbers = [0 for _ in range(self.buffer.height())]
-        self.__color_frame_numbers = [0 for _ in range(self.buffer.height())]
-        self.__buffer_characters = [
-            [" " for _ in range(self.buffer.width())]
-            for _ in range(self.buffer.height())
-        ]
+
+        height, width = self.buffer.height(), self.buffer.width()
+        self.__rng = np.random.default_rng()
+        self.__columns = np.arange(width)
+        # Index of each cell's character in the character choices
+        self.__buffer_characters = np.zeros((height, width), dtype=np.intp)
+        self.__character_frame_numbers = np.zeros(height, dtype=np.int64)
+        self.__color_frame_numbers = np.zeros(height, dtype=np.int64)
+        self.__glyphs_key = None
+        self.__glyphs = None
+        self.__randomize_halts()
+
+    def __randomize_halts(self):
+        """
+        Picks how many frames each row waits between character and color updates.
+        """
+        height = self.buffer.height()
+        low, high = self.__character_halt_range
+        self.__character_halts = self.__rng.integers(low, high + 1, height)
+        low, high = self.__color_halt_range
+        self.__color_halts = self.__rng.integers(low, high + 1, height)
 
     def set_properties(
         self,
@@ -127,21 +131,7 @@ class MatrixEffect(BaseEffect):
         self.__character_halt_range = character_halt_range
         self.__color_halt_range = color_halt_range
         self.__gradient_length = gradient_length
-        self.__gradient = [
-            color
-            for color in self.__base_gradient
-            for _ in range(self.__gradient_length)
-        ]
-        self.__character_halts = [
-            random.randint(
-                self.__character_halt_range[0], self.__character_halt_range[1]
-            )
-            for _ in range(self.buffer.height())
-        ]
-        self.__color_halts = [
-            random.randint(self.__color_halt_range[0], self.__color_halt_range[1])
-            for _ in range(self.buffer.height())
-        ]
+        self.__randomize_halts()
 
     def set_gradient(self, gradient: list[int]):
         """
@@ -151,11 +141,6 @@ class MatrixEffect(BaseEffect):
             gradient (list[int]): List of 256-color indices to use.
         """
         self.__base_gradient = gradient
-        self.__gradient = [
-            color
-            for color in self.__base_gradient
-            for _ in range(self.__gradient_length)
-        ]
 
     def get_gradient(self) -> list[int]:
         """
@@ -166,19 +151,45 @@ class MatrixEffect(BaseEffect):
         """
         return self.__base_gradient
 
+    def __glyph_lut(self) -> np.ndarray:
+        """
+        Returns the colored glyph for every (character, base gradient color)
+        pair, flattened, rebuilding the table only when the gradient changes.
+        """
+        key = tuple(self.__base_gradient)
+        if key != self.__glyphs_key:
+            self.__glyphs = np.array(
+                [
+                    bruhcolored(char, color=color).colored
+                    for char in self.__character_choices
+                    for color in self.__base_gradient
+                ],
+                dtype=object,
+            )
+            self.__glyphs_key = key
+        return self.__glyphs
+
+    def __draw_rows(self, rows: np.ndarray):
+        """
+        Redraws the given rows with their characters and gradient offsets.
+        """
+        glyphs = self.__glyph_lut()
+        colors = len(self.__base_gradient)
+        gradient_size = colors * self.__gradient_length
+        shades = (
+            (self.__columns - self.__color_frame_numbers[rows, np.newaxis])
+            % gradient_size
+        ) // self.__gradient_length
+        indices = self.__buffer_characters[rows] * colors + shades
+        for y, row in zip(rows.tolist(), glyphs[indices].tolist()):
+            self.buffer.put_block(0, y, [row])
+
     def __initialize_buffer(self):
-        for y in range(self.buffer.height()):
-            for x in range(self.buffer.width()):
-                self.__buffer_characters[y][x] = random.choice(self.__character_choices)
-            for x in range(self.buffer.width()):
-                self.buffer.put_char(
-                    x,
-                    y,
-                    bruhcolored(
-                        self.__buffer_characters[y][x],
-                        self.__gradient[x % len(self.__gradient)],
-                    ).colored,
-                )
+        self.__buffer_characters[...] = self.__rng.integers(
+            0, len(self.__character_choices), self.__buffer_characters.shape
+        )
+        self.__color_frame_numbers.fill(0)
+        self.__draw_rows(np.arange(self.buffer.height()))
 
     def render_frame(self, frame_number: int):
         """
@@ -186,36 +197,35 @@ class MatrixEffect(BaseEffect):
 
         Args:
             frame_number (int): The current frame number.
+
+        Returns:
+            list[int] | None: The rows that were redrawn, or None on the first frame.
         """
         if frame_number == 0:
             self.__initialize_buffer()
-        else:
-            for y in range(self.buffer.height()):
-                if (
-                    frame_number % self.__character_halts[y] == 0
-                    and random.random() < self.__character_randomness_one
-                ):
-                    self.__character_frame_numbers[y] += 1
-                    for x in range(self.buffer.width()):
-                        if random.random() < self.__character_randomness_two:
-                            self.__buffer_characters[y][x] = random.choice(
-                                self.__character_choices
-                            )
-
-                if (
-                    frame_number % self.__color_halts[y] == 0
-                    and random.random() < self.__color_randomness
-                ):
-                    self.__color_frame_numbers[y] += 1
-                    for x in range(self.buffer.width()):
-                        self.buffer.put_char(
-                            x,
-                            y,
-                            bruhcolored(
-                                self.__buffer_characters[y][x],
-                                color=self.__gradient[
-                                    (x - self.__color_frame_numbers[y])
-                                    % len(self.__gradient)
-                                ],
-                            ),
-                        )
+            return None
+
+        height, width = self.__buffer_characters.shape
+        rng = self.__rng
+        rows = np.flatnonzero(
+            (frame_number % self.__character_halts == 0)
+            & (rng.random(height) < self.__character_randomness_one)
+        )
+        if rows.size:
+            self.__character_frame_numbers[rows] += 1
+            changed = rng.random((rows.size, width)) < self.__character_randomness_two
+            characters = self.__buffer_characters[rows]
+            characters[changed] = rng.integers(
+                0, len(self.__character_choices), np.count_nonzero(changed)
+            )
+            self.__buffer_characters[rows] = characters
+
+        # Rows only show their new characters when their colors shift
+        rows = np.flatnonzero(
+            (frame_number % self.__color_halts == 0)
+            & (rng.random(height) < self.__color_randomness)
+        )
+        if rows.size:
+            self.__color_frame_numbers[rows] += 1
+            self.__draw_rows(rows)
+        return rows.tolist()
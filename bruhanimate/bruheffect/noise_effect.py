@@ -14,8 +14,7 @@ See the License for the specific language governing permissions and
 limitations under the License.
 """
 
-import random
-
+import numpy as np
 from bruhcolor import bruhcolored
 
 from ..bruhutil import Buffer
@@ -46,6 +45,9 @@ class NoiseEffect(BaseEffect):
 
         self.noise = " !@#$%^&*()_+1234567890-=~`qazwsxedcrfvtgbyhnujmik,ol.p;/[']\\QAZXSWEDCVFRTGBNHYUJM<KIOL>?:P{\"}|"
         self.noise_length = len(self.noise)
+        self._rng = np.random.default_rng()
+        self._glyphs_key = None
+        self._glyphs = None
 
     def set_intensity(self, intensity: int):
         """
@@ -69,40 +71,42 @@ class NoiseEffect(BaseEffect):
         self.color = color
         self.characters = characters
 
+    def _glyph_lut(self) -> np.ndarray:
+        """
+        Returns every glyph the noise can draw, one per (character, color)
+        pair, rebuilding the table only when the characters or mode change.
+
+        Returns:
+            np.ndarray: A flat object array of glyph strings.
+        """
+        key = (self.noise, self.color, self.characters)
+        if key != self._glyphs_key:
+            if not self.color:
+                glyphs = list(self.noise)
+            else:
+                chars = self.noise if self.characters else " "
+                glyphs = [
+                    bruhcolored(char, on_color=color).colored
+                    for char in chars
+                    for color in range(256)
+                ]
+            self._glyphs = np.array(glyphs, dtype=object)
+            self._glyphs_key = key
+        return self._glyphs
+
     def render_frame(self, frame_number: int):
         """
         Renders a frame of the noise effect.
 
+        Each cell is hit with probability intensity and gets a random glyph
+        from the table; every other cell keeps what it showed before.
+
         Args:
             frame_number (int): The current frame number.
         """
-        if self.color:
-            for y in range(self.buffer.height()):
-                for x in range(self.buffer.width()):
-                    if random.random() < self.intensity:
-                        if self.characters:
-                            self.buffer.put_char(
-                                x,
-                                y,
-                                bruhcolored(
-                                    self.noise[
-                                        random.randint(0, self.noise_length - 1)
-                                    ],
-                                    on_color=random.randint(0, 255),
-                                ).colored,
-                            )
-                        else:
-                            self.buffer.put_char(
-                                x,
-                                y,
-                                bruhcolored(
-                                    " ", on_color=random.randint(0, 255)
-                                ).colored,
-                            )
-        else:
-            for y in range(self.buffer.height()):
-                for x in range(self.buffer.width()):
-                    if random.random() < self.intensity:
-                        self.buffer.put_char(
-                            x, y, self.noise[random.randint(0, self.noise_length - 1)]
-                        )
+        glyphs = self._glyph_lut()
+        hits = self._rng.random((self.buffer.height(), self.buffer.width()))
+        hits = hits < self.intensity
+        cells = np.array(self.buffer.buffer, dtype=object)
+        cells[hits] = glyphs[self._rng.integers(0, glyphs.size, np.count_nonzero(hits))]
+        self.buffer.put_block(0, 0, cells.tolist())
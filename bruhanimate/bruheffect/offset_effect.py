@@ -14,7 +14,7 @@ See the License for the specific language governing permissions and
 limitations under the License.
 """
 
-from ..bruhutil import VALID_DIRECTIONS
+from ..bruhutil import INF, VALID_DIRECTIONS
 from ..bruhutil.bruhffer import Buffer
 from .base_effect import BaseEffect
 from .settings import OffsetSettings
@@ -51,6 +51,24 @@ class OffsetEffect(BaseEffect):
             self.direction = direction
             self.buffer.clear_buffer()
 
+    def frame_key(self, frame_number: int):
+        """
+        The pattern only depends on the direction and background.
+
+        Args:
+            frame_number (int): The current frame number.
+        """
+        return (self.direction, self.background)
+
+    def frames_until_change(self, frame_number: int):
+        """
+        The background never changes on its own.
+
+        Args:
+            frame_number (int): The frame that was just rendered.
+        """
+        return INF
+
     def render_frame(self, frame_number: int):
         """
         Renders a frame of the offset effect.
@@ -17,10 +17,12 @@ limitations under the License.
 import math
 import random
 
+import numpy as np
 from bruhcolor import bruhcolored
 
 from ..bruhutil import GREY_SCALES, PLASMA_COLORS, Buffer
 from .base_effect import BaseEffect
+from .progressive import ProgressiveField
 from .settings import PlasmaSettings
 
 
@@ -46,11 +48,21 @@ class PlasmaEffect(BaseEffect):
         self.random_colors = s.random_colors
         self.color = s.color
         self.characters = s.characters
+        self.palette_cycle = s.palette_cycle
+        self.cycle_speed = s.cycle_speed
+        self.cycle_refresh = s.cycle_refresh
         self.scale = random.choice(GREY_SCALES)
         self.colors = PLASMA_COLORS[len(self.scale)][0]
         self.t = 0
         self.vals = [random.randint(1, 100) for _ in range(4)]
         self._colored_cache = None
+        self._palette = None
+        self._grid_size = None
+        self._static_field = None
+        self._cycle_base = None
+        self._cycle_palette = None
+        self._cycle_generation = 0
+        self._progressive = ProgressiveField()
 
     def _build_cache(self):
         if self.color:
@@ -66,6 +78,58 @@ class PlasmaEffect(BaseEffect):
                 ]
         else:
             self._colored_cache = list(self.scale)
+        self._palette = np.array(self._colored_cache, dtype=object)
+        # Ping-pong through the scale so the cycle has no hard wrap-around
+        n = len(self._colored_cache)
+        self._cycle_palette = self._palette[
+            np.concatenate((np.arange(n), np.arange(n - 2, 0, -1)))
+        ]
+        self._cycle_base = None
+
+    def _build_grids(self):
+        """
+        Precomputes the per-axis offsets of each wave's anchor point and the
+        sum of the two time-invariant waves for the current screen size.
+        """
+        w, h = self.buffer.width(), self.buffer.height()
+        self._grid_size = (h, w)
+        xs = np.arange(w, dtype=np.float64)
+        ys = np.arange(h, dtype=np.float64)[:, None]
+
+        # Waves 0 and 2 move with t along x and y respectively
+        self._dx0 = xs - w * (1 / 4)
+        self._dy0_sq = 4 * (ys - h * (1 / 3)) ** 2
+        self._dx2_sq = (xs - w * (1 / 2)) ** 2
+        self._dy2 = ys - h * (1 / 5)
+
+        self._field = np.empty((h, w), dtype=np.float64)
+        self._scratch = np.empty((h, w), dtype=np.float64)
+        self._indices = np.empty((h, w), dtype=np.intp)
+        self._static_field = None
+        self._cycle_base = None
+
+    def _build_static_field(self):
+        """
+        Computes the sum of waves 1 and 3, which don't depend on t.
+        """
+        h, w = self._grid_size
+        xs = np.arange(w, dtype=np.float64)
+        ys = np.arange(h, dtype=np.float64)[:, None]
+        self._static_field = self._wave_field(
+            (xs - w * (1 / 8)) ** 2, 4 * (ys - h * (1 / 5)) ** 2, self.vals[1]
+        ) + self._wave_field(
+            (xs - w * (3 / 4)) ** 2, 4 * (ys - h * (4 / 5)) ** 2, self.vals[3]
+        )
+
+    @staticmethod
+    def _wave_field(dx_sq, dy_sq, n, out=None):
+        """
+        Evaluates a radial sine wave over a grid from its squared axis offsets.
+        """
+        out = np.add(dx_sq, dy_sq, out=out)
+        np.sqrt(out, out=out)
+        np.multiply(out, math.pi / n, out=out)
+        return np.sin(out, out=out)
 
     def set_show_info(self, visible: bool):
         """
@@ -134,6 +198,21 @@ class PlasmaEffect(BaseEffect):
         self.colors = colors
         self._colored_cache = None
 
+    def set_palette_cycle(self, enabled: bool, speed: int = 1, refresh: int = 0):
+        """
+        Toggles palette cycling, where the plasma field is computed once and
+        animated by rotating the colored scale through it.
+
+        Args:
+            enabled (bool): Whether to animate by palette cycling.
+            speed (int, optional): Palette steps to advance per frame. Defaults to 1.
+            refresh (int, optional): Recompute the field every this many frames, 0 for never. Defaults to 0.
+        """
+        self.palette_cycle = enabled
+        self.cycle_speed = speed
+        self.cycle_refresh = refresh
+        self._cycle_base = None
+
     def set_background(self, background: str):
         """
         Updates the background character or string.
@@ -155,12 +234,44 @@ class PlasmaEffect(BaseEffect):
             d (int): Fourth frequency value.
         """
         self.vals = [a, b, c, d]
+        self._static_field = None
+        self._cycle_base = None
 
     def shuffle_plasma_values(self):
         """
         Randomizes the four plasma frequency values.
         """
         self.vals = [random.randint(1, 50) for _ in range(4)]
+        self._static_field = None
+        self._cycle_base = None
+
+    def frame_key(self, frame_number: int):
+        """
+        While palette cycling, frames repeat every full turn of the palette, so
+        the key is the palette offset. Other frames aren't cached.
+
+        Args:
+            frame_number (int): The current frame number.
+        """
+        t = self.t + 1
+        if (
+            not self.palette_cycle
+            or self._cycle_base is None
+            or self._colored_cache is None
+            or (self.cycle_refresh > 0 and t % self.cycle_refresh == 0)
+        ):
+            return None
+        offset = t * self.cycle_speed % len(self._cycle_palette)
+        return (self._cycle_generation, offset, self.show_info)
+
+    def skip_frame(self, frame_number: int):
+        """
+        Advances time without rendering.
+
+        Args:
+            frame_number (int): The current frame number.
+        """
+        self.t += 1
 
     def render_frame(self, frame_number: int):
         """
@@ -173,47 +284,90 @@ class PlasmaEffect(BaseEffect):
         if self._colored_cache is None:
             self._build_cache()
 
-        cache = self._colored_cache
-        scale_max = len(self.scale) - 1
-        t3 = self.t / 3.0
-
-        for y in range(self.buffer.height()):
-            for x in range(self.buffer.width()):
-                value = (
-                    abs(
-                        self._wave(x + t3, y, 1 / 4, 1 / 3, self.vals[0])
-                        + self._wave(x, y, 1 / 8, 1 / 5, self.vals[1])
-                        + self._wave(x, y + t3, 1 / 2, 1 / 5, self.vals[2])
-                        + self._wave(x, y, 3 / 4, 4 / 5, self.vals[3])
-                    )
-                    / 4.0
+        if self._grid_size != (self.buffer.height(), self.buffer.width()):
+            self._build_grids()
+        if self._static_field is None:
+            self._build_static_field()
+
+        if self.palette_cycle:
+            self._render_cycle()
+        else:
+            t3 = self.t / 3.0
+            if self.frame_budget is None:
+                self._compute_field(t3)
+                field = self._field
+            else:
+                # Every frame moves the plasma, so refinement starts over each time
+                self._progressive.reset()
+                field = self._progressive.render(
+                    self._grid_size,
+                    lambda ys, xs: self._sample_field(ys, xs, t3),
+                    self.frame_budget,
                 )
-                self.buffer.put_char(x, y, cache[int(scale_max * value)])
+            np.multiply(field, len(self.scale) - 1, out=self._field)
+            np.copyto(self._indices, self._field, casting="unsafe")
+            self.buffer.put_block(0, 0, np.take(self._palette, self._indices).tolist())
 
         if self.show_info:
             self.buffer.put_at(0, 0, f"COLORS: {' '.join(str(v) for v in self.colors)}")
             for i in range(1, 5):
                 self.buffer.put_at(0, i, f"VAL {i}: {self.vals[i - 1]:>3d}")
 
-    def _wave(self, x: float, y: float, a: float, b: float, n: float) -> float:
+    def _compute_field(self, t3: float):
         """
-        Sine wave radially projected from a point on the screen.
+        Fills the field buffer with the plasma value (0 to 1) of every cell at time t3.
 
         Args:
-            x (float): Horizontal position.
-            y (float): Vertical position.
-            a (float): Horizontal anchor fraction of screen width.
-            b (float): Vertical anchor fraction of screen height.
-            n (float): Frequency divisor.
+            t3 (float): The time offset applied to the moving waves.
+        """
+        field, scratch = self._field, self._scratch
+        self._wave_field((self._dx0 + t3) ** 2, self._dy0_sq, self.vals[0], out=field)
+        self._wave_field(
+            self._dx2_sq, 4 * (self._dy2 + t3) ** 2, self.vals[2], out=scratch
+        )
+        field += scratch
+        field += self._static_field
+        np.abs(field, out=field)
+        field *= 1 / 4.0
+
+    def _sample_field(self, ys: np.ndarray, xs: np.ndarray, t3: float) -> np.ndarray:
+        """
+        Evaluates the plasma value (0 to 1) of the given cells at time t3.
+
+        Args:
+            ys (np.ndarray): Row index of each cell.
+            xs (np.ndarray): Column index of each cell.
+            t3 (float): The time offset applied to the moving waves.
 
         Returns:
-            float: Sine value at (x, y).
+            np.ndarray: The plasma value of each cell.
         """
-        return math.sin(
-            math.sqrt(
-                (x - self.buffer.width() * a) ** 2
-                + 4 * (y - self.buffer.height() * b) ** 2
-            )
-            * math.pi
-            / n
+        field = self._wave_field(
+            (self._dx0[xs] + t3) ** 2, self._dy0_sq[ys, 0], self.vals[0]
         )
+        field += self._wave_field(
+            self._dx2_sq[xs], 4 * (self._dy2[ys, 0] + t3) ** 2, self.vals[2]
+        )
+        field += self._static_field[ys, xs]
+        np.abs(field, out=field)
+        field *= 1 / 4.0
+        return field
+
+    def _render_cycle(self):
+        """
+        Renders a palette-cycling frame: the field's palette phase is computed
+        once (or every cycle_refresh frames) and each frame only offsets it.
+        """
+        period = len(self._cycle_palette)
+        refresh = self.cycle_refresh > 0 and self.t % self.cycle_refresh == 0
+        if self._cycle_base is None or refresh:
+            self._compute_field(self.t / 3.0)
+            field = self._field
+            field *= period
+            self._cycle_base = np.minimum(field.astype(np.intp), period - 1)
+            self._cycle_generation += 1
+
+        indices = self._indices
+        np.add(self._cycle_base, self.t * self.cycle_speed, out=indices)
+        np.remainder(indices, period, out=indices)
+        self.buffer.put_block(0, 0, np.take(self._cycle_palette, indices).tolist())
@@ -0,0 +1,141 @@
+"""
+Copyright 2023 Ethan Christensen
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import time
+
+import numpy as np
+
+DEFAULT_BLOCK_SIZES = (8, 4, 2, 1)
+
+
+class ProgressiveField:
+    """
+    Coarse-to-fine evaluation of a per-cell field under a time budget.
+
+    The field is sampled at the top-left cell of every block, starting with
+    the largest block size, and each sample is drawn over its whole block.
+    Every following block size halves the spacing, so the samples taken at
+    coarser sizes are reused and only the new ones are computed. The coarsest
+    pass always completes; finer passes run one row of blocks at a time until
+    the budget is spent (but at least one row per call) and pick up where they
+    left off on the next call, so a scene that stops changing converges to
+    full detail.
+    """
+
+    def __init__(self, block_sizes: tuple[int, ...] = DEFAULT_BLOCK_SIZES):
+        """
+        Initializes the progressive field.
+
+        Args:
+            block_sizes (tuple[int, ...], optional): Block sizes from coarsest to
+                finest. Each must divide the one before it and the last should be
+                1 to reach full detail. Defaults to (8, 4, 2, 1).
+        """
+        self.block_sizes = block_sizes
+        self.values = None
+        self._samples = None
+        self._known = None
+        self._level = 0
+        self._row = 0
+
+    @property
+    def complete(self) -> bool:
+        """
+        Whether every block size has been fully refined.
+        """
+        return self.values is not None and self._level >= len(self.block_sizes)
+
+    def reset(self):
+        """
+        Discards all samples, so the next render starts over from the coarsest
+        block size. Call whenever the field being sampled changes.
+        """
+        if self._known is not None:
+            self._known.fill(False)
+        self._level = 0
+        self._row = 0
+
+    def render(self, shape, sample, budget: float, dtype=np.float64) -> np.ndarray:
+        """
+        Refines the field for at most budget seconds past the coarsest pass.
+
+        Args:
+            shape (tuple[int, int]): The (height, width) of the field.
+            sample (Callable[[np.ndarray, np.ndarray], np.ndarray]): Returns the
+                field's value at each of the given row and column index arrays.
+            budget (float): Time, in seconds, to spend on the finer passes.
+            dtype (np.dtype, optional): The dtype of the sampled values.
+                Defaults to np.float64.
+
+        Returns:
+            np.ndarray: The (height, width) field at its current level of detail.
+                The array is reused between calls.
+        """
+        if (
+            self.values is None
+            or self.values.shape != shape
+            or self.values.dtype != dtype
+        ):
+            self.values = np.zeros(shape, dtype=dtype)
+            self._samples = np.zeros(shape, dtype=dtype)
+            self._known = np.zeros(shape, dtype=bool)
+            self.reset()
+
+        deadline = time.perf_counter() + budget
+        if self._level == 0:
+            self._render_coarse(sample)
+        elif not self.complete:
+            # Always make some progress, however small the budget
+            self._refine_row(sample)
+        while not self.complete and time.perf_counter() < deadline:
+            self._refine_row(sample)
+        return self.values
+
+    def _render_coarse(self, sample):
+        """
+        Samples and draws the whole field at the coarsest block size.
+        """
+        h, w = self.values.shape
+        size = self.block_sizes[0]
+        ys, xs = np.meshgrid(
+            np.arange(0, h, size), np.arange(0, w, size), indexing="ij"
+        )
+        values = sample(ys.ravel(), xs.ravel()).reshape(ys.shape)
+        self._samples[ys, xs] = values
+        self._known[ys, xs] = True
+        blocks = np.repeat(np.repeat(values, size, axis=0), size, axis=1)
+        self.values[...] = blocks[:h, :w]
+        self._level = 1
+        self._row = 0
+
+    def _refine_row(self, sample):
+        """
+        Samples and draws the next row of blocks at the current block size.
+        """
+        h, w = self.values.shape
+        size = self.block_sizes[self._level]
+        y = self._row
+        xs = np.arange(0, w, size)
+        missing = xs[~self._known[y, xs]]
+        if missing.size:
+            self._samples[y, missing] = sample(np.full(missing.size, y), missing)
+            self._known[y, missing] = True
+        self.values[y : y + size] = np.repeat(self._samples[y, xs], size)[:w]
+
+        self._row += size
+        if self._row >= h:
+            self._level += 1
+            self._row = 0
@@ -16,14 +16,26 @@ limitations under the License.
 
 import random
 
+import numpy as np
+
 from ..bruhutil import WIND_DIRECTIONS, Buffer
 from .base_effect import BaseEffect
+from .image_mask import ImageMask
 from .settings import RainSettings
 
+# Glyph for every ASCII code in the rain field
+_ASCII = np.array([chr(code) for code in range(128)], dtype=object)
+_SPACE = ord(" ")
+_SPLASH = ord("v")
+
 
 class RainEffect(BaseEffect):
     """
     Effect to simulate the look of rain.
+
+    The rain is kept as an array of ASCII codes used as a ring buffer: falling
+    and drifting with the wind only move the row and column offsets where the
+    field starts, and each frame writes a single new row of drops.
     """
 
     def __init__(self, buffer: Buffer, background: str, settings: RainSettings = None):
@@ -55,6 +67,11 @@ class RainEffect(BaseEffect):
         self.lightning = s.lightning
         self.lightning_chance = s.lightning_chance
         self._bolts = []  # list of (cells, frames_remaining)
+        self._rng = np.random.default_rng()
+        self._field = np.full((buffer.height(), buffer.width()), _SPACE, dtype=np.uint8)
+        self._top = 0
+        self._left = 0
+        self._image_mask = ImageMask()
         self._set_rain()
 
     def set_multiplier(self, val: int):
@@ -136,6 +153,11 @@ class RainEffect(BaseEffect):
         if self.intensity > 500:
             self.rain += self.wind_mappings[self.wind_direction][0]
         self.rain_length = len(self.rain)
+        self._rain_codes = np.frombuffer(self.rain.encode("ascii"), dtype=np.uint8)
+        self._drop_codes = np.array(
+            [ord(char) for char in self.wind_mappings[self.wind_direction][2]],
+            dtype=np.uint8,
+        )
 
     def update_collision(
         self,
@@ -173,6 +195,57 @@ class RainEffect(BaseEffect):
         else:
             self.image_buffer = None
 
+    def _field_indices(self) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Returns the field's row and column indices of every screen row and column.
+        """
+        h, w = self._field.shape
+        return (
+            (self._top + np.arange(h))[:, np.newaxis] % h,
+            (self._left + np.arange(w)) % w,
+        )
+
+    def _add_row(self):
+        """
+        Writes a new row of randomly picked rain characters at the top.
+        """
+        w = self._field.shape[1]
+        drops = self._rain_codes[self._rng.integers(0, self.rain_length, w)]
+        self._field[self._top, (self._left + np.arange(w)) % w] = drops
+
+    def _fall(self):
+        """
+        Moves the rain down by the multiplier and sideways with the wind, by
+        moving where the field starts, then adds a new top row.
+        """
+        h = self._field.shape[0]
+        self._left += self.wind_mappings[self.wind_direction][1] * self.multiplier
+        fall = min(max(self.multiplier, 0), h)
+        self._top = (self._top - fall) % h
+        for y in range(fall):
+            self._field[(self._top + y) % h] = _SPACE
+        self._add_row()
+
+    def _splash(self, rows: np.ndarray, cols: np.ndarray):
+        """
+        Clears last frame's splashes and turns drops that hit the ground, or
+        land on the image's silhouette, into splashes.
+        """
+        view = self._field[rows, cols]
+        cleared = view == _SPLASH
+        landed = np.zeros(view.shape, dtype=bool)
+        if self.image_present and self.image_buffer:
+            self._image_mask.update(self.image_buffer)
+            surface = self._image_mask.surface
+            if surface.size == view.shape[1]:
+                landed = np.arange(view.shape[0])[:, np.newaxis] == surface - 1
+        landed[-1] = True
+        landed &= np.isin(view, self._drop_codes)
+
+        self._field[rows, cols] = np.where(
+            cleared, _SPACE, np.where(landed, _SPLASH, view)
+        )
+
     def render_frame(self, frame_number: int):
         """
         Renders a single frame of the rain effect.
@@ -183,58 +256,22 @@ class RainEffect(BaseEffect):
         if self.swells:
             self.set_intensity(None)
         if frame_number == 0:
-            self.buffer.put_at(
-                0,
-                0,
-                "".join(
-                    self.rain[random.randint(0, self.rain_length - 1)]
-                    for _ in range(self.buffer.width())
-                ),
-            )
+            self._add_row()
         else:
-            self.buffer.shift(
-                self.wind_mappings[self.wind_direction][1] * self.multiplier
-            )
-            self.buffer.scroll(-1 * self.multiplier)
-            self.buffer.put_at(
-                0,
-                0,
-                "".join(
-                    self.rain[random.randint(0, self.rain_length - 1)]
-                    for _ in range(self.buffer.width())
-                ),
-            )
-
+            self._fall()
             if self.collision:
-                for y in range(self.buffer.height()):
-                    for x in range(self.buffer.width()):
-                        if self.buffer.get_char(x, y) == "v":
-                            self.buffer.put_char(x, y, " ")
-                        else:
-                            if self.image_present and self.image_buffer:
-                                if 0 <= y + 1 < self.buffer.height():
-                                    if (
-                                        self.image_buffer.buffer[y + 1][x]
-                                        not in [" ", None]
-                                        and self.buffer.get_char(x, y)
-                                        in self.wind_mappings[self.wind_direction][2]
-                                    ):
-                                        self.buffer.put_char(x, y, "v")
-
-                            if y == self.buffer.height() - 1:
-                                if (
-                                    self.buffer.get_char(x, y)
-                                    in self.wind_mappings[self.wind_direction][2]
-                                ):
-                                    self.buffer.put_char(x, y, "v")
+                self._splash(*self._field_indices())
 
+        rows, cols = self._field_indices()
         if self.lightning:
             if random.random() < self.lightning_chance:
                 self._spawn_bolt()
             next_bolts = []
             for bolt, remaining in self._bolts:
                 for bx, by, ch in bolt:
-                    self.buffer.put_char(bx, by, ch)
+                    self._field[rows[by, 0], cols[bx]] = ord(ch)
                 if remaining > 1:
                     next_bolts.append([bolt, remaining - 1])
             self._bolts = next_bolts
+
+        self.buffer.put_block(0, 0, _ASCII[self._field[rows, cols]].tolist())
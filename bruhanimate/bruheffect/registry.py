@@ -202,6 +202,7 @@ def _populate():
         FireSettings,
         FireworkSettings,
         GameOfLifeSettings,
+        JuliaSettings,
         MatrixSettings,
         NoiseSettings,
         OffsetSettings,
@@ -270,6 +271,7 @@ def _populate():
             "color": PlasmaSettings(color=True, characters=True),
             "blocks": PlasmaSettings(color=True, characters=False),
             "random": PlasmaSettings(color=True, random_colors=True),
+            "cycle": PlasmaSettings(color=True, palette_cycle=True),
         },
     )
     effect_registry.register(
@@ -281,6 +283,12 @@ def _populate():
             "plain": GameOfLifeSettings(decay=False, color=False),
             "decay": GameOfLifeSettings(decay=True, color=False),
             "color": GameOfLifeSettings(decay=True, color=True, color_type="COLOR"),
+            "world": GameOfLifeSettings(
+                decay=True,
+                color_type="RAINBOW",
+                world_size=(4096, 4096),
+                viewport_velocity=(0.5, 0.25),
+            ),
         },
     )
     effect_registry.register(
@@ -381,8 +389,22 @@ def _populate():
     effect_registry.register(
         "julia",
         JuliaEffect,
-        settings_cls=None,
-        description="Animated Julia-set fractal.",
+        settings_cls=JuliaSettings,
+        description="Animated Julia-set fractal, with optional Julia/Mandelbrot zoom.",
+        presets={
+            "default": JuliaSettings(),
+            "smooth": JuliaSettings(max_iter=60, smooth=True),
+            "fast": JuliaSettings(single_precision=True),
+            "zoom": JuliaSettings(max_iter=60, smooth=True, zoom=True),
+            "mandelbrot": JuliaSettings(
+                fractal="mandelbrot",
+                bounds=(-2.5, 1.0, -1.2, 1.2),
+                max_iter=80,
+                smooth=True,
+                zoom=True,
+                zoom_target=(-0.743643887037151, 0.131825904205330),
+            ),
+        },
     )
     effect_registry.register(
         "water",
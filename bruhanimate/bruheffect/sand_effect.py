@@ -20,6 +20,8 @@ import numpy as np
 from bruhcolor import bruhcolored as bc
 
 from ..bruhutil import Buffer
+from ..bruhutil.utils import INF
+from .active_tiles import ActiveTiles
 from .base_effect import BaseEffect
 from .settings import SandSettings
 
@@ -44,6 +46,10 @@ class SandEffect(BaseEffect):
     cascading diagonally when blocked. Color indicates height — hotter
     at the top, cooler toward the bottom. Particles drain from the
     bottom row to keep the simulation flowing indefinitely.
+
+    Only the tiles of the grid where sand moved in the last frame, and the
+    tiles around them, are updated, so settled piles and empty space cost
+    nothing.
     """
 
     def __init__(self, buffer: Buffer, background: str, settings: SandSettings = None):
@@ -56,46 +62,106 @@ class SandEffect(BaseEffect):
         self._w = buffer.width()
         self._h = buffer.height()
         self._grid = np.zeros((self._h, self._w), dtype=np.uint8)
+        self._tiles = ActiveTiles(self._h, self._w)
+        self._row_glyphs = [
+            bc(self.char, color=_heat(1.0 - r / self._h)).colored
+            if self.color
+            else self.char
+            for r in range(self._h)
+        ]
+        self._redraw = True
 
     def set_spawn_rate(self, rate: float):
         """Set the per-column probability of spawning a new particle each frame (0–1)."""
         self.spawn_rate = max(0.0, min(1.0, rate))
 
+    def frames_until_change(self, frame_number: int):
+        """
+        Once nothing spawns and the grid has drained, nothing changes.
+
+        Args:
+            frame_number (int): The frame that was just rendered.
+        """
+        if self.spawn_rate == 0 and self._tiles.idle:
+            return INF
+        return 1
+
+    def _active_cells(self, tile_row: int) -> list[tuple[int, int]]:
+        """
+        Returns the occupied cells in the active tiles of a row of tiles,
+        bottom row first.
+        """
+        cells = []
+        for first, last in self._tiles.runs(tile_row):
+            y0, y1, x0, x1 = self._tiles.bounds(tile_row, first, last)
+            rows, cols = np.nonzero(self._grid[y0:y1, x0:x1])
+            cells.extend(zip((rows + y0).tolist(), (cols + x0).tolist()))
+        cells.sort(key=lambda cell: -cell[0])
+        return cells
+
     def render_frame(self, frame_number: int):
-        self.buffer.clear_buffer(val=self.background)
+        """
+        Advances the sand by one frame and redraws the cells that changed.
+
+        Args:
+            frame_number (int): The current frame number.
+
+        Returns:
+            list[int] | None: The rows that changed, or None if the whole
+                buffer was redrawn.
+        """
+        grid, tiles = self._grid, self._tiles
+        changed = np.zeros(tiles.shape, dtype=bool)
+        moved = []
+
+        def move(r, c):
+            moved.append((r, c))
+            tiles.activate_around(r, c)
+            changed[tiles.tile_of(r, c)] = True
 
         # Drain bottom row so the simulation never stalls
-        self._grid[self._h - 1, :] = 0
+        for c in np.flatnonzero(grid[self._h - 1]).tolist():
+            grid[self._h - 1, c] = 0
+            move(self._h - 1, c)
 
         # Spawn new particles at the top
         for col in range(self._w):
-            if random.random() < self.spawn_rate and self._grid[0, col] == 0:
-                self._grid[0, col] = 1
-
-        # Update: process non-empty cells bottom-to-top
-        occ_r, occ_c = np.where(self._grid > 0)
-        if len(occ_r):
-            order = np.argsort(-occ_r)
-            for idx in order:
-                r, c = int(occ_r[idx]), int(occ_c[idx])
-                if r >= self._h - 1 or self._grid[r, c] == 0:
+            if random.random() < self.spawn_rate and grid[0, col] == 0:
+                grid[0, col] = 1
+                move(0, col)
+
+        # Update: process the active tiles bottom-to-top. Sand moving out of a
+        # cell activates the tiles above it, so a falling column keeps up.
+        for tile_row in range(tiles.shape[0] - 1, -1, -1):
+            for r, c in self._active_cells(tile_row):
+                if r >= self._h - 1 or grid[r, c] == 0:
                     continue
-                if self._grid[r + 1, c] == 0:
-                    self._grid[r, c] = 0
-                    self._grid[r + 1, c] = 1
+                if grid[r + 1, c] == 0:
+                    targets = (c,)
                 else:
-                    dirs = (-1, 1) if random.random() < 0.5 else (1, -1)
-                    for d in dirs:
-                        nc = c + d
-                        if 0 <= nc < self._w and self._grid[r + 1, nc] == 0:
-                            self._grid[r, c] = 0
-                            self._grid[r + 1, nc] = 1
-                            break
+                    targets = (
+                        (c - 1, c + 1) if random.random() < 0.5 else (c + 1, c - 1)
+                    )
+                for nc in targets:
+                    if 0 <= nc < self._w and grid[r + 1, nc] == 0:
+                        grid[r, c] = 0
+                        grid[r + 1, nc] = 1
+                        move(r, c)
+                        move(r + 1, nc)
+                        break
+        tiles.update(changed)
 
         # Draw
-        lit_r, lit_c = np.where(self._grid > 0)
-        for r, c in zip(lit_r, lit_c):
-            ratio = 1.0 - float(r) / self._h
-            color = _heat(ratio) if self.color else None
-            ch = bc(self.char, color=color) if color is not None else self.char
-            self.buffer.put_char(int(c), int(r), ch)
+        if self._redraw:
+            self._redraw = False
+            self.buffer.clear_buffer(val=self.background)
+            lit_r, lit_c = np.nonzero(grid)
+            for r, c in zip(lit_r.tolist(), lit_c.tolist()):
+                self.buffer.put_char(c, r, self._row_glyphs[r])
+            return None
+
+        for r, c in moved:
+            self.buffer.put_char(
+                c, r, self._row_glyphs[r] if grid[r, c] else self.background
+            )
+        return sorted({r for r, _ in moved})
@@ -61,6 +61,28 @@ class GameOfLifeSettings:
     color: bool = False
     color_type: str = "GREYSCALE"
     scale: str = "random"
+    world_size: tuple = None
+    pattern: str = None
+    viewport_velocity: tuple = (0.0, 0.0)
+
+
+@dataclass
+class JuliaSettings:
+    max_iter: int = 20
+    bounds: tuple = (-1.5, 1.5, -1.0, 1.0)
+    palette: str = "@%#*+=-:. "
+    colors: list = None
+    c: complex = complex(0.355, 0.355)
+    smooth: bool = False
+    single_precision: bool = False
+    fractal: str = "julia"
+    zoom: bool = False
+    zoom_target: tuple = (0.0, 0.0)
+    zoom_speed: float = 1.05
+    max_zoom: float = 1e5
+    pan_speed: float = 0.1
+    tile_size: int = 16
+    tile_cache_mb: float = 32.0
 
 
 @dataclass
@@ -90,6 +112,9 @@ class PlasmaSettings:
     characters: bool = True
     random_colors: bool = False
     show_info: bool = False
+    palette_cycle: bool = False
+    cycle_speed: int = 1
+    cycle_refresh: int = 0
 
 
 @dataclass
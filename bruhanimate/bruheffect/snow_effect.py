@@ -14,18 +14,46 @@ See the License for the specific language governing permissions and
 limitations under the License.
 """
 
-import random
-
+import numpy as np
 from bruhcolor import bruhcolored
 
 from ..bruhutil import FLAKE_WEIGHT_CHARS, SNOWFLAKE_COLORS, SNOWFLAKE_TYPES, Buffer
 from .base_effect import BaseEffect
+from .image_mask import ImageMask
 from .settings import SnowSettings
 
+# Accumulated snow this heavy stacks onto the row above
+STACK_WEIGHT = 18
+
+_FLAKE_TYPES = list(SNOWFLAKE_TYPES)
+_FLAKE_SPEEDS = np.array([SNOWFLAKE_TYPES[t]["speed"] for t in _FLAKE_TYPES])
+_FLAKE_GLYPHS = np.array(
+    [bruhcolored(t, SNOWFLAKE_COLORS[t]).colored for t in _FLAKE_TYPES], dtype=object
+)
+# Ground glyph for each weight up to STACK_WEIGHT
+_GROUND_GLYPHS = np.array(
+    [
+        max(
+            ((w, char) for w, char in FLAKE_WEIGHT_CHARS.items() if w <= weight),
+            default=(0, " "),
+        )[1]
+        for weight in range(STACK_WEIGHT + 1)
+    ],
+    dtype=object,
+)
+
 
 class SnowEffect(BaseEffect):
     """
     A class to represent a snow effect.
+
+    Flakes are stored as parallel arrays (position, type, fall delay and drift
+    bias) and all advance together each frame. Snow that lands accumulates in
+    an integer weight per cell, drawn through a lookup table of ground glyphs.
+
+    Collision uses a per-column surface height: the topmost row a flake can't
+    fall into, either the image's silhouette or snow piled up to
+    STACK_WEIGHT. Flakes settle on the row above it.
     """
 
     def __init__(self, buffer: Buffer, background: str, settings: SnowSettings = None):
@@ -46,14 +74,27 @@ class SnowEffect(BaseEffect):
         self.snow_intensity = max(0.01, min(1.0, s.intensity))
         self.wind = max(-1.0, min(1.0, s.wind))
 
-        self.flakes = []
-        self.ground_flakes = [
-            [0 for _ in range(buffer.width())] for _ in range(buffer.height())
-        ]
+        self._rng = np.random.default_rng()
+        self.flake_x = np.zeros(0, dtype=np.intp)
+        self.flake_y = np.zeros(0, dtype=np.intp)
+        self.flake_type = np.zeros(0, dtype=np.intp)
+        self.flake_delay = np.zeros(0, dtype=np.int64)
+        self.flake_drift = np.zeros(0)
+        self.ground_flakes = np.zeros((buffer.height(), buffer.width()), dtype=np.int64)
+        # Topmost row in each column where snow has stacked up to STACK_WEIGHT
+        self._snow_top = np.full(buffer.width(), buffer.height())
+        self._image_mask = ImageMask()
         self.image_flakes = [None for _ in range(self.buffer.width())]
         self.smart_transparent = False
         self.total_ground_flakes = 0
 
+    @property
+    def flake_count(self) -> int:
+        """
+        The number of falling snowflakes.
+        """
+        return self.flake_x.size
+
     def set_snow_intensity(self, intensity: float):
         """
         Sets the probability of a new snowflake spawning per column per frame.
@@ -127,82 +168,155 @@ class SnowEffect(BaseEffect):
         Args:
             x (int): The x position to spawn the snowflake at.
         """
-        snowflake_type = random.choice(list(SNOWFLAKE_TYPES.keys()))
-        snowflake_char = bruhcolored(snowflake_type, SNOWFLAKE_COLORS[snowflake_type])
-        drift_bias = self.wind + random.uniform(-0.35, 0.35)
-        self.flakes.append(
-            {
-                "x": x,
-                "y": 0,
-                "type": snowflake_type,
-                "colored": snowflake_char,
-                "fall_delay": 0,
-                "drift_bias": drift_bias,
-            }
+        self._spawn_flakes(np.array([x], dtype=np.intp))
+
+    def _spawn_flakes(self, xs: np.ndarray):
+        """
+        Adds a snowflake of a random type at the top of each given column.
+        """
+        count = xs.size
+        drift = self.wind + self._rng.uniform(-0.35, 0.35, count)
+        self.flake_x = np.concatenate((self.flake_x, xs))
+        self.flake_y = np.concatenate((self.flake_y, np.zeros(count, dtype=np.intp)))
+        self.flake_type = np.concatenate(
+            (self.flake_type, self._rng.integers(0, len(_FLAKE_TYPES), count))
+        )
+        self.flake_delay = np.concatenate(
+            (self.flake_delay, np.zeros(count, dtype=np.int64))
         )
+        self.flake_drift = np.concatenate((self.flake_drift, drift))
+
+    def image_surface(self) -> np.ndarray:
+        """
+        Returns the topmost row of the image in each column, or the screen
+        height where there is no image. Without an image buffer, the image is
+        taken to fill its bounding box.
+
+        Returns:
+            np.ndarray: An int array with one entry per column.
+        """
+        h, w = self.ground_flakes.shape
+        if self.image_present and self.image_buffer is not None:
+            self._image_mask.update(self.image_buffer)
+            if self._image_mask.surface.size == w:
+                return self._image_mask.surface
+        surface = np.full(w, h)
+        if self.image_present:
+            (x0, x1), (y0, _) = self.image_x_boundaries, self.image_y_boundaries
+            surface[max(0, x0 + 1) : max(0, x1)] = y0 + 1
+        return surface
+
+    def surface(self) -> np.ndarray:
+        """
+        Returns the landing height of each column: the topmost row a flake
+        can't fall into, because of the image, stacked snow or the ground.
+
+        Returns:
+            np.ndarray: An int array with one entry per column.
+        """
+        return np.minimum(self.image_surface(), self._snow_top)
 
-    def can_stack(self, x: int, y: int) -> bool:
+    def can_stack(self, x, y):
         """
         Checks whether accumulated snow at (x, y) is dense enough to stack onto the row above.
 
         Args:
-            x (int): Column to check.
-            y (int): Row to check.
+            x (int | np.ndarray): Column(s) to check.
+            y (int | np.ndarray): Row(s) to check.
 
         Returns:
-            bool: True if snow should stack upward.
+            bool | np.ndarray: True where snow should stack upward.
         """
-        if y >= self.buffer.height():
-            return False
-        return self.ground_flakes[y][x] >= 18
+        return (np.asarray(y) < self.buffer.height()) & (y >= self._snow_top[x])
 
-    def is_colliding(self, x: int, y: int) -> bool:
+    def is_colliding(self, x, y):
         """
         Checks whether a snowflake at (x, y) would collide with an image.
 
         Args:
-            x (int): Column to check.
-            y (int): Row to check.
+            x (int | np.ndarray): Column(s) to check.
+            y (int | np.ndarray): Row(s) to check.
 
         Returns:
-            bool: True if the position is inside the image boundary.
+            bool | np.ndarray: True where the position is on or under the image's silhouette.
         """
-        if self.image_present:
-            if (
-                self.image_x_boundaries[0] < x < self.image_x_boundaries[1]
-                and self.image_y_boundaries[0] < y < self.image_y_boundaries[1]
-            ):
-                return True
-        return False
+        return (np.asarray(y) < self.buffer.height()) & (y >= self.image_surface()[x])
 
-    def handle_snowflake_landing(self, x: int, y: int):
+    def handle_snowflake_landing(self, x, y):
         """
-        Accumulates snow at the landing position and updates the ground character.
+        Accumulates snow at the landing position(s). Every landing on a cell
+        already heavier than STACK_WEIGHT also adds to the cell above.
 
         Args:
-            x (int): Column where the flake landed.
-            y (int): Row where the flake landed.
-        """
-        self.ground_flakes[y][x] += 1
-        weight = self.ground_flakes[y][x]
-        for w, char in sorted(FLAKE_WEIGHT_CHARS.items(), reverse=True):
-            if weight >= w:
-                self.buffer.put_char(x, y, char)
-                break
-        if weight > 18 and y > 0:
-            self.ground_flakes[y - 1][x] += 1
+            x (int | np.ndarray): Column(s) where flakes landed.
+            y (int | np.ndarray): Row(s) where flakes landed.
+        """
+        h, w = self.ground_flakes.shape
+        cells = np.ravel(np.asarray(y) * w + np.asarray(x))
+        landed = np.bincount(cells, minlength=h * w).reshape(h, w)
+        self.ground_flakes += landed
+        # Landings that took the weight past STACK_WEIGHT spill upwards
+        spill = np.clip(self.ground_flakes - STACK_WEIGHT, 0, landed)
+        self.ground_flakes[:-1] += spill[1:]
+
+        # Raise the snow surface where the landings, or their spill, stacked up
+        xs = np.concatenate((cells % w, cells % w))
+        ys = np.concatenate((cells // w, np.maximum(cells // w - 1, 0)))
+        heavy = self.ground_flakes[ys, xs] >= STACK_WEIGHT
+        np.minimum.at(self._snow_top, xs[heavy], ys[heavy])
 
     def add_info(self):
         """
         Renders debug info (flake counts) at the top of the buffer.
         """
-        self.buffer.put_at(0, 0, f"Total Snow Flakes: {len(self.flakes)}")
+        self.buffer.put_at(0, 0, f"Total Snow Flakes: {self.flake_count}")
         self.buffer.put_at(
             0,
             1,
-            f"Total Flakes on Ground: {sum(1 for row in self.ground_flakes for v in row if v > 0)}",
+            f"Total Flakes on Ground: {np.count_nonzero(self.ground_flakes)}",
         )
 
+    def _advance_flakes(self):
+        """
+        Moves every flake whose fall delay is up one row down, drifting with
+        its bias, and lands the ones that can't fall any further.
+        """
+        h, w = self.ground_flakes.shape
+        speed = _FLAKE_SPEEDS[self.flake_type]
+        waiting = self.flake_delay < speed
+        self.flake_delay += 1
+        self.flake_delay[~waiting] = 0
+        moving = np.flatnonzero(~waiting)
+
+        surface = self.surface()
+        blocked = self.flake_y[moving] + 1 >= surface[self.flake_x[moving]]
+        falling = moving[~blocked]
+
+        drift = self.flake_drift[falling] + self._rng.uniform(-0.08, 0.08, falling.size)
+        np.clip(drift, -2.0, 2.0, out=drift)
+        self.flake_drift[falling] = drift
+        left = np.maximum(0.05, 1.0 - drift)
+        right = np.maximum(0.05, 1.0 + drift)
+        pick = self._rng.random(falling.size) * (left + 1.2 + right)
+        dx = np.where(pick < left, -1, np.where(pick < left + 1.2, 0, 1))
+
+        new_x = np.clip(self.flake_x[falling] + dx, 0, w - 1)
+        new_y = self.flake_y[falling] + 1
+        colliding = new_y >= surface[new_x]
+        self.flake_x[falling[~colliding]] = new_x[~colliding]
+        self.flake_y[falling[~colliding]] = new_y[~colliding]
+
+        landing = np.concatenate((moving[blocked], falling[colliding]))
+        if landing.size:
+            self.handle_snowflake_landing(self.flake_x[landing], self.flake_y[landing])
+            keep = np.ones(self.flake_count, dtype=bool)
+            keep[landing] = False
+            self.flake_x = self.flake_x[keep]
+            self.flake_y = self.flake_y[keep]
+            self.flake_type = self.flake_type[keep]
+            self.flake_delay = self.flake_delay[keep]
+            self.flake_drift = self.flake_drift[keep]
+
     def render_frame(self, frame_number: int):
         """
         Renders a single frame of the snow effect.
@@ -210,54 +324,13 @@ class SnowEffect(BaseEffect):
         Args:
             frame_number (int): The current frame number.
         """
-        for idx in range(self.buffer.width()):
-            if random.random() < self.snow_intensity:
-                self.generate_snowflake(idx)
-
-        new_flakes = []
-        for snowflake in self.flakes:
-            x, y, flake_type = snowflake["x"], snowflake["y"], snowflake["type"]
-            speed = SNOWFLAKE_TYPES[flake_type]["speed"]
-
-            self.buffer.put_char(x, y, " ")
-
-            if snowflake["fall_delay"] < speed:
-                snowflake["fall_delay"] += 1
-                new_flakes.append(snowflake)
-                continue
-            else:
-                snowflake["fall_delay"] = 0
-
-            if y + 1 >= self.buffer.height() or self.can_stack(x, y + 1):
-                self.handle_snowflake_landing(x, y)
-            else:
-                snowflake["drift_bias"] = max(
-                    -2.0,
-                    min(2.0, snowflake["drift_bias"] + random.uniform(-0.08, 0.08)),
-                )
-                bias = snowflake["drift_bias"]
-                left_w = max(0.05, 1.0 - bias)
-                right_w = max(0.05, 1.0 + bias)
-                dx = random.choices([-1, 0, 1], weights=[left_w, 1.2, right_w])[0]
-
-                new_x = max(0, min(self.buffer.width() - 1, x + dx))
-                new_y = y + 1
-                if (
-                    new_y < self.buffer.height()
-                    and not self.is_colliding(new_x, new_y)
-                    and 0 <= new_x < self.buffer.width()
-                ):
-                    snowflake["x"], snowflake["y"] = new_x, new_y
-                    new_flakes.append(snowflake)
-                else:
-                    self.handle_snowflake_landing(x, y)
-
-        self.flakes = new_flakes
-
-        for snowflake in self.flakes:
-            self.buffer.put_char(
-                snowflake["x"], snowflake["y"], snowflake["colored"].colored
-            )
+        w = self.buffer.width()
+        self._spawn_flakes(np.flatnonzero(self._rng.random(w) < self.snow_intensity))
+        self._advance_flakes()
+
+        cells = _GROUND_GLYPHS[np.minimum(self.ground_flakes, STACK_WEIGHT)]
+        cells[self.flake_y, self.flake_x] = _FLAKE_GLYPHS[self.flake_type]
+        self.buffer.put_block(0, 0, cells.tolist())
 
         if self.show_info:
             self.add_info()
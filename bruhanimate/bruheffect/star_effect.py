@@ -14,8 +14,7 @@ See the License for the specific language governing permissions and
 limitations under the License.
 """
 
-import random
-
+import numpy as np
 from bruhcolor import bruhcolored
 
 from ..bruhutil import LIFE_COLORS, Buffer
@@ -65,23 +64,24 @@ class StarEffect(NoiseEffect):
         self.stars = f"{background * (100 // self.background_length)}.*+"
         self.stars_length = len(self.stars)
 
-    def render_frame(self, frame_number: int):
+    def _glyph_lut(self) -> np.ndarray:
         """
-        Renders a frame of the star effect.
+        Returns every glyph a star can be drawn with, one per (position in the
+        star characters, palette color) pair, rebuilding the table only when
+        the characters or palette change.
 
-        Args:
-            frame_number (int): The current frame number.
+        Returns:
+            np.ndarray: A flat object array of glyph strings.
         """
-        for y in range(self.buffer.height()):
-            for x in range(self.buffer.width()):
-                if random.random() < self.intensity:
-                    self.buffer.put_char(
-                        x,
-                        y,
-                        bruhcolored(
-                            self.stars[random.randint(0, self.stars_length - 1)],
-                            color=LIFE_COLORS[self.color_type][
-                                random.randint(0, len(LIFE_COLORS[self.color_type]) - 1)
-                            ],
-                        ).colored,
-                    )
+        key = (self.stars, self.color_type)
+        if key != self._glyphs_key:
+            self._glyphs = np.array(
+                [
+                    bruhcolored(char, color=color).colored
+                    for char in self.stars
+                    for color in LIFE_COLORS[self.color_type]
+                ],
+                dtype=object,
+            )
+            self._glyphs_key = key
+        return self._glyphs
@@ -15,6 +15,7 @@ limitations under the License.
 """
 
 from ..bruhutil.bruhffer import Buffer
+from ..bruhutil.utils import INF
 from .base_effect import BaseEffect
 
 
@@ -33,6 +34,24 @@ class StaticEffect(BaseEffect):
         """
         super(StaticEffect, self).__init__(buffer, background)
 
+    def frame_key(self, frame_number: int):
+        """
+        Every frame is the same, so the key is just the background.
+
+        Args:
+            frame_number (int): The current frame number.
+        """
+        return self.background
+
+    def frames_until_change(self, frame_number: int):
+        """
+        The background never changes on its own.
+
+        Args:
+            frame_number (int): The frame that was just rendered.
+        """
+        return INF
+
     def render_frame(self, frame_number: int):
         """
         Renders the background to the screen.
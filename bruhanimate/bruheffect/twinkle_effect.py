@@ -16,12 +16,17 @@ limitations under the License.
 
 import random
 
+import numpy as np
 from bruhcolor import bruhcolored
 
 from ..bruhutil import TWINKLE_COLORS, Buffer
 from .base_effect import BaseEffect
 from .settings import TwinkleSettings
 
+TWINKLE_LEVELS = len(TWINKLE_COLORS)
+# A twinkle rises through every level and falls back in this many frames
+TWINKLE_PERIOD = 2 * (TWINKLE_LEVELS - 1)
+
 
 class TWINKLE_SPEC:
     """
@@ -77,6 +82,11 @@ class TWINKLE_SPEC:
 class TwinkleEffect(BaseEffect):
     """
     A twinkling star-like effect where characters pulse in brightness.
+
+    Each twinkling cell has a brightness phase and a direction, held in int8
+    arrays and advanced together; cells are drawn from a table of every
+    (character, brightness) glyph. Since every cell bounces between the
+    dimmest and brightest level, frames repeat every TWINKLE_PERIOD frames.
     """
 
     def __init__(
@@ -95,6 +105,8 @@ class TwinkleEffect(BaseEffect):
         self.density = s.density
         self.twinkle_chars = s.twinkle_chars
         self.specs = []
+        self._rng = np.random.default_rng()
+        self._generation = 0
         self._set_specs()
 
     def set_density(self, density: float):
@@ -120,16 +132,69 @@ class TwinkleEffect(BaseEffect):
             self._set_specs()
 
     def _set_specs(self):
-        self.specs = []
+        """
+        Picks new twinkling cells with random characters, brightness levels and
+        directions, and draws them.
+        """
+        h, w = self.buffer.height(), self.buffer.width()
+        rng = self._rng
+        self._ys, self._xs = np.nonzero(rng.random((h, w)) < self.density)
+        count = self._ys.size
+        self.specs = list(zip(self._xs.tolist(), self._ys.tolist()))
+        self._chars = rng.integers(0, len(self.twinkle_chars), count)
+        self._phase = rng.integers(0, TWINKLE_LEVELS, count, dtype=np.int8)
+        self._direction = rng.choice(np.array([-1, 1], dtype=np.int8), count)
+        self._glyphs = np.array(
+            [
+                bruhcolored(char, TWINKLE_COLORS[level]).colored
+                for char in self.twinkle_chars
+                for level in range(TWINKLE_LEVELS)
+            ],
+            dtype=object,
+        )
+        self._cells = np.full((h, w), " ", dtype=object)
+        self._steps = 0
+        self._generation += 1
+
         self.buffer.clear_buffer()
-        for y in range(self.buffer.height()):
-            for x in range(self.buffer.width()):
-                if random.random() < self.density:
-                    spec = TWINKLE_SPEC(
-                        random.choice(self.twinkle_chars), random.randint(0, 23)
-                    )
-                    self.buffer.put_char(x, y, spec)
-                    self.specs.append((x, y))
+        self._draw()
+
+    def _step(self):
+        """
+        Moves every twinkle one brightness level along, turning around at the
+        dimmest and brightest levels.
+        """
+        np.copyto(self._direction, -1, where=self._phase >= TWINKLE_LEVELS - 1)
+        np.copyto(self._direction, 1, where=self._phase <= 0)
+        self._phase += self._direction
+        self._steps += 1
+
+    def _draw(self):
+        """
+        Draws every twinkle at its current brightness.
+        """
+        self._cells[self._ys, self._xs] = self._glyphs[
+            self._chars * TWINKLE_LEVELS + self._phase
+        ]
+        self.buffer.put_block(0, 0, self._cells.tolist())
+
+    def frame_key(self, frame_number: int):
+        """
+        Frames repeat every TWINKLE_PERIOD steps until the twinkles are reset.
+
+        Args:
+            frame_number (int): The current frame number.
+        """
+        return (self._generation, (self._steps + 1) % TWINKLE_PERIOD)
+
+    def skip_frame(self, frame_number: int):
+        """
+        Advances the twinkles without drawing them.
+
+        Args:
+            frame_number (int): The current frame number.
+        """
+        self._step()
 
     def render_frame(self, frame_number: int):
         """
@@ -138,7 +203,5 @@ class TwinkleEffect(BaseEffect):
         Args:
             frame_number (int): The current frame number.
         """
-        for x, y in self.specs:
-            spec = self.buffer.get_char(x, y)
-            self.buffer.put_char(x, y, spec.next().copy())
-            del spec
+        self._step()
+        self._draw()
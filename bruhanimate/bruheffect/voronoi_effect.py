@@ -19,8 +19,11 @@ from bruhcolor import bruhcolored as bc
 
 from ..bruhutil import Buffer
 from .base_effect import BaseEffect
+from .progressive import ProgressiveField
 from .settings import VoronoiSettings
 
+BLOCK_SIZE = 8
+
 
 def _heat(r: float) -> int:
     r = max(0.0, min(1.0, r))
@@ -42,6 +45,9 @@ class VoronoiEffect(BaseEffect):
     Every pixel is colored by its nearest seed, producing a continuously
     shifting stained-glass pattern. Seed positions are highlighted with a
     bright marker.
+
+    Each block of the screen is only searched for the few seeds that can be
+    nearest to it, so hundreds of seeds cost little more than a dozen.
     """
 
     def __init__(
@@ -55,6 +61,8 @@ class VoronoiEffect(BaseEffect):
         self.seed_speed = s.seed_speed
         self._w = buffer.width()
         self._h = buffer.height()
+        self._glyphs_key = None
+        self._glyphs = None
 
         n = s.num_seeds
         rng = np.random.default_rng()
@@ -67,49 +75,135 @@ class VoronoiEffect(BaseEffect):
             ]
         )
 
-        cols = np.arange(self._w)
-        rows = np.arange(self._h)
-        self._X, self._Y = np.meshgrid(cols, rows)
+        self._progressive = ProgressiveField()
 
-    def render_frame(self, frame_number: int):
-        self.buffer.clear_buffer(val=self.background)
+    def _nearest_seed(self, ys: np.ndarray, xs: np.ndarray) -> np.ndarray:
+        """
+        Finds the nearest seed to each of the given cells.
 
-        # Move seeds and bounce off edges
-        self._seeds[:, 0] += self._seeds[:, 2] * self.seed_speed
-        self._seeds[:, 1] += self._seeds[:, 3] * self.seed_speed
-        for i in range(len(self._seeds)):
-            if not (0 <= self._seeds[i, 0] < self._w):
-                self._seeds[i, 2] *= -1
-                self._seeds[i, 0] = float(np.clip(self._seeds[i, 0], 0, self._w - 1))
-            if not (0 <= self._seeds[i, 1] < self._h):
-                self._seeds[i, 3] *= -1
-                self._seeds[i, 1] = float(np.clip(self._seeds[i, 1], 0, self._h - 1))
+        Args:
+            ys (np.ndarray): Row index of each cell.
+            xs (np.ndarray): Column index of each cell.
 
+        Returns:
+            np.ndarray: Index of the nearest seed to each cell.
+        """
+        sx, sy = self._seeds[:, 0], self._seeds[:, 1]
+        d = (xs[:, None] - sx) ** 2 + ((ys[:, None] - sy) * 2) ** 2
+        return np.argmin(d, axis=1)
+
+    def _nearest_seed_grid(self) -> np.ndarray:
+        """
+        Finds the nearest seed to every pixel of the screen.
+
+        The screen is split into blocks, and each block is only searched for
+        the seeds that can be nearest to one of its pixels: a seed whose
+        closest point of the block is farther than the farthest point of the
+        block from some other seed never wins there. Ties go to the lowest
+        seed index, as in _nearest_seed.
+
+        Returns:
+            np.ndarray: A (height, width) int array of seed indices.
+        """
+        size = BLOCK_SIZE
+        n = len(self._seeds)
+        grid_h = -(-self._h // size)
+        grid_w = -(-self._w // size)
         sx, sy = self._seeds[:, 0], self._seeds[:, 1]
 
+        def block_bounds(starts, seeds, scale):
+            # Nearest and farthest distance along one axis from every block
+            # (rows) to every seed (columns)
+            lo = starts[:, np.newaxis] - seeds
+            hi = lo + (size - 1)
+            near = np.maximum(np.maximum(lo, -hi), 0) * scale
+            far = np.maximum(np.abs(lo), np.abs(hi)) * scale
+            return near**2, far**2
+
+        near_x, far_x = block_bounds(np.arange(grid_w) * size, sx, 1)
+        near_y, far_y = block_bounds(np.arange(grid_h) * size, sy, 2)
+        nearest_bound = near_y[:, np.newaxis] + near_x
+        farthest = (far_y[:, np.newaxis] + far_x).min(axis=2, keepdims=True)
+        candidate = nearest_bound <= farthest
+
+        # Pad every block's candidate list, in seed order, with a seed at
+        # infinity so the blocks can be searched together
+        k = int(candidate.sum(axis=2).max())
+        order = np.argsort(~candidate, axis=2, kind="stable")[..., :k]
+        seeds = np.where(np.take_along_axis(candidate, order, axis=2), order, n)
+        cx = np.append(sx, np.inf)[seeds]
+        cy = np.append(sy, np.inf)[seeds]
+
+        # Pixel coordinates laid out as (block row, row, block column, column)
+        offsets = np.arange(size)
+        px = (np.arange(grid_w)[:, np.newaxis] * size + offsets)[
+            np.newaxis, np.newaxis, :, :, np.newaxis
+        ]
+        py = (np.arange(grid_h)[:, np.newaxis] * size + offsets)[
+            :, :, np.newaxis, np.newaxis, np.newaxis
+        ]
+        d = (px - cx[:, np.newaxis, :, np.newaxis]) ** 2 + (
+            (py - cy[:, np.newaxis, :, np.newaxis]) * 2
+        ) ** 2
+        best = d.argmin(axis=4)[..., np.newaxis]
+        nearest = np.take_along_axis(
+            np.broadcast_to(seeds[:, np.newaxis, :, np.newaxis], d.shape),
+            best,
+            axis=4,
+        )
+        return nearest.reshape(grid_h * size, grid_w * size)[: self._h, : self._w]
+
+    def _glyph_lut(self) -> np.ndarray:
+        """
+        Returns the glyph of each seed's cells, followed by the seed marker,
+        rebuilding the table only when the seeds or drawing mode change.
+
+        Returns:
+            np.ndarray: An object array of glyph strings.
+        """
+        n = len(self._seeds)
+        key = (n, self.char, self.color)
+        if key != self._glyphs_key:
+            if self.color:
+                glyphs = [
+                    bc(self.char, color=_heat(i / max(1, n - 1))).colored
+                    for i in range(n)
+                ]
+                glyphs.append(bc("*", color=226).colored)
+            else:
+                glyphs = [self.char] * n + ["*"]
+            self._glyphs = np.array(glyphs, dtype=object)
+            self._glyphs_key = key
+        return self._glyphs
+
+    def render_frame(self, frame_number: int):
+        # Move seeds and bounce off edges
+        seeds = self._seeds
+        seeds[:, 0] += seeds[:, 2] * self.seed_speed
+        seeds[:, 1] += seeds[:, 3] * self.seed_speed
+        for axis, size in ((0, self._w), (1, self._h)):
+            out = (seeds[:, axis] < 0) | (seeds[:, axis] >= size)
+            seeds[out, axis + 2] *= -1
+            seeds[out, axis] = seeds[out, axis].clip(0, size - 1)
+
         # Assign each pixel to its nearest seed
-        min_d = np.full((self._h, self._w), np.inf)
-        nearest = np.zeros((self._h, self._w), dtype=np.int8)
-        for i in range(len(self._seeds)):
-            d = (self._X - sx[i]) ** 2 + ((self._Y - sy[i]) * 2) ** 2
-            closer = d < min_d
-            min_d[closer] = d[closer]
-            nearest[closer] = i
-
-        # Pre-build one coloured char per seed
-        chars = []
-        for i in range(len(self._seeds)):
-            ratio = i / max(1, len(self._seeds) - 1)
-            color = _heat(ratio) if self.color else None
-            chars.append(bc(self.char, color=color) if color is not None else self.char)
-
-        for r in range(self._h):
-            for c in range(self._w):
-                self.buffer.put_char(c, r, chars[int(nearest[r, c])])
+        if self.frame_budget is None:
+            nearest = self._nearest_seed_grid()
+        else:
+            # Moving seeds change the diagram, so refinement starts over
+            if self.seed_speed:
+                self._progressive.reset()
+            nearest = self._progressive.render(
+                (self._h, self._w), self._nearest_seed, self.frame_budget, np.intp
+            )
+
+        glyphs = self._glyph_lut()
+        cells = np.take(glyphs, nearest)
 
         # Highlight each seed with a bright marker
-        for i in range(len(self._seeds)):
-            x, y = int(sx[i]), int(sy[i])
-            if 0 <= x < self._w and 0 <= y < self._h:
-                color = 226 if self.color else None
-                self.buffer.put_char(x, y, bc("*", color=color) if color else "*")
+        xs = seeds[:, 0].astype(np.intp)
+        ys = seeds[:, 1].astype(np.intp)
+        visible = (xs >= 0) & (xs < self._w) & (ys >= 0) & (ys < self._h)
+        cells[ys[visible], xs[visible]] = glyphs[-1]
+
+        self.buffer.put_block(0, 0, cells.tolist())
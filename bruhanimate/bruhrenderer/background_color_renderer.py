@@ -84,6 +84,15 @@ class BackgroundColorRenderer(BaseRenderer):
         self.current_img_y = self.img_y_start
         self.on_color_code = on_color_code
 
+    def img_frame_key(self, frame_number: int):
+        """
+        The image is drawn on frame 0 and stays the same afterwards.
+
+        Args:
+            frame_number (int): The current frame number.
+        """
+        return None if frame_number == 0 else 0
+
     def render_img_frame(self, frame_number: int):
         """
         Applies the background color to each image character on frame 0 only.
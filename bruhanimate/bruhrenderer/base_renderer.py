@@ -25,8 +25,12 @@ from ..bruhutil.bruhffer import Buffer
 from ..bruhutil.bruhscreen import Screen
 from ..bruhutil.bruhtypes import EffectType, valid_effect_types
 from ..bruhutil.utils import sleep
+from .frame_cache import FrameCache
 
 INF = float("inf")
+DEFAULT_FRAME_CACHE_MB = 16
+# Longest single wait while idle, so resizes are still noticed
+MAX_IDLE_WAIT = 1.0
 
 
 class BaseRenderer:
@@ -69,6 +73,13 @@ class BaseRenderer:
 
         self.last_displayed = self.create_buffer()
 
+        self.frame_cache = FrameCache(
+            self._frame_cache_capacity(DEFAULT_FRAME_CACHE_MB)
+        )
+        self._last_frame_key = None
+        self._last_img_key = None
+        self._changed_rows = None
+
         self.exit_messages = {
             "msg1": " Frames Are Done ",
             "msg2": "   Press Enter   ",
@@ -104,9 +115,12 @@ class BaseRenderer:
             None
         """
         self.screen.begin_frame()
-        for y, x, val in self.last_displayed.get_buffer_changes(self.display_buffer):
+        for y, x, val in self.last_displayed.get_buffer_changes(
+            self.display_buffer, self._changed_rows
+        ):
             self.screen.print_at(val, x, y, 1)
         self.screen.flush_frame()
+        self._changed_rows = None
         # Rotate pointers: last_displayed takes display_buffer's content (no copy),
         # and current_buffer (the recyclable back buffer) gets the old last_displayed slot.
         self.last_displayed, self.current_buffer = (
@@ -123,23 +137,124 @@ class BaseRenderer:
         """
         self.current_buffer.clear_buffer(val=self.background)
 
-    def render_to_back_buffer(self, frame: int):
+    def render_to_back_buffer(self, frame: int) -> bool:
         """
         Renders the current frame to the back buffer.
         This is where all drawing operations happen before presentation.
 
+        When the effect and image both report a frame key, the composited frame
+        is cached under it. A frame seen before is copied from the cache instead
+        of rendered, and one identical to the last frame is not redrawn. While
+        the image stays the same, only the rows the effect reports as changed
+        are composited and diffed.
+
+        Args:
+            frame (int): The current frame number.
+
+        Returns:
+            bool: False if the frame is unchanged from the last one, in which
+                case presenting it can be skipped, otherwise True.
+        """
+        img_key = self.img_frame_key(frame)
+        img_unchanged = img_key is not None and img_key == self._last_img_key
+        self._last_img_key = img_key
+        self._changed_rows = None
+
+        key = self.effect.frame_key(frame)
+        if key is not None:
+            key = None if img_key is None else (key, img_key)
+
+        if key is not None and key == self._last_frame_key:
+            self.effect.skip_frame(frame)
+            self.current_buffer.sync_with(self.last_displayed)
+            return False
+        self._last_frame_key = key
+
+        rows = None if key is None else self.frame_cache.get(key)
+        if rows is not None:
+            self.effect.skip_frame(frame)
+            self.current_buffer.put_block(0, 0, rows)
+            return True
+
+        # Render the effect to its own buffer
+        changes = self.effect.render_frame(frame)
+
+        rows = self.changed_rows(changes) if img_unchanged else None
+        if rows is None:
+            # Composite the effect and image onto the back buffer
+            self.render_overlay_to_back_buffer(frame)
+            if key is not None:
+                self.frame_cache.put(key, self.current_buffer.buffer)
+            return True
+
+        self.current_buffer.sync_with(self.last_displayed)
+        if not rows:
+            return False
+        self.render_rows_to_back_buffer(rows)
+        self._changed_rows = rows
+        return True
+
+    def changed_rows(self, changes) -> list[int] | None:
+        """
+        Converts the change descriptor returned by an effect's render_frame()
+        into the rows it touches.
+
+        Args:
+            changes: None or True if anything may have changed, False if nothing
+                did, or an iterable of row indices and (x, y, width, height) rects.
+
+        Returns:
+            list[int] | None: The sorted changed rows, or None for all of them.
+        """
+        if changes is None or changes is True:
+            return None
+        if changes is False:
+            return []
+        rows = set()
+        for change in changes:
+            if isinstance(change, tuple):
+                _, y, _, h = change
+                rows.update(range(max(0, y), min(self.height, y + h)))
+            elif 0 <= change < self.height:
+                rows.add(change)
+        return sorted(rows)
+
+    def render_rows_to_back_buffer(self, rows: list[int]):
+        """
+        Composites the given rows of the effect and image buffers onto the back
+        buffer, leaving every other row as it is.
+
+        Args:
+            rows (list[int]): The rows to composite.
+
+        Returns:
+            None
+        """
+        back = self.current_buffer.buffer
+        for y in rows:
+            row = back[y]
+            row[:] = self.effect.buffer.buffer[y]
+            for x, val in enumerate(self.image_buffer.buffer[y]):
+                if val is not None:
+                    row[x] = val
+
+    def render_overlay_to_back_buffer(self, frame: int):
+        """
+        Composites the effect's last rendered frame and a freshly rendered image
+        frame onto the back buffer, without advancing the effect. Used to redraw
+        immediately in response to input between regular frames.
+
         Args:
             frame (int): The current frame number.
 
         Returns:
             None
         """
+        self._changed_rows = None
+
         # Clear the back buffer
         self.clear_back_buffer()
 
-        # Render the effect to its own buffer
-        self.effect.render_frame(frame)
-
         # Composite the effect buffer onto the back buffer
         self.current_buffer.sync_with(self.effect.buffer)
 
@@ -149,6 +264,26 @@ class BaseRenderer:
         # Overlay the image buffer on top (respecting transparency)
         self.current_buffer.sync_over_top(self.image_buffer)
 
+    def wait_for_input(self, timeout: float) -> bool:
+        """
+        Waits up to timeout seconds, returning early if keyboard input arrives.
+
+        Screens without a wait_for_input() (and the Windows console, whose handle
+        also signals on non-key events) fall back to a plain sleep.
+
+        Args:
+            timeout (float): The maximum time to wait, in seconds.
+
+        Returns:
+            bool: True if input is ready to be read, otherwise False.
+        """
+        wait = getattr(self.screen, "wait_for_input", None)
+        if sys.platform == "win32" or wait is None:
+            sleep(timeout)
+            return False
+        sys.stdout.flush()
+        return bool(wait(timeout))
+
     def validate_effect_type(self, effect_type: EffectType) -> None:
         """
         Validates the provided effect type against a list of valid effect types.
@@ -236,6 +371,69 @@ class BaseRenderer:
         self.smart_transparent = smart_transparent
         self.effect.smart_transparent = smart_transparent
 
+    def update_frame_budget(self, ratio: float | None = 0.5):
+        """
+        Gives the effect a share of each frame to render in. Effects that support
+        progressive rendering draw coarsely first and refine within the budget.
+
+        Args:
+            ratio (float | None): Fraction of frame_time the effect may spend, or
+                None to have the effect always render frames in full.
+
+        Returns:
+            None
+        """
+        budget = None if ratio is None else self.frame_time * ratio
+        self.effect.set_frame_budget(budget)
+
+    def update_frame_cache(self, max_mb: float):
+        """
+        Resizes the cache of rendered frames reused by periodic and static
+        effects, dropping everything cached so far.
+
+        Args:
+            max_mb (float): Memory to allow for cached frames, in megabytes. 0
+                disables the cache.
+
+        Returns:
+            None
+        """
+        self.frame_cache = FrameCache(self._frame_cache_capacity(max_mb))
+
+    def _frame_cache_capacity(self, max_mb: float) -> int:
+        """
+        Returns how many frames of the screen's size fit in max_mb megabytes,
+        counting one pointer per cell.
+        """
+        return int(max_mb * 2**20) // max(1, self.height * self.width * 8)
+
+    def frames_until_change(self, frame: int) -> int | float:
+        """
+        Returns how many frames after frame the screen next changes: the
+        effect's own estimate, as long as the image stays the same.
+
+        Args:
+            frame (int): The frame that was just rendered.
+
+        Returns:
+            int | float: The number of frames, or INF if nothing will change.
+        """
+        img_key = self.img_frame_key(frame)
+        if img_key is None or self.img_frame_key(frame + 1) != img_key:
+            return 1
+        return max(1, self.effect.frames_until_change(frame))
+
+    def img_frame_key(self, frame_number: int):
+        """
+        Returns a key identifying what render_img_frame(frame_number) would
+        draw, or None if the image frame can't be cached. See
+        render_to_back_buffer().
+
+        Args:
+            frame_number (int): The current frame number.
+        """
+        return None
+
     def render_exit_to_back_buffer(self):
         """
         Renders the exit message to the back buffer following double buffering principles.
@@ -324,49 +522,58 @@ class BaseRenderer:
             )
 
         def _should_stop():
-            if _win32 and msvcrt.kbhit():
-                key = msvcrt.getch()
-                return key in (b"\x03", b"q", b"Q", b"\x1b")  # Ctrl+C, q, Q, ESC
-            return False
+            if _win32:
+                if msvcrt.kbhit():
+                    key = msvcrt.getch()
+                    return key in (b"\x03", b"q", b"Q", b"\x1b")  # Ctrl+C, q, Q, ESC
+                return False
+            get_events = getattr(self.screen, "get_events", None)
+            if get_events is None:
+                return False
+            return any(
+                key in (3, ord("q"), ord("Q"), self.screen.KEY_ESCAPE)
+                for key in get_events()
+            )
+
+        def _wait_until(deadline):
+            # Sleep until the next frame that changes, waking early only to check
+            # for a stop key so input is handled without waiting a full frame.
+            # Long idle waits are split up to notice resizes and, on Windows, to
+            # poll for keys.
+            poll = self.frame_time if _win32 else MAX_IDLE_WAIT
+            while True:
+                remaining = deadline - time.perf_counter()
+                if remaining <= 0:
+                    return False
+                ready = self.wait_for_input(min(remaining, poll))
+                if (ready or _win32) and _should_stop():
+                    return True
+                if self.screen.has_resized():
+                    return False
 
         try:
             # Initialize both buffers
             self.clear_back_buffer()
             self.display_buffer.clear_buffer(val=self.background)
 
-            if self.frames != INF:
-                for frame in range(self.frames):
-                    frame_start = time.perf_counter()
-                    if self.screen.has_resized():
-                        raise ScreenResizedError("The screen was resized.")
-                    if _should_stop():
-                        break
-
-                    self.render_to_back_buffer(frame)
-                    self.swap_buffers()
-                    self.present_frame()
+            frame = 0
+            while self.frames == INF or frame < self.frames:
+                frame_start = time.perf_counter()
+                if self.screen.has_resized():
+                    raise ScreenResizedError("The screen was resized.")
+                if _should_stop():
+                    break
 
-                    # Sleep only the remaining budget so total frame time ~ frame_time
-                    remaining = self.frame_time - (time.perf_counter() - frame_start)
-                    if remaining > 0:
-                        sleep(remaining)
-            else:
-                frame = 0
-                while True:
-                    frame_start = time.perf_counter()
-                    if self.screen.has_resized():
-                        raise ScreenResizedError("The screen was resized.")
-                    if _should_stop():
-                        break
-
-                    self.render_to_back_buffer(frame)
+                if self.render_to_back_buffer(frame):
                     self.swap_buffers()
                     self.present_frame()
 
-                    remaining = self.frame_time - (time.perf_counter() - frame_start)
-                    if remaining > 0:
-                        sleep(remaining)
-                    frame += 1
+                idle = self.frames_until_change(frame)
+                if self.frames != INF:
+                    idle = min(idle, self.frames - frame)
+                if _wait_until(frame_start + idle * self.frame_time):
+                    break
+                frame += 1 if idle == INF else idle
         except KeyboardInterrupt:
             pass
         finally:
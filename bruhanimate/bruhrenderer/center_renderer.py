@@ -60,6 +60,15 @@ class CenterRenderer(BaseRenderer):
         self.current_img_x = self.img_x_start
         self.current_img_y = self.img_y_start
 
+    def img_frame_key(self, frame_number: int):
+        """
+        The image is drawn on frame 0 and stays the same afterwards.
+
+        Args:
+            frame_number (int): The current frame number.
+        """
+        return None if frame_number == 0 else 0
+
     def render_img_frame(self, frame_number):
         """
         Renders the image at its center position in each frame.
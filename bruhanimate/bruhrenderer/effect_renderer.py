@@ -50,3 +50,12 @@ class EffectRenderer(BaseRenderer):
 
     def render_img_frame(self, frame_number: int):
         pass
+
+    def img_frame_key(self, frame_number: int):
+        """
+        There is no image, so it never changes.
+
+        Args:
+            frame_number (int): The current frame number.
+        """
+        return 0
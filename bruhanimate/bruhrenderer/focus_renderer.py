@@ -14,9 +14,10 @@ See the License for the specific language governing permissions and
 limitations under the License.
 """
 
-import random
 from typing import Any
 
+import numpy as np
+
 from ..bruhutil.bruhtypes import EffectType
 from .base_renderer import BaseRenderer
 
@@ -80,7 +81,8 @@ class FocusRenderer(BaseRenderer):
     def _set_img_attributes(self):
         """
         Sets attributes for the image, such as its height and width,
-        and initializes boards to track character positions.
+        and precomputes every glyph's trajectory from a random start
+        position to its place in the image.
         """
         self.img_height = len(self.img)
         self.img_width = len(self.img[0])
@@ -89,62 +91,57 @@ class FocusRenderer(BaseRenderer):
         self.current_img_x = self.img_x_start
         self.current_img_y = self.img_y_start
 
-        # Initialize start board with characters at random positions
-        self.start_board = [
-            [
-                [
-                    random.randint(0, self.width - 1),
-                    random.randint(0, self.height - 1),
-                    self.img[y][x],
-                    (x, y),
-                ]
-                for x in range(self.img_width)
-            ]
-            for y in range(self.img_height)
-        ]
-
-        # Initialize current board with characters at start positions
-        self.current_board = [
-            [
-                [
-                    self.start_board[y][x][0],
-                    self.start_board[y][x][1],
-                    self.img[y][x],
-                    (x, y),
-                ]
-                for x in range(self.img_width)
-            ]
-            for y in range(self.img_height)
-        ]
-
-        # Initialize end board with characters at target positions
-        self.end_board = [
-            [
-                [self.img_x_start + x, self.img_y_start + y, self.img[y][x], (x, y)]
-                for x in range(self.img_width)
-            ]
-            for y in range(self.img_height)
-        ]
-
-        # Initialize direction board to track character movement
-        self.direction_board = [
-            [
-                [
-                    (
-                        -1
-                        if (self.end_board[y][x][0] - self.current_board[y][x][0]) < 0
-                        else 1
-                    ),
-                    (
-                        -1
-                        if (self.end_board[y][x][1] - self.current_board[y][x][1]) < 0
-                        else 1
-                    ),
-                ]
-                for x in range(self.img_width)
-            ]
-            for y in range(self.img_height)
-        ]
+        # One entry per glyph, in row-major image order
+        img_ys, img_xs = np.divmod(
+            np.arange(self.img_height * self.img_width), self.img_width
+        )
+        self.glyphs = np.array([c for row in self.img for c in row], dtype=object)
+
+        # Random start positions and fixed end positions, as (x, y) pairs
+        self.start_positions = np.column_stack(
+            (
+                np.random.randint(0, self.width, size=self.glyphs.size),
+                np.random.randint(0, self.height, size=self.glyphs.size),
+            )
+        )
+        self.end_positions = np.column_stack(
+            (self.img_x_start + img_xs, self.img_y_start + img_ys)
+        )
+
+        # Each axis moves one cell per frame towards its target, so a glyph's
+        # position is fully determined by how many steps it has taken.
+        delta = self.end_positions - self.start_positions
+        self.direction = np.where(delta < 0, -1, 1)
+        self.distance = np.abs(delta)
+        self.arrival = self.distance.max(axis=1)
+        self._sorted_arrival = np.sort(self.arrival)
+        self._max_arrival = int(self._sorted_arrival[-1]) if self.glyphs.size else 0
+
+        # Glyphs skipped when drawing (spaces are never drawn when transparent)
+        self._drawable = (
+            self.glyphs != " " if self.transparent else np.ones_like(self.glyphs, bool)
+        )
+
+        self.forward_steps = 0
+        self.reverse_steps = 0
+        self.current_positions = self.start_positions.copy()
+
+    @property
+    def moving(self) -> int:
+        """
+        Returns the number of glyphs that have not yet reached their target
+        in the current direction of travel.
+        """
+        if self.reverse_steps:
+            # A glyph heads back until it has undone all the steps it took
+            if self.reverse_steps >= self.forward_steps:
+                return 0
+            steps = self.reverse_steps
+        else:
+            steps = self.forward_steps
+        return self.glyphs.size - int(
+            np.searchsorted(self._sorted_arrival, steps, side="right")
+        )
 
     def update_reverse(self, reverse: bool, start_reverse: int) -> None:
         """
@@ -187,18 +184,38 @@ class FocusRenderer(BaseRenderer):
         Raises:
             ValueError: If end_state is not "end" or "start".
         """
-        targets = {"end": self.end_board, "start": self.start_board}
-        if end_state not in targets:
-            raise ValueError(
-                f"unknown solved board state for FocusRenderer: {end_state}"
-            )
-        target = targets[end_state]
-        return all(
-            self.current_board[y][x][0] == target[y][x][0]
-            and self.current_board[y][x][1] == target[y][x][1]
-            for y in range(len(self.current_board))
-            for x in range(len(self.current_board[y]))
+        if end_state == "end":
+            return self.reverse_steps == 0 and self.forward_steps >= self._max_arrival
+        if end_state == "start":
+            return self.reverse_steps >= min(self.forward_steps, self._max_arrival)
+        raise ValueError(f"unknown solved board state for FocusRenderer: {end_state}")
+
+    def _update_positions(self) -> None:
+        """
+        Recomputes every glyph's position from the forward and reverse step
+        counters in a single vectorized pass.
+        """
+        progress = np.minimum(self.distance, self.forward_steps)
+        if self.reverse_steps:
+            progress -= self.reverse_steps
+            np.maximum(progress, 0, out=progress)
+        np.multiply(progress, self.direction, out=progress)
+        np.add(self.start_positions, progress, out=self.current_positions)
+
+    def _draw_glyphs(self, visible: np.ndarray) -> None:
+        """
+        Plots the visible glyphs at their current positions into the image buffer.
+
+        Args:
+            visible (np.ndarray): Boolean mask of the glyphs to draw.
+        """
+        xs, ys = self.current_positions[:, 0], self.current_positions[:, 1]
+        visible = (
+            visible & (xs >= 0) & (xs < self.width) & (ys >= 0) & (ys < self.height)
         )
+        canvas = np.full((self.height, self.width), None, dtype=object)
+        canvas[ys[visible], xs[visible]] = self.glyphs[visible]
+        self.image_buffer.buffer = canvas.tolist()
 
     def render_img_frame(self, frame_number):
         """
@@ -213,26 +230,13 @@ class FocusRenderer(BaseRenderer):
         """
         if self.reverse and frame_number >= self.start_reverse:
             if not self.solved(end_state="start"):
-                for y in range(len(self.current_board)):
-                    for x in range(len(self.current_board[y])):
-                        x_check, y_check = False, False
-                        if self.current_board[y][x][0] != self.start_board[y][x][0]:
-                            self.current_board[y][x][0] -= self.direction_board[y][x][0]
-                        else:
-                            x_check = True
-                        if self.current_board[y][x][1] != self.start_board[y][x][1]:
-                            self.current_board[y][x][1] -= self.direction_board[y][x][1]
-                        else:
-                            y_check = True
-
-                        if x_check and y_check:
-                            self.current_board[y][x][2] = None
-                self.image_buffer.clear_buffer(val=None)
-                for row in self.current_board:
-                    for value in row:
-                        self.image_buffer.put_char(
-                            value[0], value[1], value[2], transparent=self.transparent
-                        )
+                self.reverse_steps += 1
+                self._update_positions()
+                # Glyphs that are back at their start position disappear
+                returned = self.reverse_steps >= np.minimum(
+                    self.arrival, self.forward_steps
+                )
+                self._draw_glyphs(self._drawable & ~returned)
             else:
                 if self.loop:
                     self.loops += 1
@@ -242,15 +246,6 @@ class FocusRenderer(BaseRenderer):
                 self.image_buffer.clear_buffer(val=None)
         elif frame_number >= self.start_frame:
             if not self.solved(end_state="end"):
-                for y in range(len(self.current_board)):
-                    for x in range(len(self.current_board[y])):
-                        if self.current_board[y][x][0] != self.end_board[y][x][0]:
-                            self.current_board[y][x][0] += self.direction_board[y][x][0]
-                        if self.current_board[y][x][1] != self.end_board[y][x][1]:
-                            self.current_board[y][x][1] += self.direction_board[y][x][1]
-                self.image_buffer.clear_buffer(val=None)
-                for row in self.current_board:
-                    for value in row:
-                        self.image_buffer.put_char(
-                            value[0], value[1], value[2], transparent=self.transparent
-                        )
+                self.forward_steps += 1
+                self._update_positions()
+                self._draw_glyphs(self._drawable)
@@ -0,0 +1,71 @@
+"""
+Copyright 2023 Ethan Christensen
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+from collections import OrderedDict
+
+
+class FrameCache:
+    """
+    LRU cache of composited frames, keyed by the phase they were rendered at.
+    """
+
+    def __init__(self, max_frames: int):
+        """
+        Initializes an empty frame cache.
+
+        Args:
+            max_frames (int): Number of frames kept before the least recently used are evicted.
+        """
+        self.max_frames = max_frames
+        self.hits = 0
+        self.misses = 0
+        self._frames = OrderedDict()
+
+    def get(self, key):
+        """
+        Returns the rows stored under key (marking them recently used), or None.
+        """
+        rows = self._frames.get(key)
+        if rows is None:
+            self.misses += 1
+            return None
+        self._frames.move_to_end(key)
+        self.hits += 1
+        return rows
+
+    def put(self, key, rows: list[list]):
+        """
+        Stores a copy of the given rows, evicting the least recently used frames
+        over the limit.
+        """
+        if self.max_frames <= 0:
+            return
+        self._frames[key] = [row[:] for row in rows]
+        self._frames.move_to_end(key)
+        while len(self._frames) > self.max_frames:
+            self._frames.popitem(last=False)
+
+    def clear(self):
+        """
+        Drops every cached frame.
+        """
+        self._frames.clear()
+
+    def __contains__(self, key) -> bool:
+        return key in self._frames
+
+    def __len__(self) -> int:
+        return len(self._frames)
@@ -90,17 +90,33 @@ class PanRenderer(BaseRenderer):
     def _set_img_attributes(self) -> None:
         """
         Sets attributes related to the image, including whether to render it, its height and width,
-        and its initial position on the screen.
+        its initial position on the screen, and the pre-built canvas the viewport is cut from.
         """
         self.render_image = True
         self.img_height = len(self.img)
         self.img_width = len(self.img[0])
-        self.img_back = -self.img_width - 1
-        self.img_front = -1
+        self.img_back = -self.img_width
+        self.img_front = 0
         self.img_top = (self.height - self.img_height) // 2
-        self.img_bottom = ((self.height - self.img_height) // 2) + self.img_height
+        self.img_bottom = self.img_top + self.img_height
+        self.img_left = (self.width - self.img_width) // 2
         self.current_img_x = self.img_back
         self.current_img_y = self.img_top
+        self.canvas = self._build_canvas()
+        self._last_rect = None
+
+    def _build_canvas(self) -> list[list[str | None]]:
+        """
+        Builds the canvas rows that are blitted into the image buffer. When the
+        renderer is transparent, spaces become None so the effect underneath
+        shows through without any per-cell checks at render time.
+
+        Returns:
+            list[list[str | None]]: One list of cells per image row.
+        """
+        if self.transparent:
+            return [[None if c == " " else c for c in row] for row in self.img]
+        return [list(row) for row in self.img]
 
     @property
     def img_size(self) -> tuple[int, int]:
@@ -116,7 +132,7 @@ class PanRenderer(BaseRenderer):
         Args:
             frame_number: The current frame number.
         """
-        if not self.loop and self.img_back > self.width + 1:
+        if not self.img:
             return
 
         if self.direction == "horizontal":
@@ -141,114 +157,92 @@ class PanRenderer(BaseRenderer):
             return
         left_right, top_bottom = padding_vals
         self.padding = (left_right, top_bottom)
+        padded_width = self.img_width + 2 * left_right
 
         # Create a new image with the desired padding
         self.img = (
-            [" " * self.img_width for _ in range(top_bottom)]
+            [" " * padded_width for _ in range(top_bottom)]
             + [(" " * left_right) + line + (" " * left_right) for line in self.img]
-            + [" " * self.img_width for _ in range(top_bottom)]
+            + [" " * padded_width for _ in range(top_bottom)]
         )
 
         # Update the image attributes to reflect the new padding
         self._set_img_attributes()
 
+    def _pan_offset(self, frame_number: int, span: int, length: int) -> int | None:
+        """
+        Computes the leading-edge position of the image along the pan axis.
+
+        The image starts fully off-screen (at ``-length``) and moves forward by
+        ``shift_rate`` cells per frame. When looping, the position wraps once the
+        image has left the screen; otherwise None is returned after it has left.
+
+        Args:
+            frame_number (int): The current frame number.
+            span (int): The size of the screen along the pan axis.
+            length (int): The size of the image along the pan axis.
+
+        Returns:
+            int | None: The image position, or None if nothing should be drawn.
+        """
+        travelled = frame_number * self.shift_rate
+        period = span + length
+        if self.loop:
+            travelled %= period
+        elif travelled > period:
+            return None
+        return travelled - length
+
+    def _blit(self, x: int, y: int) -> None:
+        """
+        Moves the viewport so that the canvas' top-left corner lands at (x, y).
+        Only the area covered by the previous blit is cleared, so the per-frame
+        cost is bounded by the visible part of the image.
+
+        Args:
+            x (int): The column of the canvas' left edge on screen.
+            y (int): The row of the canvas' top edge on screen.
+        """
+        if self._last_rect is not None:
+            lx, ly, lw, lh = self._last_rect
+            self.image_buffer.clear_buffer(lx, ly, lw, lh, val=None)
+            self._last_rect = None
+
+        self.current_img_x, self.current_img_y = x, y
+        self.img_back, self.img_front = x, x + self.img_width
+
+        x0, x1 = max(0, x), min(self.width, x + self.img_width)
+        y0, y1 = max(0, y), min(self.height, y + self.img_height)
+        if x0 >= x1 or y0 >= y1:
+            return
+
+        self.image_buffer.put_block(x, y, self.canvas)
+        self._last_rect = (x0, y0, x1 - x0, y1 - y0)
+
     def render_horizontal_frame(self, frame_number):
         """
-        Renders a horizontal frame of the image.
+        Renders a horizontal frame of the image, panning it left to right.
 
         Args:
             frame_number: The current frame number.
         """
-        if self.shift_rate > 0:
-            # Calculate the number of frames to render
-            num_frames = (self.img_width // self.shift_rate) + 1
-
-            # Stop only when not looping and we've exhausted the frame sequence
-            if not self.loop and frame_number >= num_frames:
-                return
-
-            # Update the image position based on the shift rate and current frame number
-            new_img_back = -self.img_width - (frame_number * self.shift_rate)
-            new_img_front = frame_number * self.shift_rate
-
-            # Render each row of the image at its new position
-            for y in range(self.height):
-                for x in range(self.width):
-                    if (
-                        x >= new_img_back
-                        and x < new_img_front
-                        and y >= self.img_top
-                        and y < self.img_bottom
-                    ):
-                        # Check if we're within the bounds of the image
-                        if self.img_height > 0 and self.img_width > 0:
-                            img_row = self.img[y - self.img_top]
-
-                            # Check if each pixel in the row is within the bounds of the image
-                            for j, pixel in enumerate(img_row):
-                                if x - new_img_back >= j:
-                                    # Put the pixel into the screen buffer at its new position
-                                    if self.transparent:
-                                        if (
-                                            y == self.img_top + (self.img_height // 2)
-                                            and x - new_img_back == 0
-                                        ) or self.img[y - self.img_top][j] != " ":
-                                            self.image_buffer.put_char(x, y, pixel)
-                                    else:
-                                        self.image_buffer.put_char(x, y, pixel)
-
-            # Update the image buffer to reflect the updated position of the image
-            self.image_buffer.shift(self.shift_rate)
-
-        return
+        x = self._pan_offset(frame_number, self.width, self.img_width)
+        if x is None:
+            if self._last_rect is not None:
+                self._blit(self.width, self.img_top)
+            return
+        self._blit(x, self.img_top)
 
     def render_vertical_frame(self, frame_number):
         """
-        Renders a vertical frame of the image.
+        Renders a vertical frame of the image, panning it top to bottom.
 
         Args:
             frame_number: The current frame number.
         """
-        if self.shift_rate > 0:
-            # Calculate the number of frames to render
-            num_frames = (self.img_height // self.shift_rate) + 1
-
-            # Check if we're in loop mode or have reached the end of the image
-            if not self.loop and frame_number >= num_frames:
-                return
-
-            # Update the image position based on the shift rate and current frame number
-            new_img_top = -self.img_height - (frame_number * self.shift_rate)
-            new_img_bottom = frame_number * self.shift_rate
-
-            # Render each column of the image at its new position
-            for x in range(self.width):
-                for y in range(self.height):
-                    if (
-                        y >= new_img_top
-                        and y < new_img_bottom
-                        and x >= self.img_back
-                        and x < self.img_front
-                    ):
-                        # Check if we're within the bounds of the image
-                        if self.img_height > 0 and self.img_width > 0:
-                            column_index = x - self.img_back
-
-                            # Check if each pixel in the column is within the bounds of the image
-                            img_column = [
-                                self.img[j][column_index]
-                                for j in range(self.img_height)
-                            ]
-                            for i, pixel in enumerate(img_column):
-                                if y - new_img_top >= i:
-                                    # Put the pixel into the screen buffer at its new position
-                                    if self.transparent:
-                                        if self.img[i][column_index] != " ":
-                                            self.image_buffer.put_char(x, y, pixel)
-                                    else:
-                                        self.image_buffer.put_char(x, y, pixel)
-
-            # Update the image buffer to reflect the updated position of the image
-            self.image_buffer.shift_vertical(self.shift_rate)
-
-        return
+        y = self._pan_offset(frame_number, self.height, self.img_height)
+        if y is None:
+            if self._last_rect is not None:
+                self._blit(self.img_left, self.height)
+            return
+        self._blit(self.img_left, y)
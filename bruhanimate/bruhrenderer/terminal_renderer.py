@@ -1,5 +1,9 @@
+import codecs
+import collections
+import itertools
 import os
 import queue
+import selectors
 import subprocess
 import sys
 import threading
@@ -9,11 +13,17 @@ from typing import Any
 from ..bruhutil import Screen
 from ..bruhutil.bruherrors import ScreenResizedError
 from ..bruhutil.bruhtypes import EffectType
-from ..bruhutil.utils import sleep
 from .base_renderer import BaseRenderer
 
 INF = float("inf")
 
+# Bytes requested per os.read() call on a child's stdout/stderr.
+READ_CHUNK_SIZE = 1 << 16
+# Upper bound on child output consumed per frame so a chatty process can't stall rendering.
+MAX_READ_PER_FRAME = 1 << 22
+# Default number of history lines kept in the scrollback ring.
+DEFAULT_SCROLLBACK = 1000
+
 
 class TerminalRenderer(BaseRenderer):
     """
@@ -32,6 +42,7 @@ class TerminalRenderer(BaseRenderer):
         collision: bool = False,
         settings: Any = None,
         preset: str | None = None,
+        scrollback: int = DEFAULT_SCROLLBACK,
     ):
         super().__init__(
             screen,
@@ -45,25 +56,122 @@ class TerminalRenderer(BaseRenderer):
             preset=preset,
         )
 
-        self.terminal_history = []
+        # Fixed-capacity ring: the oldest lines are dropped once it is full
+        self.terminal_history = collections.deque(maxlen=max(1, int(scrollback)))
         self.current_line_output = ""
         self.current_input = ""
         self.prompt = "> "
         self.max_lines = self.height - 2
         self.output_queue = queue.Queue()
         self.active_process = None
+        self._selector = None
+        self._decoders = {}
+        self._line_layouts = {}
+        self._blank_row = [None] * self.width
+        self._drawn_rows = [self._blank_row] * self.height
 
     def _enqueue_output(self, out, queue):
-        """Thread worker to read output character by character."""
+        """Thread worker to read output in chunks (used where pipes can't be selected)."""
         try:
             while True:
-                char = out.read(1)
-                if not char:
+                chunk = os.read(out.fileno(), READ_CHUNK_SIZE)
+                queue.put((out, chunk))
+                if not chunk:
                     break
-                queue.put(char)
-            out.close()
         except Exception:
-            pass
+            queue.put((out, b""))
+
+    def _watch_output(self, process):
+        """
+        Starts collecting a child's stdout and stderr.
+
+        On POSIX both pipes are made non-blocking and registered with a selector
+        that is drained once per frame. Windows can't select on pipes, so a
+        reader thread per pipe pushes chunks onto the output queue instead.
+        """
+        streams = (process.stdout, process.stderr)
+        for stream in streams:
+            self._decoders[stream] = codecs.getincrementaldecoder("utf-8")(
+                errors="replace"
+            )
+
+        if sys.platform == "win32":
+            for stream in streams:
+                threading.Thread(
+                    target=self._enqueue_output,
+                    args=(stream, self.output_queue),
+                    daemon=True,
+                ).start()
+            return
+
+        if self._selector is None:
+            self._selector = selectors.DefaultSelector()
+        for stream in streams:
+            os.set_blocking(stream.fileno(), False)
+            self._selector.register(stream, selectors.EVENT_READ)
+
+    def _read_available_output(self):
+        """
+        Returns the (stream, chunk) pairs that can be read without blocking,
+        up to MAX_READ_PER_FRAME bytes. An empty chunk marks end of stream.
+        """
+        chunks = []
+        budget = MAX_READ_PER_FRAME
+
+        if sys.platform == "win32":
+            while budget > 0:
+                try:
+                    stream, chunk = self.output_queue.get_nowait()
+                except queue.Empty:
+                    break
+                chunks.append((stream, chunk))
+                budget -= len(chunk)
+            return chunks
+
+        if self._selector is None:
+            return chunks
+        while budget > 0 and self._selector.get_map():
+            ready = self._selector.select(timeout=0)
+            if not ready:
+                break
+            for key, _ in ready:
+                try:
+                    chunk = os.read(key.fd, min(READ_CHUNK_SIZE, budget))
+                except BlockingIOError:
+                    continue
+                except OSError:
+                    chunk = b""
+                if not chunk:
+                    self._selector.unregister(key.fileobj)
+                chunks.append((key.fileobj, chunk))
+                budget -= len(chunk)
+        return chunks
+
+    def _append_output(self, text):
+        """Splits decoded output into lines and wraps them to the screen width in bulk."""
+        text = text.replace("\r", "")
+        if not text:
+            return
+
+        wrap = max(1, self.width - 1)
+        lines = (self.current_line_output + text).split("\n")
+        self.current_line_output = lines.pop()
+
+        for line in lines:
+            if len(line) <= wrap:
+                self.terminal_history.append(line)
+            else:
+                self.terminal_history.extend(
+                    line[i : i + wrap] for i in range(0, len(line), wrap)
+                )
+
+        pending = self.current_line_output
+        if len(pending) >= wrap:
+            cut = len(pending) - len(pending) % wrap
+            self.terminal_history.extend(
+                pending[i : i + wrap] for i in range(0, cut, wrap)
+            )
+            self.current_line_output = pending[cut:]
 
     def execute_command(self):
         """Starts a command or sends input to an active process."""
@@ -73,7 +181,7 @@ class TerminalRenderer(BaseRenderer):
             self.terminal_history.append(user_text)
             try:
                 # Use os.linesep to ensure the correct Enter key behavior for the OS
-                self.active_process.stdin.write(user_text + os.linesep)
+                self.active_process.stdin.write((user_text + os.linesep).encode())
                 self.active_process.stdin.flush()
             except Exception as e:
                 self.terminal_history.append(f"[Stdin Error: {e}]")
@@ -98,70 +206,96 @@ class TerminalRenderer(BaseRenderer):
             env["PYTHONUNBUFFERED"] = "1"
             env["FORCE_COLOR"] = "1"  # Try to force color support
 
+            # Raw byte pipes: output is read in large chunks and decoded incrementally
             self.active_process = subprocess.Popen(
                 cmd,
                 shell=True,
                 stdin=subprocess.PIPE,
                 stdout=subprocess.PIPE,
                 stderr=subprocess.PIPE,
-                text=True,
-                bufsize=1,  # Line buffered
+                bufsize=0,
                 env=env,
-                universal_newlines=True,
             )
-
-            threading.Thread(
-                target=self._enqueue_output,
-                args=(self.active_process.stdout, self.output_queue),
-                daemon=True,
-            ).start()
-            threading.Thread(
-                target=self._enqueue_output,
-                args=(self.active_process.stderr, self.output_queue),
-                daemon=True,
-            ).start()
+            self._watch_output(self.active_process)
 
         except Exception as e:
             self.terminal_history.append(f"[Start Error: {e}]")
 
     def update_history_from_queue(self):
-        """Assembles lines from characters in the queue."""
-        while not self.output_queue.empty():
-            try:
-                char = self.output_queue.get_nowait()
-                if char == "\n":
-                    self.terminal_history.append(self.current_line_output)
-                    self.current_line_output = ""
-                elif char == "\r":
-                    continue
-                else:
-                    self.current_line_output += char
-                    if len(self.current_line_output) > self.width - 2:
-                        self.terminal_history.append(self.current_line_output)
-                        self.current_line_output = ""
-            except queue.Empty:
-                break
+        """Reads pending child output in chunks and assembles it into lines."""
+        for stream, chunk in self._read_available_output():
+            decoder = self._decoders.get(stream)
+            if decoder is None:
+                continue
+            self._append_output(decoder.decode(chunk, final=not chunk))
+            if not chunk:
+                del self._decoders[stream]
+                stream.close()
+
+    def _layout_line(self, line):
+        """
+        Returns the screen rows a line wraps onto, starting one column in.
+        Layouts are cached per line so scrolling reuses them instead of re-wrapping.
+        """
+        rows = self._line_layouts.get(line)
+        if rows is not None:
+            return rows
+
+        wrap = max(1, self.width - 1)
+        pad = [None] * self.width
+        rows = [
+            ([None] + list(line[i : i + wrap]) + pad)[: self.width]
+            for i in range(0, max(len(line), 1), wrap)
+        ]
+        if len(self._line_layouts) >= 4 * self.height:
+            self._line_layouts.clear()
+        self._line_layouts[line] = rows
+        return rows
 
     def render_img_frame(self, frame_number):
         self.update_history_from_queue()
-        self.image_buffer.clear_buffer(val=None)
-
-        all_lines = list(self.terminal_history)
-        if self.current_line_output:
-            all_lines.append(self.current_line_output)
-
-        display_lines = all_lines[-(self.max_lines - 1) :] if all_lines else []
-
-        y_offset = 1
-        for line in display_lines:
-            self.image_buffer.put_at(1, y_offset, line, transparent=False)
-            y_offset += 1
 
         is_active = self.active_process and self.active_process.poll() is None
         current_prompt = self.prompt if not is_active else ""
-        self.image_buffer.put_at(
-            1, y_offset, current_prompt + self.current_input + "_", transparent=False
-        )
+        tail = [current_prompt + self.current_input + "_"]
+        if self.current_line_output:
+            tail.insert(0, self.current_line_output)
+
+        # Walk back from the newest line only until the visible rows are filled
+        rows = []
+        for line in itertools.chain(reversed(tail), reversed(self.terminal_history)):
+            rows[:0] = self._layout_line(line)
+            if len(rows) >= self.max_lines:
+                break
+        rows = rows[-self.max_lines :] if self.max_lines > 0 else []
+
+        # Only rows whose layout changed since the last frame are copied over
+        for y in range(self.height):
+            row = rows[y - 1] if 0 < y <= len(rows) else self._blank_row
+            if self._drawn_rows[y] is not row:
+                self.image_buffer.buffer[y] = row[:]
+                self._drawn_rows[y] = row
+
+    def handle_input(self) -> bool:
+        """
+        Applies every pending key event to the input line.
+
+        Returns:
+            bool: True if a stop key (ESC) was pressed.
+        """
+        while True:
+            event = self.screen.get_event()
+            if event is None:
+                return False
+
+            if event in (-1, 27, getattr(Screen, "KEY_ESCAPE", -1)):
+                return True
+            elif event in (10, 13):
+                self.execute_command()
+            elif event in (-300, 8, 127, getattr(Screen, "KEY_BACK", -300)):
+                self.current_input = self.current_input[:-1]
+            elif isinstance(event, int) and 32 <= event <= 126:
+                self.current_input += chr(event)
 
     def run(self, end_message=True):
         _win32 = sys.platform == "win32"
@@ -183,43 +317,38 @@ class TerminalRenderer(BaseRenderer):
             self.display_buffer.clear_buffer(val=self.background)
 
             frame = 0
-            while self.frames == INF or frame < self.frames:
+            should_stop = False
+            while not should_stop and (self.frames == INF or frame < self.frames):
                 frame_start = time.perf_counter()
                 if self.screen.has_resized():
                     raise ScreenResizedError("Resized.")
 
-                should_stop = False
-                while True:
-                    event = self.screen.get_event()
-                    if event is None:
-                        break
-
-                    if event in (-1, 27, getattr(Screen, "KEY_ESCAPE", -1)):
-                        should_stop = True
-                        break
-                    elif event in (10, 13):
-                        self.execute_command()
-                    elif event in (-300, 8, 127, getattr(Screen, "KEY_BACK", -300)):
-                        self.current_input = self.current_input[:-1]
-                    elif isinstance(event, int) and 32 <= event <= 126:
-                        self.current_input += chr(event)
-
-                if should_stop:
+                if self.handle_input():
                     break
 
                 self.render_to_back_buffer(frame)
                 self.swap_buffers()
                 self.present_frame()
 
-                remaining = self.frame_time - (time.perf_counter() - frame_start)
-                if remaining > 0:
-                    sleep(remaining)
+                # Wait out the frame, redrawing the prompt as soon as keys arrive
+                while True:
+                    remaining = self.frame_time - (time.perf_counter() - frame_start)
+                    if remaining <= 0 or not self.wait_for_input(remaining):
+                        break
+                    if self.handle_input():
+                        should_stop = True
+                        break
+                    self.render_overlay_to_back_buffer(frame)
+                    self.swap_buffers()
+                    self.present_frame()
                 frame += 1
         except KeyboardInterrupt:
             pass
         finally:
             if self.active_process:
                 self.active_process.terminate()
+            if self._selector is not None:
+                self._selector.close()
             if _original_console_mode is not None:
                 import ctypes
 
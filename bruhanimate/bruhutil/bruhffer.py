@@ -28,12 +28,14 @@ class Buffer:
         self._empty_line = [" " for _ in range(self._width)]
         self.buffer = [self._empty_line[:] for _ in range(self._height)]
 
-    def get_buffer_changes(self, in_buf):
+    def get_buffer_changes(self, in_buf, rows=None):
         """
         Compare this buffer with the given buffer and yield differences.
 
         Args:
             in_buf (Buffer): The buffer to compare with.
+            rows (Iterable[int], optional): Only compare these rows, in this
+                                            order. Defaults to every row.
 
         Yields:
             Tuple[int, int, str]: A tuple containing the row index, column index,
@@ -43,7 +45,7 @@ class Buffer:
         if self._height != in_buf.height() or self._width != in_buf.width():
             raise ValueError("Buffer dimensions must match")
 
-        for y in range(self._height):
+        for y in range(self._height) if rows is None else rows:
             if self.buffer[y] == in_buf.buffer[y]:
                 continue
             for x in range(self._width):
@@ -150,6 +152,31 @@ class Buffer:
                 if c != " ":
                     self.put_char(x + i, y, c)
 
+    def put_block(self, x, y, rows):
+        """
+        Place a rectangular block of cells with its top-left corner at (x, y).
+
+        The block is clipped against the buffer edges and each visible row is
+        copied with a single slice assignment, so the cost depends only on the
+        visible area and not on the size of the source block.
+
+        Parameters:
+            x (int): The column index of the block's left edge (may be negative).
+            y (int): The row index of the block's top edge (may be negative).
+            rows (Sequence[Sequence]): Rows of cell values. Every row must have
+                                       the same length.
+        """
+        if not rows:
+            return
+        x0 = max(0, x)
+        x1 = min(self._width, x + len(rows[0]))
+        y0 = max(0, y)
+        y1 = min(self._height, y + len(rows))
+        if x0 >= x1 or y0 >= y1:
+            return
+        for by in range(y0, y1):
+            self.buffer[by][x0:x1] = rows[by - y][x0 - x : x1 - x]
+
     def scroll(self, shift):
         """
         Scroll the buffer up or down by a specified number of lines.
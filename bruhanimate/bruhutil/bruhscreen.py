@@ -17,9 +17,12 @@ limitations under the License.
 
 from __future__ import absolute_import, division, print_function, unicode_literals
 
+import collections
 import os
+import select
 import signal
 import sys
+import time
 
 ENABLE_EXTENDED_FLAGS = 0x0080
 ENABLE_QUICK_EDIT_MODE = 0x0040
@@ -277,16 +280,29 @@ if sys.platform == "win32":
             """
             win32console.SetConsoleTitle(title)
 
-        def wait_for_input(self, timeout: int) -> None:
+        def wait_for_input(self, timeout: float) -> bool:
             """
             Wait for user input in the console with a specified timeout period.
 
             :param timeout: The time in seconds to wait for user input before timing out.
+            :return: True if input became available before the timeout, otherwise False.
             :raises RuntimeError: If an unexpected return code is encountered during the wait.
             """
             rc = win32event.WaitForSingleObject(self._stdin, int(timeout * 1000))
             if rc not in [0, 258]:
                 raise RuntimeError(rc)
+            return rc == 0
+
+        def get_events(self):
+            """
+            Consume every pending console input event and return the translated key codes.
+
+            :return: A list of key codes, empty if no key events were pending.
+            """
+            events = []
+            while (event := self.get_event()) is not None:
+                events.append(event)
+            return events
 
         def get_event(self):
             """
@@ -494,16 +510,164 @@ else:
         KEY_CONTROL = -601
         KEY_MENU = -602
 
+        # Terminal escape sequences (normal and application cursor modes).
+        _ESCAPE_SEQUENCES = {
+            b"\x1b[A": KEY_UP,
+            b"\x1b[B": KEY_DOWN,
+            b"\x1b[C": KEY_RIGHT,
+            b"\x1b[D": KEY_LEFT,
+            b"\x1bOA": KEY_UP,
+            b"\x1bOB": KEY_DOWN,
+            b"\x1bOC": KEY_RIGHT,
+            b"\x1bOD": KEY_LEFT,
+            b"\x1b[H": KEY_HOME,
+            b"\x1b[F": KEY_END,
+            b"\x1bOH": KEY_HOME,
+            b"\x1bOF": KEY_END,
+            b"\x1b[1~": KEY_HOME,
+            b"\x1b[2~": KEY_INSERT,
+            b"\x1b[3~": KEY_DELETE,
+            b"\x1b[4~": KEY_END,
+            b"\x1b[5~": KEY_PAGE_UP,
+            b"\x1b[6~": KEY_PAGE_DOWN,
+            b"\x1b[7~": KEY_HOME,
+            b"\x1b[8~": KEY_END,
+            b"\x1b[Z": KEY_BACK_TAB,
+            b"\x1bOP": KEY_F1,
+            b"\x1bOQ": KEY_F2,
+            b"\x1bOR": KEY_F3,
+            b"\x1bOS": KEY_F4,
+            b"\x1b[15~": KEY_F5,
+            b"\x1b[17~": KEY_F6,
+            b"\x1b[18~": KEY_F7,
+            b"\x1b[19~": KEY_F8,
+            b"\x1b[20~": KEY_F9,
+            b"\x1b[21~": KEY_F10,
+            b"\x1b[23~": KEY_F11,
+            b"\x1b[24~": KEY_F12,
+        }
+
+        def _parse_input(self, data):
+            """
+            Translate raw terminal bytes into key codes in a single pass.
+
+            Incomplete escape sequences or UTF-8 characters at the end of the data
+            are kept and completed by the next read.
+
+            :param data: Bytes read from the terminal.
+            :return: A list of key codes.
+            """
+            data = self._pending_input + data
+            self._pending_input = b""
+            events = []
+            i, n = 0, len(data)
+            while i < n:
+                c = data[i]
+                if c == 0x1B:
+                    if i + 1 == n:
+                        # A lone ESC: a full escape sequence arrives in one read.
+                        events.append(self.KEY_ESCAPE)
+                        i += 1
+                        continue
+                    if data[i + 1] not in b"[O":
+                        events.append(self.KEY_ESCAPE)
+                        i += 1
+                        continue
+                    end = i + 2
+                    if data[i + 1 : i + 2] == b"[":
+                        # CSI: parameters then a final byte in 0x40-0x7E
+                        while end < n and not 0x40 <= data[end] <= 0x7E:
+                            end += 1
+                    if end >= n:
+                        self._pending_input = data[i:]
+                        break
+                    seq = data[i : end + 1]
+                    if seq == b"\x1b[M":
+                        # X10 mouse report: three raw bytes follow
+                        if end + 3 >= n:
+                            self._pending_input = data[i:]
+                            break
+                        end += 3
+                    elif seq in self._ESCAPE_SEQUENCES:
+                        events.append(self._ESCAPE_SEQUENCES[seq])
+                    i = end + 1
+                elif c in (0x7F, 0x08):
+                    events.append(self.KEY_BACK)
+                    i += 1
+                elif c in (0x0A, 0x0D):
+                    events.append(10)
+                    i += 1
+                elif c < 0x80:
+                    events.append(c)
+                    i += 1
+                else:
+                    size = 2 if c >= 0xC0 else 1
+                    size = 3 if c >= 0xE0 else size
+                    size = 4 if c >= 0xF0 else size
+                    if i + size > n:
+                        self._pending_input = data[i:]
+                        break
+                    text = data[i : i + size].decode("utf-8", errors="replace")
+                    events.extend(ord(ch) for ch in text)
+                    i += size
+            return events
+
+        def _read_input(self):
+            """Read every byte currently waiting on stdin and queue the parsed key codes."""
+            while self._stdin_fd is not None:
+                try:
+                    ready, _, _ = select.select([self._stdin_fd], [], [], 0)
+                except (OSError, ValueError):
+                    return
+                if not ready:
+                    return
+                try:
+                    data = os.read(self._stdin_fd, 4096)
+                except (BlockingIOError, InterruptedError):
+                    return
+                if not data:
+                    # stdin hit EOF: stop selecting on it so waits don't spin
+                    self._stdin_fd = None
+                    return
+                self._events.extend(self._parse_input(data))
+
+        def wait_for_input(self, timeout):
+            """
+            Block until keyboard input is available or the timeout expires.
+
+            :param timeout: The time in seconds to wait.
+            :return: True if input is available, otherwise False.
+            """
+            if self._events:
+                return True
+            if self._stdin_fd is None:
+                time.sleep(max(0, timeout))
+                return False
+            try:
+                ready, _, _ = select.select([self._stdin_fd], [], [], max(0, timeout))
+            except InterruptedError:
+                return False
+            return bool(ready)
+
+        def get_events(self):
+            """
+            Read all pending input and return every parsed key code.
+
+            :return: A list of key codes, empty if there was no input.
+            """
+            self._read_input()
+            events = list(self._events)
+            self._events.clear()
+            return events
+
         def get_event(self):
-            c = self.screen.getch()
-            if c != curses.ERR:
-                if c in (curses.KEY_BACKSPACE, 127, 8):
-                    return self.KEY_BACK
-                elif c in (10, 13, curses.KEY_ENTER):
-                    return 10
-                elif c == 27:
-                    return self.KEY_ESCAPE
-                return c
+            """
+            Return the next pending key code, or None if there is no input.
+            """
+            if not self._events:
+                self._read_input()
+            if self._events:
+                return self._events.popleft()
             return None
 
         def __init__(self, window, height=None):
@@ -536,6 +700,9 @@ else:
             self._clear_screen = curses.tigetstr("clear").decode("utf-8")
             self._bytes_to_read = 0
             self._bytes_to_return = b""
+            self._stdin_fd = sys.stdin.fileno()
+            self._pending_input = b""
+            self._events = collections.deque()
             self._cur_x = 0
             self._cur_y = 0
             self._buffering = False
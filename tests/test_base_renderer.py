@@ -1,6 +1,8 @@
 import pytest
 
+from bruhanimate.bruheffect.base_effect import BaseEffect
 from bruhanimate.bruhrenderer.base_renderer import BaseRenderer
+from bruhanimate.bruhrenderer.frame_cache import FrameCache
 from bruhanimate.bruhutil.bruherrors import InvalidEffectTypeError
 
 
@@ -86,3 +88,121 @@ def test_base_renderer_update_exit_stats():
     assert renderer.exit_messages["x_loc"] == 2
     assert renderer.exit_messages["y_loc"] == 3
     assert renderer.exit_messages["centered"] is False
+
+
+def test_base_renderer_update_frame_budget():
+    screen = MockScreen(20, 40)
+    renderer = DummyRenderer(screen, frame_time=0.02, effect_type="plasma")
+
+    renderer.update_frame_budget(0.5)
+    assert renderer.effect.frame_budget == 0.01
+
+    renderer.update_frame_budget(None)
+    assert renderer.effect.frame_budget is None
+
+
+class CachingRenderer(DummyRenderer):
+    def img_frame_key(self, frame_number: int):
+        return 0
+
+
+def test_frame_cache_evicts_least_recently_used():
+    cache = FrameCache(max_frames=2)
+    cache.put("a", [[1]])
+    cache.put("b", [[2]])
+    assert cache.get("a") == [[1]]
+    cache.put("c", [[3]])
+
+    assert "a" in cache and "c" in cache
+    assert "b" not in cache
+    assert cache.get("b") is None
+
+
+def test_base_renderer_skips_unchanged_static_frames():
+    renderer = CachingRenderer(MockScreen(5, 8), effect_type="static", background="x")
+    calls = []
+    render_frame = renderer.effect.render_frame
+    renderer.effect.render_frame = lambda frame: (
+        calls.append(frame) or render_frame(frame)
+    )
+
+    assert renderer.render_to_back_buffer(0)
+    renderer.swap_buffers()
+    renderer.present_frame()
+    for frame in range(1, 5):
+        assert not renderer.render_to_back_buffer(frame)
+
+    assert calls == [0]
+    assert renderer.current_buffer.buffer == [["x"] * 8 for _ in range(5)]
+
+
+def test_base_renderer_reuses_periodic_frames():
+    cached = CachingRenderer(MockScreen(6, 12), effect_type="julia")
+    uncached = DummyRenderer(MockScreen(6, 12), effect_type="julia")
+    for renderer in (cached, uncached):
+        renderer.effect.max_tick, renderer.effect.min_tick = 3, -3
+
+    for frame in range(30):
+        for renderer in (cached, uncached):
+            renderer.render_to_back_buffer(frame)
+            renderer.swap_buffers()
+            renderer.present_frame()
+        assert cached.last_displayed.buffer == uncached.last_displayed.buffer
+        assert cached.effect.tick == uncached.effect.tick
+
+    assert cached.frame_cache.hits > 0
+    assert len(cached.frame_cache) == 7
+
+
+class RowEffect(BaseEffect):
+    def render_frame(self, frame_number):
+        if frame_number == 0:
+            return None
+        self.buffer.put_char(frame_number, 2, "#")
+        return [2, (0, 4, 3, 1)]
+
+
+def test_base_renderer_composites_only_changed_rows():
+    renderer = CachingRenderer(MockScreen(6, 10), effect_type="static")
+    renderer.effect = RowEffect(renderer.create_buffer(), " ")
+    for frame in range(3):
+        assert renderer.render_to_back_buffer(frame)
+        renderer.swap_buffers()
+        if frame:
+            assert renderer._changed_rows == [2, 4]
+        renderer.present_frame()
+
+    assert "".join(renderer.last_displayed.buffer[2]) == " ##       "
+
+
+def test_base_renderer_skips_frames_without_changes():
+    renderer = CachingRenderer(MockScreen(6, 10), effect_type="drawlines")
+    renderer.effect.add_line((0, 0), (5, 5))
+    assert renderer.render_to_back_buffer(0)
+    renderer.swap_buffers()
+    renderer.present_frame()
+
+    assert not renderer.render_to_back_buffer(1)
+    assert renderer.frames_until_change(1) == float("inf")
+    assert renderer.current_buffer.buffer == renderer.last_displayed.buffer
+
+
+def test_base_renderer_run_sleeps_through_idle_frames():
+    renderer = CachingRenderer(
+        MockScreen(5, 8), frames=20, frame_time=0.005, effect_type="static"
+    )
+    calls = []
+    render_frame = renderer.effect.render_frame
+    renderer.effect.render_frame = lambda frame: (
+        calls.append(frame) or render_frame(frame)
+    )
+    frames_until_change = renderer.frames_until_change
+    waits = []
+    renderer.frames_until_change = lambda frame: (
+        waits.append(frames_until_change(frame)) or waits[-1]
+    )
+
+    renderer.run(end_message=False)
+
+    assert calls == [0]
+    assert waits == [float("inf")]
@@ -0,0 +1,43 @@
+import numpy as np
+
+from bruhanimate.bruheffect.boids_effect import BoidsEffect
+from bruhanimate.bruheffect.settings import BoidsSettings
+from bruhanimate.bruhutil.bruhffer import Buffer
+
+
+def test_boids_neighbor_pairs_match_brute_force():
+    for perception in (12.0, 3.0, 0.5):
+        effect = BoidsEffect(
+            Buffer(30, 80),
+            " ",
+            BoidsSettings(num_boids=400, perception=perception),
+        )
+        pairs = sorted(
+            pair
+            for i, j, _ in effect._neighbor_pairs()
+            for pair in zip(i.tolist(), j.tolist())
+        )
+
+        pos = effect._pos
+        dist = np.sqrt(((pos[:, None] - pos[None]) ** 2).sum(axis=2))
+        np.fill_diagonal(dist, np.inf)
+        expected = sorted(zip(*(idx.tolist() for idx in np.nonzero(dist < perception))))
+        assert pairs == expected
+
+
+def test_boids_draw_one_glyph_per_occupied_cell():
+    effect = BoidsEffect(
+        Buffer(20, 40), ".", BoidsSettings(num_boids=50, color=False, char="o")
+    )
+    effect.render_frame(0)
+
+    xs = effect._pos[:, 0].astype(int)
+    ys = effect._pos[:, 1].astype(int)
+    drawn = {
+        (x, y)
+        for y, row in enumerate(effect.buffer.buffer)
+        for x, cell in enumerate(row)
+        if cell == "o"
+    }
+    assert drawn == set(zip(xs.tolist(), ys.tolist()))
+    assert effect.buffer.get_char(0, 0) in ("o", ".")
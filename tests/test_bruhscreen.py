@@ -0,0 +1,45 @@
+import sys
+
+import pytest
+
+from bruhanimate.bruhutil.bruhscreen import Screen
+
+pytestmark = pytest.mark.skipif(
+    sys.platform == "win32", reason="parses POSIX terminal input"
+)
+
+
+def make_screen():
+    screen = Screen.__new__(Screen)
+    screen._pending_input = b""
+    return screen
+
+
+def test_parse_input_keys_and_escape_sequences():
+    screen = make_screen()
+    events = screen._parse_input(b"ab\x1b[A\x1bOB\x1b[3~\r\x7f\x1b")
+
+    assert events == [
+        ord("a"),
+        ord("b"),
+        Screen.KEY_UP,
+        Screen.KEY_DOWN,
+        Screen.KEY_DELETE,
+        10,
+        Screen.KEY_BACK,
+        Screen.KEY_ESCAPE,
+    ]
+
+
+def test_parse_input_completes_split_sequences():
+    screen = make_screen()
+
+    assert screen._parse_input(b"x\x1b[1") == [ord("x")]
+    assert screen._parse_input(b"5~\xc3") == [Screen.KEY_F5]
+    assert screen._parse_input(b"\xa9") == [ord("é")]
+
+
+def test_parse_input_skips_mouse_reports():
+    screen = make_screen()
+    assert screen._parse_input(b"\x1b[M abq") == [ord("q")]
+    assert screen._parse_input(b"\x1b[<0;10;5Mz") == [ord("z")]
@@ -41,3 +41,12 @@ def test_buffer_get_char_out_of_bounds():
     b = Buffer(5, 5)
     assert b.get_char(10, 10) is None
     assert b.get_char(-1, -1) is None
+
+
+def test_buffer_put_block_clips():
+    """Ensure put_block copies a block and clips it to the buffer edges."""
+    b = Buffer(3, 4)
+    b.put_block(-1, 1, ["abc", "def", "ghi"])
+    assert b.buffer[0] == [" "] * 4
+    assert b.buffer[1] == ["b", "c", " ", " "]
+    assert b.buffer[2] == ["e", "f", " ", " "]
@@ -0,0 +1,105 @@
+import random
+
+import numpy as np
+import pytest
+
+from bruhanimate.bruheffect.fire_effect import FireEffect
+from bruhanimate.bruheffect.settings import FireSettings
+from bruhanimate.bruhutil.bruhffer import Buffer
+
+
+@pytest.mark.parametrize(
+    "use_char_color, background_color",
+    [(False, False), (True, False), (False, True)],
+)
+@pytest.mark.parametrize("jitter, flash", [(0.0, False), (0.1, False), (-0.1, True)])
+def test_fire_glyph_lut_matches_get_colored_char(
+    monkeypatch, use_char_color, background_color, jitter, flash
+):
+    effect = FireEffect(
+        Buffer(4, 8),
+        " ",
+        FireSettings(use_char_color=use_char_color, background_color=background_color),
+    )
+    roll = 0.0 if flash else 1.0
+    monkeypatch.setattr(random, "uniform", lambda a, b: jitter)
+    monkeypatch.setattr(random, "random", lambda: roll)
+    monkeypatch.setattr(
+        np.random, "uniform", lambda a, b, shape: np.full(shape, 1 + jitter)
+    )
+    monkeypatch.setattr(np.random, "random", lambda shape: np.full(shape, roll))
+
+    intensities = np.linspace(0, 255, 512)
+    glyphs = np.take(effect._glyph_lut(), effect._glyph_indices(intensities))
+    assert glyphs.tolist() == [effect.get_colored_char(i) for i in intensities]
+
+
+def test_fire_render_frame_writes_table_glyphs():
+    effect = FireEffect(Buffer(10, 20), " ", FireSettings(use_char_color=True))
+    for frame in range(30):
+        effect.render_frame(frame)
+    table = set(effect._glyph_lut().tolist())
+    assert all(cell in table for row in effect.buffer.buffer for cell in row)
+
+    effect.set_fire_background_color(True)
+    effect.render_frame(30)
+    assert effect._glyph_lut()[len(effect.color_map)].startswith("\x1b[")
+
+
+def reference_update(previous, cooling, wind_offset_x):
+    """The original roll-based propagation, without turbulence or heat spots."""
+    left = np.roll(previous, -1, axis=1)
+    right = np.roll(previous, 1, axis=1)
+    up = np.roll(previous, -1, axis=0)
+    base = (up * 1.8 + left * 1.2 + right * 1.2) / 4.2
+    if wind_offset_x != 0:
+        base = np.roll(base, wind_offset_x, axis=1)
+    return base[1:, :] * cooling[:-1, :]
+
+
+@pytest.mark.parametrize("wind_strength", [0.0, 1.0])
+def test_fire_update_matches_roll_reference(wind_strength):
+    effect = FireEffect(
+        Buffer(12, 30),
+        " ",
+        FireSettings(
+            intensity=0.6,
+            wind_direction=180.0,
+            wind_strength=wind_strength,
+            heat_spot_intensity=0.0,
+        ),
+    )
+    for frame in range(20):
+        effect.render_frame(frame)
+
+    buffers = {id(effect.previous_data), id(effect.current_data)}
+    for frame in range(20, 30):
+        previous = effect.previous_data.copy()
+        bottom = effect.current_data[-1].copy()
+        wind_offset_x = int(
+            np.cos(effect.wind_direction + np.sin(frame * 0.05) * 0.2)
+            * wind_strength
+            * 2
+        )
+        effect.update_data(frame)
+        expected = reference_update(previous, effect.height_cooling_map, wind_offset_x)
+        assert np.allclose(effect.previous_data[:-1], expected, rtol=1e-6)
+        assert np.array_equal(effect.previous_data[-1], bottom)
+        effect.add_new_fire_row(frame)
+        assert {id(effect.previous_data), id(effect.current_data)} == buffers
+
+
+def test_fire_heat_spots_rise_and_expire():
+    effect = FireEffect(Buffer(40, 30), " ", FireSettings(heat_spot_intensity=0.0))
+    effect.spawn_heat_spot()
+    assert (effect.spot_lifetime > 0).sum() == 1
+    i = int(np.argmax(effect.spot_lifetime))
+    lifetime, start_y = effect.spot_lifetime[i], effect.spot_y[i]
+
+    effect.update_heat_spots()
+    assert effect.spot_y[i] <= start_y
+    assert effect.current_data.max() >= 255 * 0.5
+
+    for _ in range(lifetime):
+        effect.update_heat_spots()
+    assert not effect.spot_lifetime.any()
@@ -0,0 +1,70 @@
+from bruhanimate.bruhrenderer.focus_renderer import FocusRenderer
+
+
+class MockScreen:
+    def __init__(self, height=20, width=40):
+        self.height = height
+        self.width = width
+
+    def begin_frame(self):
+        pass
+
+    def flush_frame(self):
+        pass
+
+    def print_at(self, text, x, y, width):
+        pass
+
+    def has_resized(self):
+        return False
+
+
+def test_focus_renderer_converges_to_image():
+    screen = MockScreen(12, 30)
+    img = ["HELLO", "WORLD"]
+    renderer = FocusRenderer(screen, img, effect_type="static")
+
+    assert renderer.moving == renderer.glyphs.size - (renderer.arrival == 0).sum()
+
+    frame = 0
+    while not renderer.solved("end"):
+        renderer.render_img_frame(frame)
+        frame += 1
+        assert frame <= 30
+
+    assert renderer.moving == 0
+    assert frame == renderer.arrival.max()
+    for y, row in enumerate(img):
+        assert (
+            "".join(
+                renderer.image_buffer.grab_slice(
+                    renderer.img_x_start, renderer.img_y_start + y, len(row)
+                )
+            )
+            == row
+        )
+
+
+def test_focus_renderer_reverse_returns_to_start():
+    screen = MockScreen(12, 30)
+    renderer = FocusRenderer(
+        screen,
+        ["AB"],
+        effect_type="static",
+        reverse=True,
+        start_reverse=40,
+        loop=False,
+    )
+
+    for frame in range(40):
+        renderer.render_img_frame(frame)
+    assert renderer.solved("end")
+
+    frame = 40
+    while not renderer.solved("start"):
+        renderer.render_img_frame(frame)
+        frame += 1
+
+    assert (renderer.current_positions == renderer.start_positions).all()
+    renderer.render_img_frame(frame)
+    assert all(c is None for row in renderer.image_buffer.buffer for c in row)
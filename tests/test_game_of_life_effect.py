@@ -0,0 +1,163 @@
+import numpy as np
+import pytest
+
+from bruhanimate.bruheffect import game_of_life_effect
+from bruhanimate.bruheffect.game_of_life_effect import (
+    GameOfLifeEffect,
+    PackedLifeWorld,
+    parse_rle,
+)
+from bruhanimate.bruheffect.settings import GameOfLifeSettings
+from bruhanimate.bruhutil.bruhffer import Buffer
+
+
+def reference_step(effect, board):
+    """Per-cell rules, matching the original scalar implementation."""
+    h, w = len(board), len(board[0])
+    new = [row[:] for row in board]
+    for y in range(h):
+        for x in range(w):
+            n = sum(
+                1
+                for dy in (-1, 0, 1)
+                for dx in (-1, 0, 1)
+                if (dy or dx)
+                and 0 <= y + dy < h
+                and 0 <= x + dx < w
+                and board[y + dy][x + dx] == effect.ALIVE
+            )
+            if board[y][x] == effect.ALIVE:
+                if not effect.rules["life"][0] <= n <= effect.rules["life"][1]:
+                    new[y][x] = effect.ALIVE - 1
+            elif effect.rules["death"][0] <= n <= effect.rules["death"][1]:
+                new[y][x] = effect.ALIVE
+            else:
+                new[y][x] = max(0, board[y][x] - 1)
+    return new
+
+
+def test_game_of_life_matches_reference_with_decay():
+    effect = GameOfLifeEffect(
+        Buffer(12, 20), " ", GameOfLifeSettings(decay=True, color_type="RAINBOW")
+    )
+    effect.render_frame(0)
+    expected = effect.board.tolist()
+
+    for frame in range(1, 8):
+        expected = reference_step(effect, expected)
+        effect.render_frame(frame)
+        assert effect.board.tolist() == expected
+
+    for y in range(12):
+        for x in range(20):
+            assert effect.buffer.get_char(x, y) == effect._glyphs[expected[y][x]]
+
+
+def test_game_of_life_blinker_oscillates():
+    effect = GameOfLifeEffect(Buffer(5, 5), " ")
+    effect.board[2, 1:4] = effect.ALIVE
+
+    effect.step()
+    assert np.array_equal(np.flatnonzero(effect.board[:, 2]), [1, 2, 3])
+    assert effect.board.sum() == 3 * effect.ALIVE
+
+    effect.step()
+    assert np.array_equal(np.flatnonzero(effect.board[2]), [1, 2, 3])
+
+
+def test_game_of_life_active_tiles_match_full_board():
+    effect = GameOfLifeEffect(
+        Buffer(40, 100), " ", GameOfLifeSettings(decay=True, color_type="RAINBOW")
+    )
+    effect.render_frame(0)
+    # Activity spreads at most one cell per generation, so the right side of
+    # the board stays quiet
+    effect.board[:, 30:] = effect.DEAD
+    effect._invalidate()
+    expected = effect.board.tolist()
+
+    for frame in range(1, 30):
+        expected = reference_step(effect, expected)
+        effect.render_frame(frame)
+        assert effect.board.tolist() == expected
+    assert not effect._tiles.active[:, 9:].any()
+
+    glyphs = effect._glyphs[np.array(expected)].tolist()
+    assert effect.buffer.buffer == glyphs
+
+
+def test_game_of_life_still_life_goes_idle():
+    effect = GameOfLifeEffect(Buffer(24, 40), " ")
+    effect.render_frame(0)
+    effect.board.fill(effect.DEAD)
+    effect.load_rle("x = 2, y = 2\n2o$2o!", 30, 4)
+
+    # Loading redraws everything; the block never changes, so every tile goes quiet
+    assert effect.render_frame(1) is None
+    assert effect._tiles.idle
+    assert effect.frames_until_change(1) == float("inf")
+    assert effect.render_frame(2) == []
+    assert effect.buffer.get_char(30, 4) == effect._glyphs[effect.ALIVE]
+
+    effect.load_rle(GLIDER, 2, 2)
+    changes = effect.render_frame(3)
+    assert changes is None
+    changes = effect.render_frame(4)
+    assert changes and all(x < 16 and y < 16 for x, y, _, _ in changes)
+
+
+GLIDER = """
+#N Glider
+x = 3, y = 3, rule = B3/S23
+bob$2bo$3o!
+"""
+
+
+def test_parse_rle_glider():
+    cells = parse_rle(GLIDER)
+    assert cells.astype(int).tolist() == [[0, 1, 0], [0, 0, 1], [1, 1, 1]]
+
+
+@pytest.mark.parametrize("band_words", [4, 1 << 13])
+def test_packed_world_matches_unpacked_rules(monkeypatch, band_words):
+    monkeypatch.setattr(game_of_life_effect, "STEP_BAND_WORDS", band_words)
+    rng = np.random.default_rng(7)
+    world = PackedLifeWorld(128, 20)
+    world.randomize(0.3, rng)
+    cells = world.view(0, 0, 128, 20)
+
+    for _ in range(5):
+        padded = np.pad(cells, 1, mode="wrap").astype(np.uint8)
+        neighbors = sum(
+            padded[1 + dy : 21 + dy, 1 + dx : 129 + dx]
+            for dy in (-1, 0, 1)
+            for dx in (-1, 0, 1)
+            if dy or dx
+        )
+        cells = (neighbors == 3) | (cells & (neighbors == 2))
+        world.step(birth=[3], survive=[2, 3])
+        assert np.array_equal(world.view(0, 0, 128, 20), cells)
+    assert world.population == cells.sum()
+
+
+def test_packed_world_glider_wraps_around():
+    world = PackedLifeWorld(64, 8)
+    world.place(parse_rle(GLIDER), 62, 6)
+    start = world.view(0, 0, 64, 8)
+
+    # A glider moves one cell diagonally every four generations
+    for _ in range(4 * 8):
+        world.step(birth=[3], survive=[2, 3])
+    assert world.population == 5
+    assert np.array_equal(np.roll(start, (8, 8), axis=(0, 1)), world.view(0, 0, 64, 8))
+
+
+def test_game_of_life_world_viewport():
+    settings = GameOfLifeSettings(
+        world_size=(256, 128), pattern=GLIDER, viewport_velocity=(1.0, 0.0)
+    )
+    effect = GameOfLifeEffect(Buffer(10, 20), " ", settings)
+    effect.render_frame(0)
+
+    assert (effect.board == effect.ALIVE).sum() == 5
+    assert effect.viewport == (119.0, 59.0)
@@ -0,0 +1,91 @@
+import numpy as np
+
+from bruhanimate.bruheffect.julia_effect import FractalTileCache, JuliaEffect
+from bruhanimate.bruheffect.registry import effect_registry
+from bruhanimate.bruheffect.settings import JuliaSettings
+from bruhanimate.bruhutil.bruhffer import Buffer
+
+
+def reference_julia(effect, c):
+    """Scalar escape-time loop, matching the original implementation."""
+    xs = np.linspace(effect.x_min, effect.x_max, effect.buffer.width())
+    ys = np.linspace(effect.y_min, effect.y_max, effect.buffer.height())
+    result = np.empty((len(ys), len(xs)))
+    for i, x in enumerate(xs):
+        for j, y in enumerate(ys):
+            z = complex(x, y)
+            iteration = 0
+            while abs(z) < 2 and iteration < effect.max_iter:
+                z = z * z + c
+                iteration += 1
+            result[j, i] = iteration / effect.max_iter
+    return result
+
+
+def test_julia_matches_reference():
+    effect = JuliaEffect(Buffer(12, 30), " ")
+    c = complex(0.3, 0.355)
+    assert np.allclose(effect.julia(c), reference_julia(effect, c))
+
+
+def test_julia_smooth_values_are_normalized():
+    effect = JuliaEffect(Buffer(12, 30), " ", JuliaSettings(max_iter=40, smooth=True))
+    values = effect.julia(complex(0.355, 0.355))
+    assert values.min() >= 0 and values.max() <= 1
+    # Smooth counts produce fractional iteration values
+    assert not np.allclose(values * 40, np.round(values * 40))
+
+
+def test_julia_render_uses_palette():
+    effect = effect_registry.create(
+        "julia", Buffer(6, 10), " ", settings=JuliaSettings(palette="ab")
+    )
+    effect.render_frame(0)
+    assert {c for row in effect.buffer.buffer for c in row} <= {"a", "b"}
+
+
+def test_tile_cache_evicts_least_recently_used():
+    cache = FractalTileCache(max_bytes=2 * 16 * 16 * 4)
+    tiles = [np.zeros((16, 16), dtype=np.float32) for _ in range(3)]
+
+    cache.put((None, 0, 0, 0), tiles[0])
+    cache.put((None, 0, 1, 0), tiles[1])
+    assert cache.get((None, 0, 0, 0)) is tiles[0]
+
+    cache.put((None, 0, 2, 0), tiles[2])
+    assert len(cache) == 2
+    assert (None, 0, 1, 0) not in cache
+    assert (None, 0, 0, 0) in cache
+
+
+def test_zoom_reuses_tiles_when_reversing():
+    settings = JuliaSettings(zoom=True, zoom_speed=2.0, max_zoom=8.0, tile_size=8)
+    effect = JuliaEffect(Buffer(10, 20), " ", settings)
+
+    # Zoom in to max_zoom, then back out to the starting magnification
+    for frame in range(4):
+        effect.render_frame(frame)
+    misses = effect.tile_cache.misses
+    for frame in range(4, 6):
+        effect.render_frame(frame)
+    assert effect.magnification == 1.0
+
+    effect.render_frame(6)
+    assert effect.tile_cache.misses == misses
+
+
+def test_mandelbrot_progressive_converges_to_full_render():
+    settings = JuliaSettings(fractal="mandelbrot", bounds=(-2.5, 1.0, -1.2, 1.2))
+    full = JuliaEffect(Buffer(12, 30), " ", settings)
+    progressive = JuliaEffect(Buffer(12, 30), " ", settings)
+    full.render_frame(0)
+
+    progressive.set_frame_budget(0)
+    progressive.render_frame(0)
+    assert progressive.buffer.buffer != full.buffer.buffer
+
+    # The set doesn't change between frames, so refinement carries over
+    for frame in range(1, 200):
+        progressive.render_frame(frame)
+    assert progressive._progressive.complete
+    assert progressive.buffer.buffer == full.buffer.buffer
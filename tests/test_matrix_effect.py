@@ -0,0 +1,45 @@
+from bruhcolor import bruhcolored
+
+from bruhanimate.bruheffect.matrix_effect import MatrixEffect
+from bruhanimate.bruheffect.settings import MatrixSettings
+from bruhanimate.bruhutil.bruhffer import Buffer
+
+
+def expected_row(effect, y, gradient):
+    choices = effect._MatrixEffect__character_choices
+    characters = effect._MatrixEffect__buffer_characters[y]
+    offset = effect._MatrixEffect__color_frame_numbers[y]
+    return [
+        bruhcolored(choices[c], color=gradient[(x - offset) % len(gradient)]).colored
+        for x, c in enumerate(characters)
+    ]
+
+
+def test_matrix_draws_colored_strings_with_shifted_gradient():
+    settings = MatrixSettings(color_halt_range=(1, 1), gradient_length=2)
+    effect = MatrixEffect(Buffer(6, 60), " ", settings)
+    gradient = [c for c in effect.get_gradient() for _ in range(2)]
+
+    assert effect.render_frame(0) is None
+    for y in range(6):
+        assert effect.buffer.buffer[y] == expected_row(effect, y, gradient)
+
+    redrawn = []
+    for frame in range(1, 20):
+        rows = effect.render_frame(frame)
+        redrawn.extend(rows)
+        for y in rows:
+            assert effect.buffer.buffer[y] == expected_row(effect, y, gradient)
+    assert redrawn
+    assert all(isinstance(cell, str) for row in effect.buffer.buffer for cell in row)
+
+
+def test_matrix_set_gradient_rebuilds_glyphs():
+    effect = MatrixEffect(Buffer(3, 10), " ", MatrixSettings(color_randomness=1.0))
+    effect.render_frame(0)
+    effect.set_gradient([196, 46])
+    effect.set_properties(color_halt_range=(1, 1), color_randomness=1.0)
+
+    assert effect.render_frame(1) == [0, 1, 2]
+    for y in range(3):
+        assert effect.buffer.buffer[y] == expected_row(effect, y, [196, 46])
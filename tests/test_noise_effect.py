@@ -0,0 +1,45 @@
+from bruhcolor import bruhcolored
+
+from bruhanimate.bruheffect.noise_effect import NoiseEffect
+from bruhanimate.bruheffect.settings import NoiseSettings, StarSettings
+from bruhanimate.bruheffect.star_effect import StarEffect
+from bruhanimate.bruhutil import LIFE_COLORS
+from bruhanimate.bruhutil.bruhffer import Buffer
+
+
+def test_noise_hits_cells_at_intensity_and_keeps_the_rest():
+    effect = NoiseEffect(Buffer(50, 80), " ", NoiseSettings(intensity=300))
+    effect.buffer.clear_buffer(val="~")
+    effect.render_frame(0)
+
+    cells = [cell for row in effect.buffer.buffer for cell in row]
+    hits = sum(cell != "~" for cell in cells)
+    assert 0.25 < hits / len(cells) < 0.35
+    assert all(cell == "~" or cell in effect.noise for cell in cells)
+
+
+def test_noise_color_modes_use_prebuilt_glyphs():
+    effect = NoiseEffect(Buffer(10, 20), " ", NoiseSettings(intensity=999, color=True))
+    effect.render_frame(0)
+    glyphs = set(effect._glyph_lut().tolist())
+    assert len(glyphs) == len(set(effect.noise)) * 256
+    assert all(cell in glyphs for row in effect.buffer.buffer for cell in row)
+
+    effect.set_color(True, characters=False)
+    effect.render_frame(1)
+    assert effect._glyph_lut()[7] == bruhcolored(" ", on_color=7).colored
+
+
+def test_star_glyphs_cover_characters_and_palette():
+    effect = StarEffect(Buffer(10, 20), ".", StarSettings(color_type="RAINBOW"))
+    palette = LIFE_COLORS["RAINBOW"]
+    glyphs = effect._glyph_lut()
+    assert glyphs.size == len(effect.stars) * len(palette)
+    assert glyphs[-1] == bruhcolored("+", color=palette[-1]).colored
+
+    effect.set_color_type("GREYSCALE")
+    effect.render_frame(0)
+    table = set(effect._glyph_lut().tolist())
+    assert all(
+        cell == " " or cell in table for row in effect.buffer.buffer for cell in row
+    )
@@ -0,0 +1,73 @@
+from bruhanimate.bruhrenderer.pan_renderer import PanRenderer
+
+
+class MockScreen:
+    def __init__(self, height=20, width=40):
+        self.height = height
+        self.width = width
+
+    def begin_frame(self):
+        pass
+
+    def flush_frame(self):
+        pass
+
+    def print_at(self, text, x, y, width):
+        pass
+
+    def has_resized(self):
+        return False
+
+
+def test_pan_renderer_horizontal_viewport():
+    screen = MockScreen(5, 10)
+    img = ["ABC"]
+    renderer = PanRenderer(screen, img, effect_type="static", shift_rate=2)
+
+    # Frame 0: image is entirely off-screen to the left
+    renderer.render_img_frame(0)
+    assert all(c is None for row in renderer.image_buffer.buffer for c in row)
+
+    # Frame 2: leading edge at x=1, so "ABC" spans x=1..3 on the center row
+    renderer.render_img_frame(2)
+    assert renderer.image_buffer.grab_slice(0, 2, 5) == [None, "A", "B", "C", None]
+
+    # Frame 6: image partially off the right edge, old position cleared
+    renderer.render_img_frame(6)
+    assert renderer.image_buffer.grab_slice(0, 2, 10) == [None] * 9 + ["A"]
+
+
+def test_pan_renderer_horizontal_stops_without_loop():
+    screen = MockScreen(3, 4)
+    renderer = PanRenderer(screen, ["XY"], effect_type="static")
+
+    renderer.render_img_frame(3)
+    assert renderer.image_buffer.grab_slice(0, 1, 4) == [None, "X", "Y", None]
+
+    # Past width + img_width the image has left and is not drawn again
+    renderer.render_img_frame(7)
+    assert all(c is None for row in renderer.image_buffer.buffer for c in row)
+
+
+def test_pan_renderer_horizontal_loops():
+    screen = MockScreen(3, 4)
+    renderer = PanRenderer(screen, ["XY"], effect_type="static", loop=True)
+
+    renderer.render_img_frame(3)
+    first = [row[:] for row in renderer.image_buffer.buffer]
+    renderer.render_img_frame(3 + 6)
+    assert renderer.image_buffer.buffer == first
+
+
+def test_pan_renderer_vertical_transparent():
+    screen = MockScreen(6, 5)
+    img = ["A A", "BBB"]
+    renderer = PanRenderer(
+        screen, img, effect_type="static", direction="vertical", transparent=True
+    )
+
+    renderer.render_img_frame(3)
+    # Leading edge at y=1, image centered horizontally at x=1
+    assert renderer.image_buffer.grab_slice(0, 1, 5) == [None, "A", None, "A", None]
+    assert renderer.image_buffer.grab_slice(0, 2, 5) == [None, "B", "B", "B", None]
+    assert renderer.image_buffer.grab_slice(0, 0, 5) == [None] * 5
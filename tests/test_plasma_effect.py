@@ -0,0 +1,95 @@
+import math
+
+from bruhanimate.bruheffect.plasma_effect import PlasmaEffect
+from bruhanimate.bruheffect.settings import PlasmaSettings
+from bruhanimate.bruhutil.bruhffer import Buffer
+
+
+def reference_value(effect, x, y):
+    """Per-cell plasma value, matching the original scalar implementation."""
+    w, h = effect.buffer.width(), effect.buffer.height()
+    t3 = effect.t / 3.0
+
+    def wave(x, y, a, b, n):
+        return math.sin(
+            math.sqrt((x - w * a) ** 2 + 4 * (y - h * b) ** 2) * math.pi / n
+        )
+
+    value = (
+        abs(
+            wave(x + t3, y, 1 / 4, 1 / 3, effect.vals[0])
+            + wave(x, y, 1 / 8, 1 / 5, effect.vals[1])
+            + wave(x, y + t3, 1 / 2, 1 / 5, effect.vals[2])
+            + wave(x, y, 3 / 4, 4 / 5, effect.vals[3])
+        )
+        / 4.0
+    )
+    return effect.scale[int((len(effect.scale) - 1) * value)]
+
+
+def test_plasma_matches_reference():
+    effect = PlasmaEffect(Buffer(12, 30), " ", PlasmaSettings())
+    effect.set_plasma_values(43, 15, 8, 24)
+
+    for frame in range(3):
+        effect.render_frame(frame)
+
+    for y in range(12):
+        for x in range(30):
+            assert effect.buffer.get_char(x, y) == reference_value(effect, x, y)
+
+
+def test_plasma_values_invalidate_static_field():
+    effect = PlasmaEffect(Buffer(6, 10), " ", PlasmaSettings())
+    effect.render_frame(0)
+    cached = effect._static_field
+
+    effect.render_frame(1)
+    assert effect._static_field is cached
+
+    effect.set_plasma_values(10, 26, 19, 41)
+    effect.render_frame(2)
+    assert effect._static_field is not cached
+
+
+def test_plasma_palette_cycle_reuses_field():
+    effect = PlasmaEffect(Buffer(6, 10), " ", PlasmaSettings(palette_cycle=True))
+    effect.render_frame(0)
+    base = effect._cycle_base
+    period = len(effect._cycle_palette)
+
+    effect.render_frame(1)
+    assert effect._cycle_base is base
+
+    # Every cell advanced one step through the ping-pong palette
+    expected = effect._cycle_palette[(base + effect.t) % period]
+    assert effect.buffer.buffer == expected.tolist()
+
+
+def test_plasma_progressive_matches_full_render():
+    full = PlasmaEffect(Buffer(12, 30), " ", PlasmaSettings())
+    progressive = PlasmaEffect(Buffer(12, 30), " ", PlasmaSettings())
+    progressive.scale, progressive.colors = full.scale, full.colors
+    for effect in (full, progressive):
+        effect.set_plasma_values(43, 15, 8, 24)
+    progressive.set_frame_budget(10.0)
+
+    for frame in range(3):
+        full.render_frame(frame)
+        progressive.render_frame(frame)
+
+    assert progressive.buffer.buffer == full.buffer.buffer
+
+
+def test_plasma_palette_cycle_frame_keys_repeat_each_period():
+    effect = PlasmaEffect(Buffer(6, 10), " ", PlasmaSettings(palette_cycle=True))
+    assert effect.frame_key(0) is None
+    effect.render_frame(0)
+
+    period = len(effect._cycle_palette)
+    keys = []
+    for frame in range(1, 2 * period + 1):
+        keys.append(effect.frame_key(frame))
+        effect.skip_frame(frame)
+    assert keys[:period] == keys[period:]
+    assert len(set(keys)) == period
@@ -0,0 +1,54 @@
+import numpy as np
+
+from bruhanimate.bruheffect.progressive import ProgressiveField
+
+
+def make_sampler(field):
+    calls = []
+
+    def sample(ys, xs):
+        calls.append(len(ys))
+        return field[ys, xs]
+
+    return sample, calls
+
+
+def test_progressive_coarse_pass_fills_blocks():
+    field = np.arange(10 * 19, dtype=np.float64).reshape(10, 19)
+    sample, calls = make_sampler(field)
+    progressive = ProgressiveField()
+
+    values = progressive.render(field.shape, sample, budget=0)
+
+    assert calls == [2 * 3]
+    assert not progressive.complete
+    assert values[7, 7] == field[0, 0]
+    assert values[9, 18] == field[8, 16]
+
+
+def test_progressive_converges_and_samples_each_cell_once():
+    field = np.random.default_rng(1).random((13, 21))
+    sample, calls = make_sampler(field)
+    progressive = ProgressiveField()
+
+    for _ in range(200):
+        values = progressive.render(field.shape, sample, budget=0)
+        if progressive.complete:
+            break
+
+    assert progressive.complete
+    assert np.array_equal(values, field)
+    assert sum(calls) == field.size
+
+
+def test_progressive_reset_starts_over():
+    field = np.ones((8, 8))
+    sample, calls = make_sampler(field)
+    progressive = ProgressiveField()
+    progressive.render(field.shape, sample, budget=1.0)
+    assert progressive.complete
+
+    progressive.reset()
+    progressive.render(field.shape, sample, budget=0)
+    assert not progressive.complete
+    assert calls[-1] == 1
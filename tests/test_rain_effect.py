@@ -0,0 +1,41 @@
+from bruhanimate.bruheffect.rain_effect import RainEffect
+from bruhanimate.bruheffect.settings import RainSettings
+from bruhanimate.bruhutil.bruhffer import Buffer
+
+
+def rows(effect):
+    return ["".join(row) for row in effect.buffer.buffer]
+
+
+def test_rain_scrolls_down_and_drifts_with_wind():
+    effect = RainEffect(
+        Buffer(8, 30), " ", RainSettings(intensity=999, wind_direction="east")
+    )
+    effect.render_frame(0)
+    first = rows(effect)[0]
+    assert first.strip()
+
+    for frame in range(1, 4):
+        effect.render_frame(frame)
+    # Each frame moves the rain down a row and one column east
+    assert rows(effect)[3] == first[-3:] + first[:-3]
+    assert all(set(row) <= set(" ..\\") for row in rows(effect))
+
+
+def test_rain_splashes_on_ground_and_image():
+    effect = RainEffect(Buffer(10, 20), " ", RainSettings(intensity=999))
+    image = Buffer(10, 20).clear_buffer(val=None)
+    image.put_at(4, 6, "#" * 10)
+    effect.update_collision(4, 6, 10, 1, True, False, image)
+
+    for frame in range(30):
+        effect.render_frame(frame)
+        screen = rows(effect)
+        assert set(screen[-1]) <= set(" v")
+        assert set(screen[5][4:14]) <= set(" v")
+    assert "v" in screen[5][4:14]
+
+    # Splashes last a single frame
+    splashes = [x for x, char in enumerate(screen[5]) if char == "v"]
+    effect.render_frame(30)
+    assert all(rows(effect)[6][x] == " " for x in splashes)
@@ -0,0 +1,28 @@
+from bruhanimate.bruheffect.sand_effect import SandEffect
+from bruhanimate.bruheffect.settings import SandSettings
+from bruhanimate.bruhutil.bruhffer import Buffer
+
+
+def test_sand_column_falls_together_and_drains():
+    effect = SandEffect(Buffer(40, 30), " ", SandSettings(spawn_rate=0.0))
+    effect._grid[0:20, 5] = 1
+    assert effect.render_frame(0) is None
+
+    for frame in range(1, 19):
+        changes = effect.render_frame(frame)
+        # Every grain moves each frame, even across tile boundaries
+        assert effect._grid[:, 5].nonzero()[0].tolist() == list(
+            range(frame + 1, frame + 21)
+        )
+        assert changes == list(range(frame, frame + 21))
+    # Tiles the column has left behind are no longer processed
+    assert not effect._tiles.active[0].any()
+
+    frame = 19
+    while effect._grid.any():
+        effect.render_frame(frame)
+        frame += 1
+    effect.render_frame(frame)
+    assert effect._tiles.idle
+    assert effect.frames_until_change(frame) == float("inf")
+    assert all(cell == " " for row in effect.buffer.buffer for cell in row)
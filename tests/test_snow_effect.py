@@ -0,0 +1,74 @@
+import numpy as np
+
+from bruhanimate.bruheffect.settings import SnowSettings
+from bruhanimate.bruheffect.snow_effect import STACK_WEIGHT, SnowEffect
+from bruhanimate.bruhutil import FLAKE_WEIGHT_CHARS
+from bruhanimate.bruhutil.bruhffer import Buffer
+
+
+def test_snow_landings_accumulate_and_spill_upwards():
+    effect = SnowEffect(Buffer(5, 4), " ")
+    effect.handle_snowflake_landing(np.full(STACK_WEIGHT + 3, 2), np.full(21, 4))
+    assert effect.ground_flakes[4, 2] == STACK_WEIGHT + 3
+    # Only landings past STACK_WEIGHT spill onto the cell above
+    assert effect.ground_flakes[3, 2] == 3
+    assert effect.can_stack(2, 4) and not effect.can_stack(2, 3)
+
+    effect.handle_snowflake_landing(np.array([1] * 4), np.array([0] * 4))
+    assert effect.ground_flakes.sum() == STACK_WEIGHT + 3 + 3 + 4
+
+
+def test_snow_flakes_fall_land_and_draw_ground_glyphs():
+    effect = SnowEffect(Buffer(12, 30), " ", SnowSettings(intensity=1.0))
+    effect.render_frame(0)
+    assert effect.flake_count == 30
+    assert not effect.flake_y.any()
+
+    for frame in range(1, 120):
+        effect.set_snow_intensity(0.01 if frame > 60 else 1.0)
+        effect.render_frame(frame)
+    assert effect.ground_flakes[-1].sum() > 0
+    assert np.all((effect.flake_y >= 0) & (effect.flake_y < 12))
+
+    bottom = effect.buffer.buffer[-1]
+    weights = np.minimum(effect.ground_flakes[-1], STACK_WEIGHT)
+    occupied = set(zip(effect.flake_y.tolist(), effect.flake_x.tolist()))
+    for x, weight in enumerate(weights.tolist()):
+        if (11, x) not in occupied and weight:
+            char = max((w, c) for w, c in FLAKE_WEIGHT_CHARS.items() if w <= weight)[1]
+            assert bottom[x] == char
+
+
+def test_snow_flakes_stop_on_image_box():
+    effect = SnowEffect(Buffer(20, 20), " ", SnowSettings(intensity=1.0))
+    effect.update_collision(2, 8, 15, 10, True, False)
+    for frame in range(100):
+        effect.render_frame(frame)
+    x, y = effect.flake_x, effect.flake_y
+    inside = (x > 2) & (x < 17) & (y > 8) & (y < 18)
+    assert not inside.any()
+    assert effect.ground_flakes[8, 3:17].sum() > 0
+
+
+def test_snow_settles_on_image_silhouette():
+    effect = SnowEffect(Buffer(20, 20), " ", SnowSettings(intensity=1.0))
+    image = Buffer(20, 20).clear_buffer(val=None)
+    # A roof: two cells wide at the top, widening by one on each side per row
+    for row in range(5):
+        image.put_at(9 - row, 10 + row, "#" * (2 + 2 * row))
+    effect.update_collision(5, 10, 10, 5, True, False, image)
+
+    surface = effect.surface()
+    assert surface[9:11].tolist() == [10, 10]
+    assert surface[5].item() == 14 and surface[0].item() == 20
+
+    mask = effect._image_mask.mask
+    for frame in range(150):
+        effect.render_frame(frame)
+        assert not mask[effect.flake_y, effect.flake_x].any()
+    # Snow rests right above the roof, not on its bounding box
+    assert effect.ground_flakes[9, 9:11].sum() > 0
+    assert effect.ground_flakes[12, 6] > 0
+    # Snow that piles up to STACK_WEIGHT raises the surface
+    assert (effect.surface() <= surface).all()
+    assert (effect.surface() < surface).any()
@@ -0,0 +1,75 @@
+import sys
+
+import pytest
+
+from bruhanimate.bruhrenderer.terminal_renderer import TerminalRenderer
+
+
+class MockScreen:
+    def __init__(self, height=20, width=40):
+        self.height = height
+        self.width = width
+
+    def begin_frame(self):
+        pass
+
+    def flush_frame(self):
+        pass
+
+    def print_at(self, text, x, y, width):
+        pass
+
+    def has_resized(self):
+        return False
+
+
+def test_terminal_renderer_append_output_splits_and_wraps():
+    renderer = TerminalRenderer(MockScreen(10, 6), effect_type="static")
+
+    renderer._append_output("ab\r\ncd")
+    assert list(renderer.terminal_history) == ["ab"]
+    assert renderer.current_line_output == "cd"
+
+    # Width 6 wraps every 5 characters, for both complete and pending lines
+    renderer._append_output("efghijkl\nmnopqrstuv")
+    assert list(renderer.terminal_history) == ["ab", "cdefg", "hijkl", "mnopq", "rstuv"]
+    assert renderer.current_line_output == ""
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="uses a POSIX shell command")
+def test_terminal_renderer_reads_command_output():
+    renderer = TerminalRenderer(MockScreen(10, 40), effect_type="static")
+    renderer.current_input = "printf 'one\\ntwo\\n'"
+    renderer.execute_command()
+    renderer.active_process.wait()
+
+    while renderer._decoders:
+        renderer.update_history_from_queue()
+
+    assert list(renderer.terminal_history)[-2:] == ["one", "two"]
+
+
+def test_terminal_renderer_scrollback_is_bounded():
+    renderer = TerminalRenderer(MockScreen(10, 40), effect_type="static", scrollback=5)
+
+    renderer._append_output("".join(f"line {i}\n" for i in range(100)))
+
+    assert len(renderer.terminal_history) == 5
+    assert renderer.terminal_history[0] == "line 95"
+    assert renderer.terminal_history[-1] == "line 99"
+
+
+def test_terminal_renderer_renders_only_changed_rows():
+    renderer = TerminalRenderer(MockScreen(6, 12), effect_type="static")
+    renderer._append_output("a\nb\nc\nd\n")
+
+    renderer.render_img_frame(0)
+    # max_lines (4) rows starting at y=1, the last one being the prompt
+    assert renderer.image_buffer.grab_slice(0, 1, 3) == [None, "b", None]
+    assert renderer.image_buffer.grab_slice(0, 4, 4) == [None, ">", " ", "_"]
+
+    history_rows = renderer._drawn_rows[1:4]
+    renderer.current_input = "ls"
+    renderer.render_img_frame(1)
+    assert all(a is b for a, b in zip(renderer._drawn_rows[1:4], history_rows))
+    assert "".join(renderer.image_buffer.grab_slice(1, 4, 5)) == "> ls_"
@@ -0,0 +1,52 @@
+from bruhanimate.bruheffect.settings import TwinkleSettings
+from bruhanimate.bruheffect.twinkle_effect import (
+    TWINKLE_PERIOD,
+    TWINKLE_SPEC,
+    TwinkleEffect,
+)
+from bruhanimate.bruhutil.bruhffer import Buffer
+
+
+def test_twinkle_matches_twinkle_spec():
+    effect = TwinkleEffect(
+        Buffer(10, 30), " ", TwinkleSettings(twinkle_chars=[".", "*"], density=0.5)
+    )
+    specs = []
+    for char, phase, direction in zip(
+        effect._chars.tolist(), effect._phase.tolist(), effect._direction.tolist()
+    ):
+        spec = TWINKLE_SPEC(effect.twinkle_chars[char], phase)
+        spec.mode = direction
+        specs.append(spec)
+
+    for frame in range(60):
+        effect.render_frame(frame)
+        for (x, y), spec in zip(effect.specs, specs):
+            assert effect.buffer.get_char(x, y) == str(spec.next())
+    assert (
+        effect.buffer.get_char(
+            *next(
+                (x, y)
+                for x in range(30)
+                for y in range(10)
+                if (x, y) not in effect.specs
+            )
+        )
+        == " "
+    )
+
+
+def test_twinkle_frames_repeat_every_period():
+    effect = TwinkleEffect(Buffer(8, 20), " ", TwinkleSettings(density=0.3))
+    key = effect.frame_key(0)
+    effect.render_frame(0)
+    first = [row[:] for row in effect.buffer.buffer]
+
+    for frame in range(1, TWINKLE_PERIOD):
+        effect.skip_frame(frame)
+    assert effect.frame_key(TWINKLE_PERIOD) == key
+    effect.render_frame(TWINKLE_PERIOD)
+    assert effect.buffer.buffer == first
+
+    effect.set_density(0.6)
+    assert effect.frame_key(TWINKLE_PERIOD + 1)[0] != key[0]
@@ -0,0 +1,38 @@
+import numpy as np
+
+from bruhanimate.bruheffect.settings import VoronoiSettings
+from bruhanimate.bruheffect.voronoi_effect import VoronoiEffect
+from bruhanimate.bruhutil.bruhffer import Buffer
+
+
+def test_voronoi_block_search_matches_brute_force():
+    for num_seeds in (1, 12, 300):
+        effect = VoronoiEffect(
+            Buffer(37, 101), " ", VoronoiSettings(num_seeds=num_seeds)
+        )
+        ys, xs = np.mgrid[0:37, 0:101]
+        expected = effect._nearest_seed(ys.ravel(), xs.ravel()).reshape(37, 101)
+        assert np.array_equal(effect._nearest_seed_grid(), expected)
+
+
+def test_voronoi_draws_seed_glyphs_and_markers_past_127_seeds():
+    effect = VoronoiEffect(
+        Buffer(30, 80),
+        " ",
+        VoronoiSettings(color=False, char="#", num_seeds=200, seed_speed=5.0),
+    )
+    for frame in range(20):
+        effect.render_frame(frame)
+        assert (effect._seeds[:, 0] >= 0).all() and (effect._seeds[:, 0] < 80).all()
+        assert (effect._seeds[:, 1] >= 0).all() and (effect._seeds[:, 1] < 30).all()
+
+    markers = {
+        (x, y)
+        for x, y in zip(
+            effect._seeds[:, 0].astype(int).tolist(),
+            effect._seeds[:, 1].astype(int).tolist(),
+        )
+    }
+    for y, row in enumerate(effect.buffer.buffer):
+        for x, cell in enumerate(row):
+            assert cell == ("*" if (x, y) in markers else "#")